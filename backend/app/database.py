@@ -50,6 +50,8 @@ class DatabaseManager:
 
     def disconnect(self):
         """Disconnect from database."""
+        if self.validator:
+            self.validator.close()
         if self.db:
             self.db.close()
             self.db = None
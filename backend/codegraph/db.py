@@ -1,18 +1,23 @@
 """Neo4j database connection and schema management."""
 
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Iterator, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from neo4j import GraphDatabase, Driver
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Entity labels reported in statistics and node totals
+ENTITY_LABELS = ("Function", "Class", "Variable", "Parameter", "Module", "Type")
+
 
 class CodeGraphDB:
     """Manages Neo4j connection and schema for code graph."""
 
     def __init__(self, uri: str = "bolt://localhost:7687",
                  user: str = "neo4j",
-                 password: str = "password"):
+                 password: str = "password",
+                 max_connection_pool_size: int = 100):
         """
         Initialize Neo4j connection.
 
@@ -20,8 +25,14 @@ class CodeGraphDB:
             uri: Neo4j connection URI
             user: Database username
             password: Database password
-        """
-        self.driver: Driver = GraphDatabase.driver(uri, auth=(user, password))
+            max_connection_pool_size: Most connections the driver keeps open
+                and reuses across sessions
+        """
+        self.driver: Driver = GraphDatabase.driver(
+            uri,
+            auth=(user, password),
+            max_connection_pool_size=max_connection_pool_size
+        )
         logger.info(f"Connected to Neo4j at {uri}")
 
     def close(self):
@@ -53,18 +64,35 @@ class CodeGraphDB:
         Args:
             file_path: Path prefix whose nodes should be deleted
         """
+        return self.delete_nodes_from_files([file_path])
+
+    def delete_nodes_from_files(self, file_paths: List[str]):
+        """
+        Delete all nodes defined under any of several paths.
+
+        The nodes are matched in a single scan and deleted in one
+        transaction, instead of one query per path.
+
+        Args:
+            file_paths: Path prefixes whose nodes should be deleted
+
+        Returns:
+            Number of nodes deleted
+        """
+        if not file_paths:
+            return 0
+
         with self.driver.session() as session:
-            # Delete nodes where location starts with the file_path
-            # This handles both nodes with location property and relationship locations
+            # Delete nodes where location starts with one of the paths
             query = """
             MATCH (n)
-            WHERE n.location STARTS WITH $file_path
+            WHERE any(path IN $file_paths WHERE n.location STARTS WITH path)
             DETACH DELETE n
             """
-            result = session.run(query, {"file_path": file_path})
+            result = session.run(query, {"file_paths": list(file_paths)})
             summary = result.consume()
             deleted_count = summary.counters.nodes_deleted
-            logger.info(f"Deleted {deleted_count} nodes from {file_path}")
+            logger.info(f"Deleted {deleted_count} nodes from {', '.join(file_paths)}")
             return deleted_count
 
     def initialize_schema(self):
@@ -120,6 +148,50 @@ class CodeGraphDB:
             result = session.run(query, parameters or {})
             return [dict(record) for record in result]
 
+    def execute_query_stream(self, query: str, parameters: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Execute a Cypher query and yield result records as they arrive.
+
+        Records are read lazily from the session, so callers process the
+        first rows while the rest are still being fetched and never hold
+        the full result in memory. The session stays open until the
+        iterator is exhausted or closed.
+
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+
+        Yields:
+            Result records as dictionaries
+        """
+        with self.driver.session() as session:
+            result = session.run(query, parameters or {})
+            for record in result:
+                yield dict(record)
+
+    def execute_queries(self, queries: List[Tuple[str, Optional[Dict[str, Any]]]]) -> List[List[Dict[str, Any]]]:
+        """
+        Execute independent read queries concurrently.
+
+        Each query runs in its own session on the shared driver, so the
+        round-trips overlap instead of being paid one after another.
+
+        Args:
+            queries: List of (query, parameters) pairs
+
+        Returns:
+            Result records for each query, in the same order as given
+        """
+        if len(queries) <= 1:
+            return [self.execute_query(query, parameters) for query, parameters in queries]
+
+        with ThreadPoolExecutor(max_workers=len(queries)) as executor:
+            futures = [
+                executor.submit(self.execute_query, query, parameters)
+                for query, parameters in queries
+            ]
+            return [future.result() for future in futures]
+
     def create_node(self, label: str, properties: Dict[str, Any]) -> str:
         """
         Create a node with given label and properties.
@@ -432,7 +504,7 @@ class CodeGraphDB:
         stats = {}
 
         # Count nodes by label
-        for label in ["Function", "Class", "Variable", "Parameter", "Module", "Type"]:
+        for label in ENTITY_LABELS:
             query = f"MATCH (n:{label}) RETURN count(n) as count"
             with self.driver.session() as session:
                 result = session.run(query)
@@ -446,6 +518,30 @@ class CodeGraphDB:
 
         return stats
 
+    def get_counts(self) -> Tuple[int, int]:
+        """
+        Get entity and relationship totals in a single round trip.
+
+        Each label is counted in its own subquery so Neo4j can answer from
+        its count store instead of scanning nodes.
+
+        Returns:
+            Tuple of (entity node count, relationship count)
+        """
+        subqueries = "\n".join(
+            f"CALL {{ MATCH (n:{label}) RETURN count(n) as {label.lower()}_count }}"
+            for label in ENTITY_LABELS
+        )
+        node_sum = " + ".join(f"{label.lower()}_count" for label in ENTITY_LABELS)
+        query = f"""
+        {subqueries}
+        CALL {{ MATCH ()-[r]->() RETURN count(r) as relationship_count }}
+        RETURN {node_sum} as node_count, relationship_count
+        """
+        with self.driver.session() as session:
+            record = session.run(query).single()
+            return record["node_count"], record["relationship_count"]
+
     # ========== Incremental Validation Support ==========
 
     def mark_nodes_changed(self, node_ids: List[str]):
@@ -77,6 +77,7 @@ import os
 import sys
 import logging
 import json
+from collections import Counter
 from typing import Dict, Any
 
 # Add parent directory to path for imports
@@ -697,9 +698,9 @@ async def validate_codebase(arguments: Dict[str, Any]) -> list[TextContent]:
     """Validate conservation laws."""
     violations = validator.validate_all()
 
-    # Group violations by severity
-    errors = [v for v in violations if v.severity == "error"]
-    warnings = [v for v in violations if v.severity == "warning"]
+    # Count violations by severity
+    severity_counts = Counter(v.severity for v in violations)
+    errors = severity_counts["error"]
 
     # Convert to dict for JSON serialization
     violations_dict = [
@@ -722,9 +723,9 @@ async def validate_codebase(arguments: Dict[str, Any]) -> list[TextContent]:
 
     result = {
         "total_violations": len(violations),
-        "errors": len(errors),
-        "warnings": len(warnings),
-        "safe_to_commit": len(errors) == 0,
+        "errors": errors,
+        "warnings": severity_counts["warning"],
+        "safe_to_commit": errors == 0,
         "violations": violations_dict
     }
 
@@ -741,8 +742,13 @@ async def get_graph_stats(arguments: Dict[str, Any]) -> list[TextContent]:
 async def main():
     """Run the MCP server."""
     logger.info("Starting CodeGraph MCP Server (read-only analysis mode)")
-    async with stdio_server() as (read_stream, write_stream):
-        await app.run(read_stream, write_stream, app.create_initialization_options())
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await app.run(read_stream, write_stream, app.create_initialization_options())
+    finally:
+        workflow_orchestrator.close()
+        validator.close()
+        db.close()
 
 
 if __name__ == "__main__":
@@ -9,6 +9,24 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Read-only lookup shared by every parse; never mutated.
+BUILTIN_TYPES: Dict[str, str] = {
+    "str": "builtin",
+    "int": "builtin",
+    "float": "builtin",
+    "bool": "builtin",
+    "list": "builtin",
+    "dict": "builtin",
+    "set": "builtin",
+    "tuple": "builtin",
+    "bytes": "builtin",
+    "bytearray": "builtin",
+    "complex": "builtin",
+    "range": "builtin",
+    "None": "builtin",
+    "NoneType": "builtin",
+}
+
 
 @dataclass
 class Entity:
@@ -1168,23 +1186,8 @@ class PythonParser:
                 ))
 
     def _initialize_builtin_types(self):
-        """Reset builtin type cache for each parse."""
-        self.builtin_types = {
-            "str": "builtin",
-            "int": "builtin",
-            "float": "builtin",
-            "bool": "builtin",
-            "list": "builtin",
-            "dict": "builtin",
-            "set": "builtin",
-            "tuple": "builtin",
-            "bytes": "builtin",
-            "bytearray": "builtin",
-            "complex": "builtin",
-            "range": "builtin",
-            "None": "builtin",
-            "NoneType": "builtin",
-        }
+        """Point the builtin type lookup at the shared module table."""
+        self.builtin_types = BUILTIN_TYPES
 
     def _get_or_create_type(self, type_str: str, context_module: str = "builtins") -> str:
         """
@@ -0,0 +1,330 @@
+"""Persistent pyright language server client for incremental type checking."""
+
+from typing import List, Dict, Any, Optional
+from pathlib import Path
+import logging
+import subprocess
+import threading
+import shutil
+import json
+import time
+import os
+
+logger = logging.getLogger(__name__)
+
+# LSP FileChangeType values for workspace/didChangeWatchedFiles
+FILE_CHANGED = 2
+FILE_DELETED = 3
+
+# LSP DiagnosticSeverity -> pyright --outputjson severity names
+LSP_SEVERITIES = {
+    1: "error",
+    2: "warning",
+    3: "information",
+    4: "hint",
+}
+
+
+class PyrightLanguageServer:
+    """
+    Keeps a ``pyright-langserver --stdio`` process alive between runs.
+
+    Files are opened once and afterwards only re-sent when their contents
+    change, so repeated checks skip pyright's cold start and re-analysis of
+    unchanged files. Diagnostics are pulled per file with
+    ``textDocument/diagnostic``, so a file whose text is unchanged still
+    reflects edits to its dependencies. They are returned in the same shape
+    as the ``generalDiagnostics`` entries of ``pyright --outputjson``.
+    """
+
+    def __init__(self, command: Optional[List[str]] = None, root_path: Optional[str] = None):
+        """
+        Initialize the client. The server process is started on first use.
+
+        Args:
+            command: Command that launches the language server over stdio
+            root_path: Workspace root used for pyright configuration lookup
+        """
+        self.command = command or ["pyright-langserver", "--stdio"]
+        self.root_path = os.path.abspath(root_path or os.getcwd())
+
+        self._proc: Optional[subprocess.Popen] = None
+        self._reader: Optional[threading.Thread] = None
+        self._write_lock = threading.Lock()
+        self._condition = threading.Condition()
+        self._next_id = 0
+        self._responses: Dict[int, Dict[str, Any]] = {}
+        # path -> {"version": int, "text": str} for documents opened on the server
+        self._documents: Dict[str, Dict[str, Any]] = {}
+
+    @staticmethod
+    def is_available() -> bool:
+        """Return True if pyright-langserver is on PATH."""
+        return shutil.which("pyright-langserver") is not None
+
+    @property
+    def running(self) -> bool:
+        """Whether the server process is alive."""
+        return self._proc is not None and self._proc.poll() is None
+
+    def start(self, timeout: float = 30.0):
+        """
+        Launch the server and complete the LSP initialize handshake.
+
+        Args:
+            timeout: Seconds to wait for the initialize response
+        """
+        # A previous server may have died without close(); the new one has
+        # no open documents, so every file must be opened again
+        self._documents.clear()
+        with self._condition:
+            self._responses.clear()
+
+        self._proc = subprocess.Popen(
+            self.command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL
+        )
+        self._reader = threading.Thread(target=self._read_loop, daemon=True)
+        self._reader.start()
+
+        root_uri = Path(self.root_path).as_uri()
+        self._request("initialize", {
+            "processId": os.getpid(),
+            "rootUri": root_uri,
+            "workspaceFolders": [{"uri": root_uri, "name": os.path.basename(self.root_path)}],
+            "capabilities": {
+                "textDocument": {"diagnostic": {"dynamicRegistration": False}},
+                "workspace": {"didChangeWatchedFiles": {"dynamicRegistration": False}}
+            }
+        }, timeout=timeout)
+        self._notify("initialized", {})
+        logger.info(f"Started pyright language server for {self.root_path}")
+
+    def close(self):
+        """Shut the server down, killing it if it does not exit promptly."""
+        if self._proc is None:
+            return
+
+        if self.running:
+            try:
+                self._request("shutdown", None, timeout=5.0)
+                self._notify("exit", None)
+                self._proc.wait(timeout=5.0)
+            except Exception:
+                self._proc.kill()
+                self._proc.wait()
+
+        self._proc = None
+        self._documents.clear()
+        logger.info("Stopped pyright language server")
+
+    def check_files(self, files: List[str], timeout: float = 120.0) -> List[Dict[str, Any]]:
+        """
+        Type check files, sending only those whose contents changed.
+
+        Args:
+            files: Paths of Python files to check
+            timeout: Seconds to wait for diagnostics
+
+        Returns:
+            Diagnostics in pyright --outputjson format
+
+        Raises:
+            TimeoutError: If diagnostics do not arrive in time
+        """
+        if not self.running:
+            self.start()
+
+        requested: Dict[str, str] = {}
+        for file_path in files:
+            path = os.path.abspath(file_path)
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    requested[path] = f.read()
+            except (FileNotFoundError, IOError) as e:
+                logger.warning(f"Could not read file {path}: {e}")
+
+        self._sync_disk_changes(requested)
+
+        for path, text in requested.items():
+            uri = Path(path).as_uri()
+            document = self._documents.get(path)
+
+            if document is None:
+                version = 1
+                self._notify("textDocument/didOpen", {
+                    "textDocument": {"uri": uri, "languageId": "python", "version": version, "text": text}
+                })
+            elif document["text"] != text:
+                version = document["version"] + 1
+                self._notify("textDocument/didChange", {
+                    "textDocument": {"uri": uri, "version": version},
+                    "contentChanges": [{"text": text}]
+                })
+            else:
+                continue
+
+            self._documents[path] = {"version": version, "text": text}
+
+        # Send every pull before waiting so pyright can answer them together
+        deadline = time.monotonic() + timeout
+        pending = [
+            (path, self._send_request("textDocument/diagnostic", {"textDocument": {"uri": Path(path).as_uri()}}))
+            for path in requested
+        ]
+
+        diagnostics = []
+        for path, request_id in pending:
+            report = self._wait_for_response(request_id, "textDocument/diagnostic", deadline, timeout)
+            diagnostics.extend(
+                self._to_pyright_diagnostic(path, item)
+                for item in (report or {}).get("items", [])
+            )
+        return diagnostics
+
+    def _sync_disk_changes(self, requested: Dict[str, str]):
+        """
+        Tell the server about files that changed on disk outside the editor.
+
+        Open documents the caller did not request this time are closed if
+        their file changed or disappeared, so pyright reads them from disk
+        again. Those files, and requested files not yet open, are reported
+        through ``workspace/didChangeWatchedFiles`` so any cached disk copy
+        pyright loaded as a dependency is discarded.
+
+        Args:
+            requested: Current text of the files about to be checked, by path
+        """
+        changes = [
+            {"uri": Path(path).as_uri(), "type": FILE_CHANGED}
+            for path in requested
+            if path not in self._documents
+        ]
+
+        for path, document in list(self._documents.items()):
+            if path in requested:
+                continue
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    text = f.read()
+            except (FileNotFoundError, IOError):
+                text = None
+            if text == document["text"]:
+                continue
+
+            uri = Path(path).as_uri()
+            self._notify("textDocument/didClose", {"textDocument": {"uri": uri}})
+            del self._documents[path]
+            changes.append({"uri": uri, "type": FILE_CHANGED if text is not None else FILE_DELETED})
+
+        if changes:
+            self._notify("workspace/didChangeWatchedFiles", {"changes": changes})
+
+    # ========== JSON-RPC Transport ==========
+
+    def _send(self, message: Dict[str, Any]):
+        """Write a JSON-RPC message with its Content-Length header."""
+        body = json.dumps(message).encode("utf-8")
+        with self._write_lock:
+            self._proc.stdin.write(f"Content-Length: {len(body)}\r\n\r\n".encode("ascii") + body)
+            self._proc.stdin.flush()
+
+    def _notify(self, method: str, params: Any):
+        """Send a notification."""
+        self._send({"jsonrpc": "2.0", "method": method, "params": params})
+
+    def _request(self, method: str, params: Any, timeout: float) -> Any:
+        """Send a request and wait for its response."""
+        request_id = self._send_request(method, params)
+        return self._wait_for_response(request_id, method, time.monotonic() + timeout, timeout)
+
+    def _send_request(self, method: str, params: Any) -> int:
+        """Send a request without waiting and return its id."""
+        with self._condition:
+            self._next_id += 1
+            request_id = self._next_id
+
+        self._send({"jsonrpc": "2.0", "id": request_id, "method": method, "params": params})
+        return request_id
+
+    def _wait_for_response(self, request_id: int, method: str, deadline: float, timeout: float) -> Any:
+        """Wait until deadline for the response to request_id and return its result."""
+        with self._condition:
+            while request_id not in self._responses:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"No response to {method} within {timeout} seconds")
+                if not self.running:
+                    raise RuntimeError("pyright language server exited unexpectedly")
+                self._condition.wait(remaining)
+            response = self._responses.pop(request_id)
+
+        if "error" in response:
+            raise RuntimeError(f"{method} failed: {response['error'].get('message')}")
+        return response.get("result")
+
+    def _read_message(self, stream) -> Optional[Dict[str, Any]]:
+        """Read one framed message, or return None at end of stream."""
+        content_length = None
+        while True:
+            line = stream.readline()
+            if not line:
+                return None
+            line = line.strip()
+            if not line:
+                break
+            name, _, value = line.decode("ascii").partition(":")
+            if name.lower() == "content-length":
+                content_length = int(value.strip())
+
+        if content_length is None:
+            return None
+        return json.loads(stream.read(content_length))
+
+    def _read_loop(self):
+        """Dispatch messages from the server until its stdout closes."""
+        stream = self._proc.stdout
+        while True:
+            try:
+                message = self._read_message(stream)
+            except (ValueError, OSError) as e:
+                logger.warning(f"Failed to read from pyright language server: {e}")
+                break
+            if message is None:
+                break
+            self._dispatch(message)
+
+        with self._condition:
+            self._condition.notify_all()
+
+    def _dispatch(self, message: Dict[str, Any]):
+        """Route a server message to waiting requests or answer server requests."""
+        method = message.get("method")
+
+        if method is None:
+            # Response to one of our requests
+            with self._condition:
+                self._responses[message.get("id")] = message
+                self._condition.notify_all()
+        elif "id" in message:
+            # Server-to-client request; answer so the server does not block
+            result = None
+            if method == "workspace/configuration":
+                result = [{} for _ in message.get("params", {}).get("items", [])]
+            self._send({"jsonrpc": "2.0", "id": message["id"], "result": result})
+
+    # ========== Diagnostics ==========
+
+    def _to_pyright_diagnostic(self, file_path: str, item: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert an LSP diagnostic to pyright's --outputjson format."""
+        diagnostic = {
+            "file": file_path,
+            "severity": LSP_SEVERITIES.get(item.get("severity", 1), "error"),
+            "message": item.get("message", ""),
+            "range": item.get("range", {})
+        }
+        if item.get("code") is not None:
+            diagnostic["rule"] = str(item["code"])
+        return diagnostic
@@ -1,12 +1,112 @@
 """Query interface for code graph with conservation law support."""
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Callable, Iterable, Optional, Set, Tuple
+from collections import deque
 from .db import CodeGraphDB
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+def find_cycles(
+    edges: Iterable[Tuple[str, str]],
+    include: Optional[Callable[[str], bool]] = None
+) -> List[List[str]]:
+    """
+    Find one cycle per strongly connected component of a directed graph.
+
+    Components are found with an iterative Tarjan pass, O(V + E), rather
+    than by enumerating variable-length paths in Cypher.
+
+    Args:
+        edges: (source, target) node keys
+        include: Optional predicate; only components containing a node it
+            accepts are reported, and the cycle starts at that node
+
+    Returns:
+        List of cycles, each starting and ending at the same node
+    """
+    adjacency: Dict[str, List[str]] = {}
+    for source, target in edges:
+        adjacency.setdefault(source, []).append(target)
+        adjacency.setdefault(target, [])
+
+    index: Dict[str, int] = {}
+    lowlink: Dict[str, int] = {}
+    stack: List[str] = []
+    on_stack: Set[str] = set()
+    components: List[Set[str]] = []
+
+    for root in adjacency:
+        if root in index:
+            continue
+        index[root] = lowlink[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(adjacency[root]))]
+
+        while work:
+            node, successors = work[-1]
+            for successor in successors:
+                if successor not in index:
+                    index[successor] = lowlink[successor] = len(index)
+                    stack.append(successor)
+                    on_stack.add(successor)
+                    work.append((successor, iter(adjacency[successor])))
+                    break
+                if successor in on_stack:
+                    lowlink[node] = min(lowlink[node], index[successor])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    component = set()
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.add(member)
+                        if member == node:
+                            break
+                    components.append(component)
+
+    cycles = []
+    for component in components:
+        # Start from the earliest node by edge order, for stable output
+        candidates = sorted(component, key=index.__getitem__)
+        if include is not None:
+            candidates = [node for node in candidates if include(node)]
+        if not candidates:
+            continue
+        start = candidates[0]
+        if len(component) == 1 and start not in adjacency[start]:
+            continue
+        cycles.append(_shortest_cycle(adjacency, start, component))
+
+    return cycles
+
+
+def _shortest_cycle(adjacency: Dict[str, List[str]], start: str, component: Set[str]) -> List[str]:
+    """Breadth-first search for the shortest cycle through start within its component."""
+    parents: Dict[str, Optional[str]] = {start: None}
+    queue = deque([start])
+    while queue:
+        node = queue.popleft()
+        for successor in adjacency[node]:
+            if successor == start:
+                path = [node]
+                while parents[path[-1]] is not None:
+                    path.append(parents[path[-1]])
+                path.reverse()
+                path.append(start)
+                return path
+            if successor in component and successor not in parents:
+                parents[successor] = node
+                queue.append(successor)
+    return [start]
+
+
 class QueryInterface:
     """High-level query interface for the code graph."""
 
@@ -274,13 +374,14 @@ class QueryInterface:
         Returns:
             List of cycles (each cycle is a list of class IDs)
         """
+        # Fetch the edges once and find cycles in Python; a variable-length
+        # path match enumerates every path and blows up on dense hierarchies
         query = """
-        MATCH path = (c:Class)-[:INHERITS*]->(c)
-        RETURN [node in nodes(path) | node.qualified_name] as cycle
-        LIMIT 100
+        MATCH (c:Class)-[:INHERITS]->(base:Class)
+        RETURN c.qualified_name as source, base.qualified_name as target
         """
         results = self.db.execute_query(query)
-        return [r["cycle"] for r in results]
+        return find_cycles((r["source"], r["target"]) for r in results)
 
     def find_diamond_inheritance(self) -> List[Dict[str, Any]]:
         """
@@ -179,6 +179,21 @@ class SnapshotManager:
 
         return snapshots
 
+    def get_latest_snapshot_id(self) -> Optional[str]:
+        """
+        Get the ID of the most recently created snapshot.
+
+        Compares stored timestamps only, without building GraphSnapshot
+        objects or scanning the storage directory.
+
+        Returns:
+            Snapshot ID or None if there are no snapshots
+        """
+        if not self._snapshots:
+            return None
+        # ISO 8601 timestamps order correctly as strings
+        return max(self._snapshots, key=lambda sid: self._snapshots[sid]["timestamp"])
+
     def delete_snapshot(self, snapshot_id: str) -> bool:
         """
         Delete a snapshot.
@@ -1,11 +1,16 @@
 """Conservation law validators for code graph integrity."""
 
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Set, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from .db import CodeGraphDB
-from .query import QueryInterface
+from .query import QueryInterface, find_cycles
+from .pyright_lsp import PyrightLanguageServer
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 import logging
+import sys
 import subprocess
 import json
 import os
@@ -21,6 +26,20 @@ class ViolationType(Enum):
     STRUCTURAL_INVALID = "structural_invalid"
 
 
+# Report summary keys paired with the violation type each one counts
+_SUMMARY_KEYS = (
+    ("signature_conservation", ViolationType.SIGNATURE_MISMATCH.value),
+    ("reference_integrity", ViolationType.REFERENCE_BROKEN.value),
+    ("data_flow_consistency", ViolationType.DATA_FLOW_INVALID.value),
+    ("structural_integrity", ViolationType.STRUCTURAL_INVALID.value),
+)
+
+
+def _intern(value: Any) -> Any:
+    """Intern strings read from query results; other values pass through."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
 @dataclass
 class Violation:
     """Represents a conservation law violation with detailed location info."""
@@ -41,6 +60,72 @@ class Violation:
     code_snippet: Optional[str] = None  # The actual code at the location
 
 
+@dataclass
+class ChangedFrontier:
+    """Changed nodes and their immediate neighbours, fetched once per incremental run."""
+    # Changed functions, plus functions owning a changed parameter or called
+    # from a changed call site
+    functions: Dict[str, Any] = field(default_factory=dict)
+    # Function id -> [{"param", "position", "type"}] ordered by position
+    params_by_func: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict)
+    # Function id -> (required, total) argument counts callers must satisfy
+    arity_by_func: Dict[str, Tuple[int, int]] = field(default_factory=dict)
+    # Function id -> [{"callsite", "caller_qualified_name"}] for calls to a
+    # changed function whose argument count is out of range
+    arity_mismatches_by_func: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict)
+    # Function id -> call sites with argument types to check against its
+    # annotated parameters (the call site or the function changed)
+    typed_callsites_by_func: Dict[str, List[Any]] = field(default_factory=dict)
+    # Changed call sites with their number of RESOLVES_TO targets
+    callsites: List[Tuple[Any, int]] = field(default_factory=list)
+    # Changed parameters with their number of owning functions
+    parameters: List[Tuple[Any, int]] = field(default_factory=list)
+    # Annotated variables assigned in changed functions or themselves changed,
+    # as (function, variable, resolved type or None)
+    assignments: List[Tuple[Any, Any, Any]] = field(default_factory=list)
+    # Inheritance cycles through changed classes, as qualified names
+    inheritance_cycles: List[List[str]] = field(default_factory=list)
+    # Subtype cycles through changed types, as (type id, type names)
+    subtype_cycles: List[Tuple[str, List[str]]] = field(default_factory=list)
+
+    def is_empty(self) -> bool:
+        """Whether the change set touches nothing the incremental checks inspect."""
+        return not (self.functions or self.callsites or self.parameters
+                    or self.assignments or self.inheritance_cycles or self.subtype_cycles)
+
+
+class ViolationBuffer:
+    """
+    Accumulates violations with their severity and type kept in parallel columns.
+
+    Report counts are taken from the flat string columns instead of walking
+    the Violation objects again.
+    """
+
+    def __init__(self):
+        self.violations: List[Violation] = []
+        self.severities: List[str] = []
+        self.types: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self.violations)
+
+    def append(self, violation: Violation):
+        """Add one violation."""
+        self.violations.append(violation)
+        self.severities.append(violation.severity)
+        self.types.append(violation.violation_type.value)
+
+    def extend(self, violations: List[Violation]):
+        """Add several violations."""
+        for violation in violations:
+            self.append(violation)
+
+    def to_violations(self) -> List[Violation]:
+        """Return the accumulated violations in insertion order."""
+        return self.violations
+
+
 class ConservationValidator:
     """Validates the 4 conservation laws in the code graph."""
 
@@ -62,16 +147,260 @@ class ConservationValidator:
         'dataclass',  # May add __init__ with different signature
     }
 
-    def __init__(self, db: CodeGraphDB):
+    # (actual, expected) type pairs that are always compatible:
+    # bool <: int <: float, and str/bytes are interchangeable sequences
+    COMPATIBLE_TYPE_PAIRS = frozenset({
+        ("bool", "int"),
+        ("bool", "float"),
+        ("int", "float"),
+        ("str", "str"),
+        ("str", "bytes"),
+        ("str", "Sequence"),
+        ("bytes", "str"),
+        ("bytes", "bytes"),
+        ("bytes", "Sequence"),
+    })
+
+    # (actual, expected) prefixes of compatible generic containers
+    COMPATIBLE_TYPE_PREFIXES = (
+        ("List", "Sequence"),
+        ("Dict", "Mapping"),
+    )
+
+    # Valid edge type mappings: edge_type -> (allowed_from_labels, allowed_to_labels)
+    EDGE_SCHEMA = {
+        "DECLARES": (["Module", "Class"], ["Class", "Function", "Variable"]),
+        "HAS_PARAMETER": (["Function"], ["Parameter"]),
+        "HAS_CALLSITE": (["Function"], ["CallSite"]),
+        "INHERITS": (["Class"], ["Class"]),
+        "IMPORTS": (["Module"], ["Module"]),
+        "RETURNS_TYPE": (["Function"], ["Type"]),
+        "HAS_TYPE": (["Parameter", "Variable"], ["Type"]),
+        "RESOLVES_TO": (["CallSite"], ["Function"]),
+        "ASSIGNS_TO": (["Function"], ["Variable"]),
+        "READS_FROM": (["Function"], ["Variable"]),
+        "ASSIGNED_TYPE": (["Variable"], ["Type"]),
+        "IS_SUBTYPE_OF": (["Type"], ["Type"]),
+        "HAS_DECORATOR": (["Function", "Class"], ["Decorator"]),
+        "DECORATES": (["Decorator"], ["Function", "Class"]),
+        "REFERENCES": (["Function", "Class", "Decorator"], ["Variable", "Function", "Class", "Decorator", "Type"]),
+        "UNRESOLVED_REFERENCE": (["Function", "Class", "Module"], ["Unresolved"]),
+    }
+
+    # EDGE_SCHEMA in the map form passed to _EDGE_TYPE_QUERY as $schema
+    _EDGE_SCHEMA_PARAM = {
+        edge_type: {"allowed_from": valid_from, "allowed_to": valid_to}
+        for edge_type, (valid_from, valid_to) in EDGE_SCHEMA.items()
+    }
+
+    # Checks every edge type in one round-trip. Each UNION branch matches
+    # a single relationship type, so it uses the type's own scan and stops
+    # after $limit offending edges; the label rules come from $schema
+    _EDGE_TYPE_QUERY = """
+    CALL {
+    """ + "\n    UNION ALL\n".join(
+        f"""
+        MATCH (a)-[:{edge_type}]->(b)
+        WHERE NOT any(l IN labels(a) WHERE l IN $schema.{edge_type}.allowed_from)
+           OR NOT any(l IN labels(b) WHERE l IN $schema.{edge_type}.allowed_to)
+        RETURN '{edge_type}' as edge_type, a, b, labels(a) as from_labels, labels(b) as to_labels
+        LIMIT $limit
+        """
+        for edge_type in EDGE_SCHEMA
+    ) + """
+    }
+    RETURN edge_type, a, b, from_labels, to_labels
+    LIMIT $total_limit
+    """
+
+    # IS_SUBTYPE_OF reachability (up to 5 hops) for every Type name, loaded
+    # once per data flow pass in place of a subtype probe per type pair
+    _SUBTYPE_CLOSURE_QUERY = """
+    MATCH (a:Type)-[:IS_SUBTYPE_OF*0..5]->(e:Type)
+    WITH a.name as name, e.name as ancestor
+    RETURN name, collect(DISTINCT ancestor) as ancestors
+    """
+
+    # Same closure restricted to the given subtype names
+    _SUBTYPE_CLOSURE_FOR_NAMES_QUERY = """
+    MATCH (a:Type)
+    WHERE a.name IN $names
+    MATCH (a)-[:IS_SUBTYPE_OF*0..5]->(e:Type)
+    WITH a.name as name, e.name as ancestor
+    RETURN name, collect(DISTINCT ancestor) as ancestors
+    """
+
+    # Fills a ChangedFrontier in one round-trip: each UNION branch scans one
+    # part of the change set and tags its rows with the table they belong to.
+    # Nodes are projected to the properties the incremental checks read.
+    _CHANGED_FRONTIER_QUERY = """
+    MATCH (f:Function)
+    WHERE f.changed = true
+       OR EXISTS { MATCH (f)-[:HAS_PARAMETER]->(cp:Parameter) WHERE cp.changed = true }
+       OR EXISTS { MATCH (ccs:CallSite)-[:RESOLVES_TO]->(f) WHERE ccs.changed = true }
+    OPTIONAL MATCH (f)-[r:HAS_PARAMETER]->(p:Parameter)
+    OPTIONAL MATCH (p)-[:HAS_TYPE]->(pt:Type)
+    WITH f, p, r, pt
+    ORDER BY r.position
+    WITH f, collect(CASE WHEN p IS NULL THEN NULL ELSE {
+                             param: p {.id, .name, .position, .type_annotation, .default_value, .changed},
+                             position: r.position,
+                             type: pt {.name}
+                         } END) as params
+    WITH f, params,
+         coalesce(f.is_classmethod, false) OR coalesce(f.is_staticmethod, false)
+             OR coalesce(f.is_property, false) as is_special
+    // Callers never pass self (or cls for class-level methods)
+    WITH f, params,
+         CASE WHEN size(params) > 0
+                   AND ((is_special AND params[0].param.name IN ['self', 'cls'])
+                        OR (NOT is_special AND params[0].param.name = 'self'))
+              THEN tail(params) ELSE params END as passed_params
+    WITH f, params, size(passed_params) as total_params,
+         size([x IN passed_params
+               WHERE x.param.default_value IS NULL OR x.param.default_value = '']) as required_params
+    OPTIONAL MATCH (cs:CallSite)-[:RESOLVES_TO]->(f)
+    OPTIONAL MATCH (caller:Function)-[:HAS_CALLSITE]->(cs)
+    WITH f, params, required_params, total_params,
+         collect(CASE WHEN f.changed = true AND caller IS NOT NULL AND cs.arg_count IS NOT NULL
+                           AND (cs.arg_count < required_params OR cs.arg_count > total_params)
+                      THEN {callsite: cs {.id, .arg_count, .location},
+                            caller_qualified_name: caller.qualified_name} END) as arity_mismatches,
+         collect(DISTINCT CASE WHEN size(coalesce(cs.arg_types, [])) > 0
+                                    AND (f.changed = true OR cs.changed = true)
+                                    AND any(x IN params WHERE x.param.type_annotation IS NOT NULL)
+                               THEN cs {.id, .name, .location, .arg_types} END) as typed_callsites
+    RETURN 'function' as kind, {
+        f: f {.id, .name, .qualified_name, .location, .return_type, .changed},
+        params: params, required_params: required_params, total_params: total_params,
+        arity_mismatches: arity_mismatches, typed_callsites: typed_callsites
+    } as row
+
+    UNION ALL
+
+    MATCH (cs:CallSite)
+    WHERE cs.changed = true
+    OPTIONAL MATCH (cs)-[:RESOLVES_TO]->(f:Function)
+    WITH cs, count(f) as target_count
+    RETURN 'callsite' as kind, {
+        cs: cs {.id, .name, .location, .resolution_status, .unresolved_callee},
+        target_count: target_count
+    } as row
+
+    UNION ALL
+
+    MATCH (p:Parameter)
+    WHERE p.changed = true
+    OPTIONAL MATCH (f:Function)-[:HAS_PARAMETER]->(p)
+    WITH p, count(f) as func_count
+    RETURN 'parameter' as kind, {p: p {.id, .name}, func_count: func_count} as row
+
+    UNION ALL
+
+    MATCH (f:Function)-[:ASSIGNS_TO]->(v:Variable)
+    WHERE (f.changed = true OR v.changed = true)
+      AND v.type_annotation IS NOT NULL
+    OPTIONAL MATCH (v)-[:HAS_TYPE]->(vt:Type)
+    RETURN 'assignment' as kind, {
+        f: f {.qualified_name},
+        v: v {.id, .name, .type_annotation},
+        vt: vt {.name}
+    } as row
+
+    UNION ALL
+
+    // Edges reachable from changed classes and types; any cycle through a
+    // changed node lies within them and is found in Python
+    MATCH (c:Class)
+    WHERE c.changed = true
+    MATCH (c)-[:INHERITS*0..]->(a:Class)
+    WITH DISTINCT a
+    MATCH (a)-[:INHERITS]->(b:Class)
+    RETURN 'inheritance_edge' as kind, {
+        source: a {.id, .qualified_name, .changed},
+        target: b {.id, .qualified_name, .changed}
+    } as row
+
+    UNION ALL
+
+    MATCH (t:Type)
+    WHERE t.changed = true
+    MATCH (t)-[:IS_SUBTYPE_OF*0..]->(a:Type)
+    WITH DISTINCT a
+    MATCH (a)-[:IS_SUBTYPE_OF]->(b:Type)
+    RETURN 'subtype_edge' as kind, {
+        source: a {.id, .name, .changed},
+        target: b {.id, .name, .changed}
+    } as row
+    """
+
+    # Number of driving nodes fetched per round-trip by paged diagnostic queries
+    QUERY_PAGE_SIZE = 10000
+
+    def __init__(self, db: CodeGraphDB, max_violations_per_kind: int = 100,
+                 max_total_violations: Optional[int] = None):
         """
         Initialize validator.
 
         Args:
             db: CodeGraphDB instance
+            max_violations_per_kind: Maximum invalid edges reported per edge type
+            max_total_violations: Optional cap on invalid edges reported across
+                all edge types
         """
         self.db = db
+        self.max_violations_per_kind = max_violations_per_kind
+        self.max_total_violations = max_total_violations
         self.query = QueryInterface(db)
         self._last_report: Optional[Dict[str, Any]] = None
+        # Memoized type-compatibility answers and IS_SUBTYPE_OF reachability,
+        # reset at the start of each data flow pass
+        self._compat_cache: Dict[Tuple[str, str], bool] = {}
+        self._subtype_closure: Optional[Dict[str, Set[str]]] = None
+        self._fn_return_view: Optional[Dict[str, Dict[str, Any]]] = None
+        # Changed subgraph shared by the checks of a running incremental pass
+        self._changed_frontier: Optional[ChangedFrontier] = None
+        # Source lines and parsed locations, kept only for one incremental pass
+        # so each file is read and each location string parsed once
+        self._source_line_cache: Optional[Dict[str, Optional[List[str]]]] = None
+        self._location_cache: Optional[Dict[str, Dict[str, Optional[Any]]]] = None
+        # Started lazily by pyright checks and kept alive across runs
+        self._pyright_server: Optional[PyrightLanguageServer] = None
+
+    def _execute_paged(self, label: str, query: str,
+                       parameters: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Run a per-node query in pages so large graphs are never fetched at once.
+
+        The query must page its driving nodes with ``SKIP $skip LIMIT $limit``;
+        the number of pages is derived from the node count for ``label``.
+
+        Args:
+            label: Label of the nodes the query is driven by
+            query: Cypher query using $skip and $limit
+            parameters: Additional query parameters
+
+        Yields:
+            Result records, one page at a time
+        """
+        count_results = self.db.execute_query(f"MATCH (n:{label}) RETURN count(n) as count")
+        total = count_results[0]["count"] if count_results else 0
+
+        for skip in range(0, total, self.QUERY_PAGE_SIZE):
+            page_params = {**(parameters or {}), "skip": skip, "limit": self.QUERY_PAGE_SIZE}
+            yield from self.db.execute_query_stream(query, page_params)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _expected_args_message(required_params: int, total_params: int) -> str:
+        """
+        Describe the accepted argument count, e.g. "2 arguments" or "1-3 arguments".
+
+        Memoized so violations against the same arity share one string.
+        """
+        if required_params == total_params:
+            return f"{required_params} argument{'s' if required_params != 1 else ''}"
+        return f"{required_params}-{total_params} arguments"
 
     def _has_transforming_decorator(self, func: Dict[str, Any]) -> bool:
         """
@@ -126,6 +455,16 @@ class ConservationValidator:
         if not location or location == "unknown":
             return {"file_path": None, "line_number": None, "column_number": None}
 
+        if self._location_cache is None:
+            return self._split_location(location)
+
+        parsed = self._location_cache.get(location)
+        if parsed is None:
+            parsed = self._location_cache[location] = self._split_location(location)
+        return parsed
+
+    def _split_location(self, location: str) -> Dict[str, Optional[Any]]:
+        """Split a non-empty 'file:line:column' string into its parts."""
         try:
             parts = location.rsplit(':', 2)
             if len(parts) == 3:
@@ -160,24 +499,56 @@ class ConservationValidator:
         Returns:
             Code snippet or None if file not found
         """
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
+        if self._source_line_cache is None:
+            lines = self._read_source_lines(file_path)
+        else:
+            if file_path not in self._source_line_cache:
+                self._source_line_cache[file_path] = self._read_source_lines(file_path)
+            lines = self._source_line_cache[file_path]
 
-            start = max(0, line_number - context_lines - 1)
-            end = min(len(lines), line_number + context_lines)
+        if lines is None:
+            return None
+        return self._format_snippet(lines, line_number, context_lines)
 
-            snippet_lines = []
-            for i in range(start, end):
-                prefix = ">>> " if i == line_number - 1 else "    "
-                snippet_lines.append(f"{prefix}{i+1:4d} | {lines[i].rstrip()}")
+    def _read_source_lines(self, file_path: str) -> Optional[List[str]]:
+        """
+        Read a source file into a list of lines.
 
-            return "\n".join(snippet_lines)
+        Args:
+            file_path: Path to source file
 
+        Returns:
+            List of lines or None if file cannot be read
+        """
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                return f.readlines()
         except (FileNotFoundError, IOError) as e:
             logger.warning(f"Could not read file {file_path}: {e}")
             return None
 
+    def _format_snippet(self, lines: List[str], line_number: int, context_lines: int = 2) -> str:
+        """
+        Format a snippet around a line from already-read source lines.
+
+        Args:
+            lines: Source file lines
+            line_number: Line number (1-indexed)
+            context_lines: Number of context lines before/after
+
+        Returns:
+            Code snippet with the target line marked
+        """
+        start = max(0, line_number - context_lines - 1)
+        end = min(len(lines), line_number + context_lines)
+
+        snippet_lines = []
+        for i in range(start, end):
+            prefix = ">>> " if i == line_number - 1 else "    "
+            snippet_lines.append(f"{prefix}{i+1:4d} | {lines[i].rstrip()}")
+
+        return "\n".join(snippet_lines)
+
     def validate_all(self, include_pyright: bool = False) -> List[Violation]:
         """
         Run all conservation law validators.
@@ -217,12 +588,39 @@ class ConservationValidator:
 
         logger.info("Validating signature conservation...")
 
-        # Get all functions
-        query = "MATCH (f:Function) RETURN f"
-        functions = self.db.execute_query(query)
+        # Get all functions with their arity and callers. The self/cls
+        # parameter callers never pass is dropped and the remaining
+        # parameters counted in Cypher, so parameter rows never leave the
+        # database
+        query = """
+        MATCH (f:Function)
+        WITH f ORDER BY f.id SKIP $skip LIMIT $limit
+        OPTIONAL MATCH (f)-[r:HAS_PARAMETER]->(p:Parameter)
+        WITH f, p, r
+        ORDER BY r.position
+        WITH f, collect(p {.name, .default_value}) as params,
+             coalesce(f.is_classmethod, false) OR coalesce(f.is_staticmethod, false)
+                 OR coalesce(f.is_property, false) as is_special
+        WITH f,
+             CASE WHEN size(params) > 0
+                       AND ((is_special AND params[0].name IN ['self', 'cls'])
+                            OR (NOT is_special AND params[0].name = 'self'))
+                  THEN tail(params) ELSE params END as passed_params
+        WITH f, size(passed_params) as total_params,
+             size([x IN passed_params
+                   WHERE x.default_value IS NULL OR x.default_value = '']) as required_params
+        OPTIONAL MATCH (caller:Function)-[:HAS_CALLSITE]->(cs:CallSite)-[:RESOLVES_TO]->(f)
+        RETURN f, required_params, total_params,
+               collect(CASE WHEN cs IS NULL THEN NULL ELSE {
+                   caller: caller,
+                   arg_count: cs.arg_count,
+                   location: cs.location
+               } END) as callers
+        """
+        functions = self._execute_paged("Function", query)
 
         for func_record in functions:
-            func = dict(func_record["f"])
+            func = func_record["f"]
             func_id = func["id"]
 
             # Skip functions with signature-transforming decorators
@@ -230,34 +628,12 @@ class ConservationValidator:
                 logger.debug(f"Skipping signature validation for decorated function: {func.get('name')}")
                 continue
 
-            # Get function parameters
-            sig_info = self.query.get_function_signature(func_id)
-            if not sig_info:
-                continue
-
-            params = sig_info["parameters"]
-
-            # Adjust for self/cls parameters based on decorators
-            # For instance methods (has 'self'), callers don't pass it
-            # For classmethods (has 'cls'), callers don't pass it
-            # For staticmethods, count all params
-            params_to_check = params
-            if func.get("is_classmethod") or func.get("is_staticmethod") or func.get("is_property"):
-                # Skip first parameter (cls for classmethod, self for property)
-                # staticmethod shouldn't have self/cls, but check anyway
-                if params and params[0].get("param", {}).get("name") in ["self", "cls"]:
-                    params_to_check = params[1:]
-            elif params and params[0].get("param", {}).get("name") == "self":
-                # Instance method - skip self parameter
-                params_to_check = params[1:]
-
-            total_params = len(params_to_check)
-
-            # Count required parameters (those without defaults)
-            required_params = sum(1 for p in params_to_check if not p.get("param", {}).get("default_value"))
+            # Parameter counts exclude self/cls, which callers don't pass
+            total_params = func_record["total_params"]
+            required_params = func_record["required_params"]
 
             # Check all callers
-            callers = self.query.find_callers(func_id)
+            callers = func_record["callers"]
 
             for caller_info in callers:
                 caller = caller_info["caller"]
@@ -279,10 +655,7 @@ class ConservationValidator:
                             )
 
                         # Build helpful error message
-                        if required_params == total_params:
-                            expected_msg = f"{required_params} argument{'s' if required_params != 1 else ''}"
-                        else:
-                            expected_msg = f"{required_params}-{total_params} arguments"
+                        expected_msg = self._expected_args_message(required_params, total_params)
 
                         violations.append(Violation(
                             violation_type=ViolationType.SIGNATURE_MISMATCH,
@@ -310,6 +683,8 @@ class ConservationValidator:
             if func.get("visibility") == "private":
                 # Private functions should only be called from same module
                 func_module = func["qualified_name"].rsplit(".", 1)[0] if "." in func["qualified_name"] else ""
+                message = f"Private function {func['name']} called from different module"
+                suggested_fix = f"Make {func['name']} public or move call to same module"
 
                 for caller_info in callers:
                     caller = caller_info["caller"]
@@ -331,14 +706,14 @@ class ConservationValidator:
                             violation_type=ViolationType.SIGNATURE_MISMATCH,
                             severity="warning",
                             entity_id=func_id,
-                            message=f"Private function {func['name']} called from different module",
+                            message=message,
                             details={
                                 "function": func["qualified_name"],
                                 "caller": caller["qualified_name"],
                                 "function_module": func_module,
                                 "caller_module": caller_module
                             },
-                            suggested_fix=f"Make {func['name']} public or move call to same module",
+                            suggested_fix=suggested_fix,
                             file_path=loc_info["file_path"],
                             line_number=loc_info["line_number"],
                             column_number=loc_info["column_number"],
@@ -393,10 +768,10 @@ class ConservationValidator:
         WHERE callee.id IS NULL
         RETURN caller, r, properties(r) as props
         """
-        broken_calls = self.db.execute_query(query)
+        broken_calls = self.db.execute_query_stream(query)
 
         for record in broken_calls:
-            caller = dict(record["caller"])
+            caller = record["caller"]
             props = record["props"]
 
             # Extract location info
@@ -438,10 +813,10 @@ class ConservationValidator:
         WHERE target_count <> 1
         RETURN cs, target_count
         """
-        bad_resolutions = self.db.execute_query(query)
+        bad_resolutions = self.db.execute_query_stream(query)
 
         for record in bad_resolutions:
-            cs = dict(record["cs"])
+            cs = record["cs"]
             target_count = record["target_count"]
 
             loc_info = self._parse_location_string(cs.get("location", ""))
@@ -478,10 +853,10 @@ class ConservationValidator:
         WHERE cs.resolution_status = 'unresolved'
         RETURN cs
         """
-        unresolved = self.db.execute_query(query)
+        unresolved = self.db.execute_query_stream(query)
 
         for record in unresolved:
-            cs = dict(record["cs"])
+            cs = record["cs"]
             loc_info = self._parse_location_string(cs.get("location", ""))
 
             code_snippet = None
@@ -522,10 +897,10 @@ class ConservationValidator:
         RETURN source, properties(r) as props
         LIMIT 100
         """
-        dangling_refs = self.db.execute_query(query)
+        dangling_refs = self.db.execute_query_stream(query)
 
         for record in dangling_refs:
-            source = dict(record["source"])
+            source = record["source"]
             props = record["props"]
 
             violations.append(Violation(
@@ -546,10 +921,10 @@ class ConservationValidator:
         MATCH (u:Unresolved)
         RETURN u
         """
-        unresolved_nodes = self.db.execute_query(query)
+        unresolved_nodes = self.db.execute_query_stream(query)
 
         for record in unresolved_nodes:
-            unresolved = dict(record["u"])
+            unresolved = record["u"]
             loc_info = self._parse_location_string(unresolved.get("location", ""))
 
             violations.append(Violation(
@@ -588,6 +963,7 @@ class ConservationValidator:
         violations = []
 
         logger.info("Validating data flow consistency (T law)...")
+        self._reset_type_caches()
 
         # 1. Check for missing type annotations (warnings)
         violations.extend(self._check_missing_type_annotations())
@@ -618,11 +994,11 @@ class ConservationValidator:
           AND NOT p.name IN ['self', 'cls']
         RETURN f, p
         """
-        untyped_params = self.db.execute_query(query)
+        untyped_params = self.db.execute_query_stream(query)
 
         for record in untyped_params:
-            func = dict(record["f"])
-            param = dict(record["p"])
+            func = record["f"]
+            param = record["p"]
 
             loc_info = self._extract_location(func)
             code_snippet = None
@@ -646,18 +1022,12 @@ class ConservationValidator:
                 code_snippet=code_snippet
             ))
 
-        # Check functions missing return type annotations
-        query = """
-        MATCH (f:Function)
-        WHERE f.return_type IS NULL
-          AND NOT f.name STARTS WITH '_'
-          AND NOT f.name = '__init__'
-        RETURN f
-        """
-        untyped_functions = self.db.execute_query(query)
-
-        for record in untyped_functions:
-            func = dict(record["f"])
+        # Check public functions missing return type annotations
+        for entry in self._get_function_return_view().values():
+            func = entry["function"]
+            name = func.get("name")
+            if func.get("return_type") is not None or not name or name.startswith("_"):
+                continue
 
             loc_info = self._extract_location(func)
 
@@ -691,11 +1061,11 @@ class ConservationValidator:
         ORDER BY p.position
         RETURN cs, f, collect({param: p, type: pt}) as params
         """
-        results = self.db.execute_query(query)
+        results = self.db.execute_query_stream(query)
 
         for record in results:
-            cs = dict(record["cs"])
-            func = dict(record["f"])
+            cs = record["cs"]
+            func = record["f"]
             params = record["params"]
 
             # Get argument types from call site if available
@@ -720,8 +1090,8 @@ class ConservationValidator:
                     continue
                 expected_type = param_type.get("name", param.get("type_annotation", ""))
 
-                # Check compatibility
-                if arg_type and expected_type:
+                # Check compatibility, skipping the call for identical types
+                if arg_type and expected_type and arg_type != expected_type:
                     if not self._types_compatible(arg_type, expected_type):
                         loc_info = self._parse_location_string(cs.get("location", ""))
 
@@ -752,58 +1122,36 @@ class ConservationValidator:
         """
         violations = []
 
-        # Check functions with multiple return types
-        query = """
-        MATCH (f:Function)-[:RETURNS_TYPE]->(t:Type)
-        WITH f, collect(t) as types
-        WHERE size(types) > 1
-        RETURN f, types
-        """
-        results = self.db.execute_query(query)
-
-        for record in results:
-            func = dict(record["f"])
-            types = [dict(t) for t in record["types"]]
-
-            type_names = [t.get("name", "unknown") for t in types]
+        # Flag functions with multiple return types and functions whose
+        # declared return_type has no RETURNS_TYPE edge
+        for entry in self._get_function_return_view().values():
+            func = entry["function"]
+            type_names = entry["return_types"]
 
-            violations.append(Violation(
-                violation_type=ViolationType.DATA_FLOW_INVALID,
-                severity="warning",
-                entity_id=func["id"],
-                message=f"Function {func['name']} has multiple return types: {', '.join(type_names)}",
-                details={
-                    "function": func["qualified_name"],
-                    "types": type_names
-                },
-                suggested_fix="Unify return types or use Union type"
-            ))
-
-        # Check that declared return type matches RETURNS_TYPE edge
-        query = """
-        MATCH (f:Function)
-        WHERE f.return_type IS NOT NULL
-        OPTIONAL MATCH (f)-[:RETURNS_TYPE]->(t:Type)
-        WITH f, t
-        WHERE t IS NULL
-        RETURN f
-        """
-        missing_edges = self.db.execute_query(query)
-
-        for record in missing_edges:
-            func = dict(record["f"])
-
-            violations.append(Violation(
-                violation_type=ViolationType.DATA_FLOW_INVALID,
-                severity="warning",
-                entity_id=func["id"],
-                message=f"Function {func['name']} has return_type annotation but no RETURNS_TYPE edge",
-                details={
-                    "function": func["qualified_name"],
-                    "declared_type": func.get("return_type")
-                },
-                suggested_fix="Ensure Type node exists and is linked"
-            ))
+            if len(type_names) > 1:
+                violations.append(Violation(
+                    violation_type=ViolationType.DATA_FLOW_INVALID,
+                    severity="warning",
+                    entity_id=func["id"],
+                    message=f"Function {func['name']} has multiple return types: {', '.join(type_names)}",
+                    details={
+                        "function": func["qualified_name"],
+                        "types": type_names
+                    },
+                    suggested_fix="Unify return types or use Union type"
+                ))
+            elif not type_names and func.get("return_type") is not None:
+                violations.append(Violation(
+                    violation_type=ViolationType.DATA_FLOW_INVALID,
+                    severity="warning",
+                    entity_id=func["id"],
+                    message=f"Function {func['name']} has return_type annotation but no RETURNS_TYPE edge",
+                    details={
+                        "function": func["qualified_name"],
+                        "declared_type": func.get("return_type")
+                    },
+                    suggested_fix="Ensure Type node exists and is linked"
+                ))
 
         return violations
 
@@ -813,40 +1161,33 @@ class ConservationValidator:
         """
         violations = []
 
-        # Check for cycles in subtype relationships
-        query = """
-        MATCH (t:Type)
-        MATCH path = (t)-[:IS_SUBTYPE_OF*1..]->(t)
-        RETURN t, [n IN nodes(path) | n.name] as cycle
-        LIMIT 10
+        # Subtype edges for cycle detection, and subtypes whose kind is
+        # incompatible with their parent; the two queries run concurrently
+        edge_query = """
+        MATCH (child:Type)-[:IS_SUBTYPE_OF]->(parent:Type)
+        RETURN child {.id, .name} as child, parent {.id, .name} as parent
         """
-        cycles = self.db.execute_query(query)
-
-        for record in cycles:
-            type_node = dict(record["t"])
-            cycle = record["cycle"]
+        kind_query = """
+        MATCH (child:Type)-[:IS_SUBTYPE_OF]->(parent:Type)
+        WHERE child.kind <> parent.kind
+          AND NOT parent.kind IN ['class', 'generic']
+        RETURN child, parent
+        """
+        edges, incompatible = self.db.execute_queries([(edge_query, None), (kind_query, None)])
 
+        for type_id, cycle in self._find_named_cycles(edges, "child", "parent", "name"):
             violations.append(Violation(
                 violation_type=ViolationType.DATA_FLOW_INVALID,
                 severity="error",
-                entity_id=type_node.get("id", "unknown"),
+                entity_id=type_id,
                 message=f"Circular subtype relationship: {' -> '.join(cycle)}",
                 details={"cycle": cycle},
                 suggested_fix="Remove circular subtype relationship"
             ))
 
-        # Check that subtypes have compatible structures
-        query = """
-        MATCH (child:Type)-[:IS_SUBTYPE_OF]->(parent:Type)
-        WHERE child.kind <> parent.kind
-          AND NOT parent.kind IN ['class', 'generic']
-        RETURN child, parent
-        """
-        incompatible = self.db.execute_query(query)
-
         for record in incompatible:
-            child = dict(record["child"])
-            parent = dict(record["parent"])
+            child = record["child"]
+            parent = record["parent"]
 
             violations.append(Violation(
                 violation_type=ViolationType.DATA_FLOW_INVALID,
@@ -870,63 +1211,166 @@ class ConservationValidator:
         """
         violations = []
 
-        # Check variables with type annotations that are assigned incompatible values
+        # Check variables whose assigned types differ from their declared type
+        # (or, if undeclared, disagree with each other). The comparison runs in
+        # Cypher so only candidate mismatches are returned.
         query = """
         MATCH (v:Variable)
+        WITH v ORDER BY v.id SKIP $skip LIMIT $limit
         OPTIONAL MATCH (v)-[:HAS_TYPE]->(declared:Type)
+        WITH v, declared
         OPTIONAL MATCH (v)-[:ASSIGNED_TYPE]->(assigned:Type)
-        RETURN v, declared, collect(DISTINCT assigned.name) as inferred_types
+        WITH v, coalesce(declared.name, v.type_annotation, '') as declared_type,
+             [t IN collect(DISTINCT assigned.name) WHERE t <> ''] as inferred_types
+        WITH v, declared_type,
+             CASE WHEN declared_type = '' THEN inferred_types
+                  ELSE [t IN inferred_types WHERE t <> declared_type] END as candidate_types
+        WHERE size(candidate_types) > CASE WHEN declared_type = '' THEN 1 ELSE 0 END
+        RETURN v, declared_type, candidate_types
         """
-        results = self.db.execute_query(query)
+        results = self._execute_paged("Variable", query)
 
         for record in results:
-            var = dict(record["v"])
-            declared_node = record.get("declared")
-            declared_type = ""
-            if declared_node:
-                declared_type = dict(declared_node).get("name", "")
-            elif var.get("type_annotation"):
-                declared_type = var.get("type_annotation")
-
-            inferred_types = [t for t in record.get("inferred_types", []) if t]
+            var = record["v"]
+            declared_type = record["declared_type"]
+            candidate_types = record["candidate_types"]
 
             # If we have both declared annotation and resolved type, check compatibility
             if declared_type:
-                for resolved in set(inferred_types):
-                    if resolved and resolved != declared_type:
-                        if not self._types_compatible(resolved, declared_type):
-                            violations.append(Violation(
-                                violation_type=ViolationType.DATA_FLOW_INVALID,
-                                severity="error",
-                                entity_id=var["id"],
-                                message=f"Variable {var['name']} declared as '{declared_type}' but assigned '{resolved}'",
-                                details={
-                                    "variable": var["name"],
-                                    "declared_type": declared_type,
-                                    "assigned_type": resolved,
-                                    "scope": var.get("scope")
-                                },
-                                suggested_fix=f"Ensure assigned value matches type {declared_type}"
-                            ))
+                for resolved in candidate_types:
+                    if resolved != declared_type and not self._types_compatible(resolved, declared_type):
+                        violations.append(Violation(
+                            violation_type=ViolationType.DATA_FLOW_INVALID,
+                            severity="error",
+                            entity_id=var["id"],
+                            message=f"Variable {var['name']} declared as '{declared_type}' but assigned '{resolved}'",
+                            details={
+                                "variable": var["name"],
+                                "declared_type": declared_type,
+                                "assigned_type": resolved,
+                                "scope": var.get("scope")
+                            },
+                            suggested_fix=f"Ensure assigned value matches type {declared_type}"
+                        ))
             else:
-                unique_inferred = sorted(set(inferred_types))
-                if len(unique_inferred) > 1:
-                    violations.append(Violation(
-                        violation_type=ViolationType.DATA_FLOW_INVALID,
-                        severity="warning",
-                        entity_id=var["id"],
-                        message=f"Variable {var['name']} assigned inconsistent inferred types: {', '.join(unique_inferred)}",
-                        details={
-                            "variable": var["name"],
-                            "assigned_types": unique_inferred,
-                            "scope": var.get("scope")
-                        },
-                        suggested_fix="Add an explicit annotation or ensure assignments use a consistent type"
-                    ))
+                # candidate_types is already de-duplicated by collect(DISTINCT ...)
+                unique_inferred = sorted(candidate_types)
+                violations.append(Violation(
+                    violation_type=ViolationType.DATA_FLOW_INVALID,
+                    severity="warning",
+                    entity_id=var["id"],
+                    message=f"Variable {var['name']} assigned inconsistent inferred types: {', '.join(unique_inferred)}",
+                    details={
+                        "variable": var["name"],
+                        "assigned_types": unique_inferred,
+                        "scope": var.get("scope")
+                    },
+                    suggested_fix="Add an explicit annotation or ensure assignments use a consistent type"
+                ))
 
         return violations
 
+    def _reset_type_caches(self) -> None:
+        """Drop memoized type information so it reflects the current graph."""
+        self._compat_cache.clear()
+        self._subtype_closure = None
+        self._fn_return_view = None
+
+    def _get_function_return_view(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Load every function with the names of its RETURNS_TYPE targets.
+
+        Built once per data flow pass and shared by the return annotation
+        and return type consistency checks.
+
+        Returns:
+            Mapping of function ID to {"function": node properties,
+            "return_types": list of return type names}
+        """
+        if self._fn_return_view is None:
+            query = """
+            MATCH (f:Function)
+            WITH f ORDER BY f.id SKIP $skip LIMIT $limit
+            OPTIONAL MATCH (f)-[:RETURNS_TYPE]->(t:Type)
+            WITH f, collect(DISTINCT t) as types
+            RETURN f, [t IN types | coalesce(t.name, 'unknown')] as return_types
+            """
+            self._fn_return_view = {}
+            for record in self._execute_paged("Function", query):
+                func = record["f"]
+                self._fn_return_view[func["id"]] = {
+                    "function": func,
+                    "return_types": record["return_types"]
+                }
+        return self._fn_return_view
+
+    def _get_subtype_closure(self) -> Dict[str, Set[str]]:
+        """
+        Load IS_SUBTYPE_OF reachability (up to 5 hops) in a single query.
+
+        Returns:
+            Mapping of type name to the names of all types it is a subtype of
+            (including itself)
+        """
+        if self._subtype_closure is None:
+            self._subtype_closure = self._load_subtype_closure()
+        return self._subtype_closure
+
+    def _load_subtype_closure(self, names: Optional[List[str]] = None) -> Dict[str, Set[str]]:
+        """
+        Query IS_SUBTYPE_OF reachability, optionally only for some subtypes.
+
+        Args:
+            names: Type names to load ancestors for, or None for every type
+
+        Returns:
+            Mapping of type name to the names of its ancestors (including itself)
+        """
+        try:
+            if names is None:
+                results = self.db.execute_query(self._SUBTYPE_CLOSURE_QUERY)
+            else:
+                results = self.db.execute_query(self._SUBTYPE_CLOSURE_FOR_NAMES_QUERY, {"names": names})
+            return {r["name"]: set(r["ancestors"]) for r in results}
+        except Exception as e:
+            logger.warning(f"Failed to load subtype hierarchy: {e}")
+            return {}
+
+    def _prime_type_compatibility(self, pairs: Set[Tuple[str, str]]) -> None:
+        """
+        Answer compatibility for a known set of (actual, expected) pairs up front.
+
+        When the full hierarchy has not been loaded yet, only the ancestors of
+        the pairs' actual types are fetched; the answers land in the memo
+        cache, and later unprimed checks still load the full closure.
+        """
+        if not pairs:
+            return
+
+        partial = self._subtype_closure is None
+        if partial:
+            names = sorted({actual.strip() for actual, _ in pairs if actual})
+            self._subtype_closure = self._load_subtype_closure(names)
+
+        for actual, expected in pairs:
+            self._types_compatible(actual, expected)
+
+        if partial:
+            self._subtype_closure = None
+
     def _types_compatible(self, actual: str, expected: str) -> bool:
+        """
+        Check if actual type is compatible with expected type.
+        Results are memoized per (actual, expected) pair for the current pass.
+        """
+        key = (actual, expected)
+        compatible = self._compat_cache.get(key)
+        if compatible is None:
+            compatible = self._check_types_compatible(actual, expected)
+            self._compat_cache[key] = compatible
+        return compatible
+
+    def _check_types_compatible(self, actual: str, expected: str) -> bool:
         """
         Check if actual type is compatible with expected type.
         This is a simplified check - full type compatibility requires the type graph.
@@ -950,47 +1394,83 @@ class ConservationValidator:
         if actual == "None" and "Optional" in expected:
             return True
 
-        # Basic numeric compatibility
-        numeric_types = {"int", "float", "complex", "bool"}
-        if actual in numeric_types and expected in numeric_types:
-            # int is subtype of float, bool is subtype of int
-            if actual == "bool" and expected in {"int", "float"}:
-                return True
-            if actual == "int" and expected == "float":
-                return True
-
-        # String compatibility
-        if actual in {"str", "bytes"} and expected in {"str", "bytes", "Sequence"}:
-            return True
-
-        # List/Sequence compatibility
-        if actual.startswith("List") and expected.startswith("Sequence"):
+        # Numeric promotions and str/bytes compatibility
+        if (actual, expected) in self.COMPATIBLE_TYPE_PAIRS:
             return True
 
-        # Dict/Mapping compatibility
-        if actual.startswith("Dict") and expected.startswith("Mapping"):
-            return True
+        # List/Sequence and Dict/Mapping compatibility
+        for actual_prefix, expected_prefix in self.COMPATIBLE_TYPE_PREFIXES:
+            if actual.startswith(actual_prefix) and expected.startswith(expected_prefix):
+                return True
 
         # Check generic type compatibility (simplified)
         if "[" in actual and "[" in expected:
-            actual_base = actual.split("[")[0]
-            expected_base = expected.split("[")[0]
-            if actual_base == expected_base:
+            if actual.partition("[")[0] == expected.partition("[")[0]:
                 return True  # Simplified - should check type parameters
 
-        # Query the graph for IS_SUBTYPE_OF relationship
-        query = """
-        MATCH (a:Type {name: $actual})-[:IS_SUBTYPE_OF*0..5]->(e:Type {name: $expected})
-        RETURN count(*) > 0 as compatible
+        # Consult the graph's IS_SUBTYPE_OF hierarchy
+        return expected in self._get_subtype_closure().get(actual, ())
+
+    def _run_pyright(self, files: List[str]) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get pyright diagnostics for files.
+
+        Prefers a persistent pyright language server, which only re-analyzes
+        files whose contents changed since the previous run. Falls back to a
+        one-shot ``pyright --outputjson`` when the server is not installed or
+        fails.
+
+        Returns:
+            Diagnostics in pyright --outputjson format, or None if pyright
+            could not be run
         """
+        if PyrightLanguageServer.is_available():
+            if self._pyright_server is None:
+                self._pyright_server = PyrightLanguageServer()
+            try:
+                return self._pyright_server.check_files(files)
+            except Exception as e:
+                logger.warning(f"pyright language server failed, falling back to CLI: {e}")
+                self._close_pyright_server()
+
         try:
-            results = self.db.execute_query(query, {"actual": actual, "expected": expected})
-            if results and results[0].get("compatible"):
-                return True
-        except Exception:
-            pass
+            # Keep stdout as raw bytes: json.loads decodes UTF-8 itself, which
+            # avoids holding a second, decoded copy of large reports
+            result = subprocess.run(
+                ['pyright', '--outputjson'] + files,
+                capture_output=True,
+                timeout=120
+            )
+        except FileNotFoundError:
+            logger.warning("pyright not found in PATH. Install with: npm install -g pyright")
+            return None
+        except subprocess.TimeoutExpired:
+            logger.error("pyright timed out after 120 seconds")
+            return None
+        except Exception as e:
+            logger.error(f"Error running pyright: {e}")
+            return None
 
-        return False
+        try:
+            output = json.loads(result.stdout)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            preview = result.stdout[:500].decode('utf-8', errors='replace')
+            logger.warning(f"Failed to parse pyright output: {preview}")
+            return None
+
+        return output.get('generalDiagnostics', [])
+
+    def _close_pyright_server(self):
+        """Stop the pyright language server if one is running."""
+        if self._pyright_server is not None:
+            try:
+                self._pyright_server.close()
+            finally:
+                self._pyright_server = None
+
+    def close(self):
+        """Release external resources held by the validator."""
+        self._close_pyright_server()
 
     def validate_typing_with_pyright(self, files: List[str] = None) -> List[Violation]:
         """
@@ -1022,70 +1502,55 @@ class ConservationValidator:
             logger.info("No files to check with pyright")
             return violations
 
-        # Run pyright
-        try:
-            result = subprocess.run(
-                ['pyright', '--outputjson'] + files,
-                capture_output=True,
-                text=True,
-                timeout=120
-            )
-
-            # Parse JSON output
-            try:
-                output = json.loads(result.stdout)
-            except json.JSONDecodeError:
-                logger.warning(f"Failed to parse pyright output: {result.stdout[:500]}")
-                return violations
-
-            # Process diagnostics
-            diagnostics = output.get('generalDiagnostics', [])
+        diagnostics = self._run_pyright(files)
+        if diagnostics is None:
+            return violations
 
-            for diag in diagnostics:
-                severity = diag.get('severity', 'error')
-                if severity not in ['error', 'warning']:
-                    continue
+        # Each reported file is read once and shared by all its diagnostics
+        source_lines: Dict[str, Optional[List[str]]] = {}
 
-                file_path = diag.get('file', '')
-                range_info = diag.get('range', {})
-                start = range_info.get('start', {})
-                line_number = start.get('line', 0) + 1  # pyright uses 0-indexed lines
-                column_number = start.get('character', 0)
-                message = diag.get('message', '')
-                rule = diag.get('rule', 'unknown')
+        for diag in diagnostics:
+            severity = diag.get('severity', 'error')
+            if severity not in ['error', 'warning']:
+                continue
 
-                # Get code snippet
-                code_snippet = None
-                if file_path and line_number:
-                    code_snippet = self._get_code_snippet(file_path, line_number)
+            file_path = diag.get('file', '')
+            range_info = diag.get('range', {})
+            start = range_info.get('start', {})
+            line_number = start.get('line', 0) + 1  # pyright uses 0-indexed lines
+            column_number = start.get('character', 0)
+            message = diag.get('message', '')
+            rule = diag.get('rule', 'unknown')
 
-                violations.append(Violation(
-                    violation_type=ViolationType.DATA_FLOW_INVALID,
-                    severity=severity,
-                    entity_id=f"pyright:{file_path}:{line_number}:{column_number}",
-                    message=f"[{rule}] {message}",
-                    details={
-                        "rule": rule,
-                        "file": file_path,
-                        "line": line_number,
-                        "column": column_number,
-                        "pyright_severity": severity
-                    },
-                    suggested_fix=f"Fix type error at {file_path}:{line_number}",
-                    file_path=file_path,
-                    line_number=line_number,
-                    column_number=column_number,
-                    code_snippet=code_snippet
-                ))
+            # Get code snippet
+            code_snippet = None
+            if file_path and line_number:
+                if file_path not in source_lines:
+                    source_lines[file_path] = self._read_source_lines(file_path)
+                lines = source_lines[file_path]
+                if lines is not None:
+                    code_snippet = self._format_snippet(lines, line_number)
 
-            logger.info(f"Pyright found {len(violations)} type violations")
+            violations.append(Violation(
+                violation_type=ViolationType.DATA_FLOW_INVALID,
+                severity=severity,
+                entity_id=f"pyright:{file_path}:{line_number}:{column_number}",
+                message=f"[{rule}] {message}",
+                details={
+                    "rule": rule,
+                    "file": file_path,
+                    "line": line_number,
+                    "column": column_number,
+                    "pyright_severity": severity
+                },
+                suggested_fix=f"Fix type error at {file_path}:{line_number}",
+                file_path=file_path,
+                line_number=line_number,
+                column_number=column_number,
+                code_snippet=code_snippet
+            ))
 
-        except FileNotFoundError:
-            logger.warning("pyright not found in PATH. Install with: npm install -g pyright")
-        except subprocess.TimeoutExpired:
-            logger.error("pyright timed out after 120 seconds")
-        except Exception as e:
-            logger.error(f"Error running pyright: {e}")
+        logger.info(f"Pyright found {len(violations)} type violations")
 
         return violations
 
@@ -1101,65 +1566,46 @@ class ConservationValidator:
 
         logger.info("Validating edge type correctness...")
 
-        # Define valid edge type mappings: edge_type -> (allowed_from_labels, allowed_to_labels)
-        edge_schema = {
-            "DECLARES": (["Module", "Class"], ["Class", "Function", "Variable"]),
-            "HAS_PARAMETER": (["Function"], ["Parameter"]),
-            "HAS_CALLSITE": (["Function"], ["CallSite"]),
-            "INHERITS": (["Class"], ["Class"]),
-            "IMPORTS": (["Module"], ["Module"]),
-            "RETURNS_TYPE": (["Function"], ["Type"]),
-            "HAS_TYPE": (["Parameter", "Variable"], ["Type"]),
-            "RESOLVES_TO": (["CallSite"], ["Function"]),
-            "ASSIGNS_TO": (["Function"], ["Variable"]),
-            "READS_FROM": (["Function"], ["Variable"]),
-            "ASSIGNED_TYPE": (["Variable"], ["Type"]),
-            "IS_SUBTYPE_OF": (["Type"], ["Type"]),
-            "HAS_DECORATOR": (["Function", "Class"], ["Decorator"]),
-            "DECORATES": (["Decorator"], ["Function", "Class"]),
-            "REFERENCES": (["Function", "Class", "Decorator"], ["Variable", "Function", "Class", "Decorator", "Type"]),
-            "UNRESOLVED_REFERENCE": (["Function", "Class", "Module"], ["Unresolved"]),
-        }
-
-        for edge_type, (valid_from, valid_to) in edge_schema.items():
-            # Query for edges that violate the schema
-            from_check = " OR ".join([f"'{l}' IN labels(a)" for l in valid_from])
-            to_check = " OR ".join([f"'{l}' IN labels(b)" for l in valid_to])
+        total_limit = self.max_violations_per_kind * len(self.EDGE_SCHEMA)
+        if self.max_total_violations is not None:
+            total_limit = min(total_limit, self.max_total_violations)
 
-            query = f"""
-            MATCH (a)-[r:{edge_type}]->(b)
-            WHERE NOT ({from_check}) OR NOT ({to_check})
-            RETURN a, b, labels(a) as from_labels, labels(b) as to_labels
-            LIMIT 100
-            """
+        try:
+            results = self.db.execute_query(self._EDGE_TYPE_QUERY, {
+                "schema": self._EDGE_SCHEMA_PARAM,
+                "limit": self.max_violations_per_kind,
+                "total_limit": total_limit
+            })
+        except Exception as e:
+            # One statement covers every edge type, so a failure here hides
+            # all edge-schema violations rather than a single type's
+            logger.error(f"Edge type validation query failed; no edge types were checked: {e}")
+            results = []
 
-            try:
-                results = self.db.execute_query(query)
+        for record in results:
+            edge_type = record["edge_type"]
+            valid_from, valid_to = self.EDGE_SCHEMA[edge_type]
+            from_node = record["a"]
+            to_node = record["b"]
+            from_labels = record["from_labels"]
+            to_labels = record["to_labels"]
 
-                for record in results:
-                    from_node = dict(record["a"])
-                    to_node = dict(record["b"])
-                    from_labels = record["from_labels"]
-                    to_labels = record["to_labels"]
-
-                    violations.append(Violation(
-                        violation_type=ViolationType.STRUCTURAL_INVALID,
-                        severity="error",
-                        entity_id=from_node.get("id", "unknown"),
-                        message=f"Invalid {edge_type} edge: {from_labels} -> {to_labels}",
-                        details={
-                            "edge_type": edge_type,
-                            "from_node": from_node.get("id"),
-                            "from_labels": from_labels,
-                            "to_node": to_node.get("id"),
-                            "to_labels": to_labels,
-                            "expected_from": valid_from,
-                            "expected_to": valid_to
-                        },
-                        suggested_fix=f"Edge {edge_type} should be from {valid_from} to {valid_to}"
-                    ))
-            except Exception as e:
-                logger.warning(f"Error checking edge type {edge_type}: {e}")
+            violations.append(Violation(
+                violation_type=ViolationType.STRUCTURAL_INVALID,
+                severity="error",
+                entity_id=from_node.get("id", "unknown"),
+                message=f"Invalid {edge_type} edge: {from_labels} -> {to_labels}",
+                details={
+                    "edge_type": edge_type,
+                    "from_node": from_node.get("id"),
+                    "from_labels": from_labels,
+                    "to_node": to_node.get("id"),
+                    "to_labels": to_labels,
+                    "expected_from": valid_from,
+                    "expected_to": valid_to
+                },
+                suggested_fix=f"Edge {edge_type} should be from {valid_from} to {valid_to}"
+            ))
 
         logger.info(f"Edge type validation: {len(violations)} violations")
         return violations
@@ -1185,34 +1631,36 @@ class ConservationValidator:
         # First, check edge type correctness
         violations.extend(self.validate_edge_types())
 
-        # Check parameter positions are sequential
+        # Check parameter positions are sequential; only functions with a gap
+        # or duplicate in 0..n-1 are returned, with positions already sorted
         query = """
         MATCH (f:Function)-[r:HAS_PARAMETER]->(p:Parameter)
-        WITH f, collect(r.position) as positions
+        WITH f, r.position as position
+        ORDER BY position
+        WITH f, collect(position) as positions
         WHERE size(positions) > 0
+          AND any(i IN range(0, size(positions) - 1) WHERE NOT i IN positions)
         RETURN f, positions
         """
-        functions = self.db.execute_query(query)
+        functions = self.db.execute_query_stream(query)
 
         for record in functions:
-            func = dict(record["f"])
-            positions = sorted(record["positions"])
-
-            # Check for gaps in positions
+            func = record["f"]
+            positions = record["positions"]
             expected = list(range(len(positions)))
-            if positions != expected:
-                violations.append(Violation(
-                    violation_type=ViolationType.STRUCTURAL_INVALID,
-                    severity="error",
-                    entity_id=func["id"],
-                    message=f"Function {func['name']} has non-sequential parameter positions",
-                    details={
-                        "function": func["qualified_name"],
-                        "positions": positions,
-                        "expected": expected
-                    },
-                    suggested_fix="Renumber parameters to be sequential starting from 0"
-                ))
+
+            violations.append(Violation(
+                violation_type=ViolationType.STRUCTURAL_INVALID,
+                severity="error",
+                entity_id=func["id"],
+                message=f"Function {func['name']} has non-sequential parameter positions",
+                details={
+                    "function": func["qualified_name"],
+                    "positions": positions,
+                    "expected": expected
+                },
+                suggested_fix="Renumber parameters to be sequential starting from 0"
+            ))
 
         # Check for circular call dependencies
         circular = self.query.find_circular_dependencies()
@@ -1293,10 +1741,10 @@ class ConservationValidator:
         WHERE func_count <> 1
         RETURN p, func_count
         """
-        bad_params = self.db.execute_query(query)
+        bad_params = self.db.execute_query_stream(query)
 
         for record in bad_params:
-            param = dict(record["p"])
+            param = record["p"]
             func_count = record["func_count"]
 
             # Extract location info
@@ -1383,26 +1831,43 @@ class ConservationValidator:
 
         return violations
 
+    @staticmethod
+    def _tally(severities_and_types: Iterable[Tuple[str, str]]) -> Tuple[int, int, Counter]:
+        """
+        Count errors, warnings and violations per type in a single pass.
+
+        Args:
+            severities_and_types: (severity, violation type value) per violation
+
+        Returns:
+            Tuple of (errors, warnings, counts by type)
+        """
+        errors = 0
+        warnings = 0
+        by_type: Counter = Counter()
+        for severity, type_value in severities_and_types:
+            by_type[type_value] += 1
+            if severity == "error":
+                errors += 1
+            elif severity == "warning":
+                warnings += 1
+        return errors, warnings, by_type
+
     def _build_report(self, violations: List[Violation]) -> Dict[str, Any]:
         """Create a rich report used by CLI/workflows."""
-        errors = [v for v in violations if v.severity == "error"]
-        warnings = [v for v in violations if v.severity == "warning"]
-        by_type: Dict[str, List[Violation]] = {}
-        for violation in violations:
-            key = violation.violation_type.value
-            by_type.setdefault(key, []).append(violation)
+        errors, warnings, by_type = self._tally(
+            (violation.severity, violation.violation_type.value) for violation in violations
+        )
 
         return {
             "total_violations": len(violations),
-            "errors": len(errors),
-            "warnings": len(warnings),
-            "by_type": {k: len(v) for k, v in by_type.items()},
+            "errors": errors,
+            "warnings": warnings,
+            "by_type": dict(by_type),
             "violations": violations,
             "summary": {
-                "signature_conservation": len(by_type.get(ViolationType.SIGNATURE_MISMATCH.value, [])),
-                "reference_integrity": len(by_type.get(ViolationType.REFERENCE_BROKEN.value, [])),
-                "data_flow_consistency": len(by_type.get(ViolationType.DATA_FLOW_INVALID.value, [])),
-                "structural_integrity": len(by_type.get(ViolationType.STRUCTURAL_INVALID.value, []))
+                summary_key: by_type[type_value]
+                for summary_key, type_value in _SUMMARY_KEYS
             }
         }
 
@@ -1423,11 +1888,34 @@ class ConservationValidator:
             "code_snippet": violation.code_snippet
         }
 
-    def _serialize_report(self, report: Dict[str, Any]) -> Dict[str, Any]:
-        """Make a report safe for JSON responses."""
+    def _serialize_report(self, report: Dict[str, Any],
+                          serialized_violations: Optional[Dict[int, Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """
+        Make a report safe for JSON responses.
+
+        Args:
+            report: Report built by _build_report
+            serialized_violations: Optional cache of serialized violations keyed by
+                id(), shared between reports over the same violations so each
+                one is converted only once
+
+        Returns:
+            JSON-friendly report
+        """
+        if serialized_violations is None:
+            violations = [self._serialize_violation(v) for v in report["violations"]]
+        else:
+            violations = []
+            for violation in report["violations"]:
+                key = id(violation)
+                serialized = serialized_violations.get(key)
+                if serialized is None:
+                    serialized = serialized_violations[key] = self._serialize_violation(violation)
+                violations.append(serialized)
+
         return {
             **{k: v for k, v in report.items() if k != "violations"},
-            "violations": [self._serialize_violation(v) for v in report["violations"]]
+            "violations": violations
         }
 
     def run_structural_checks(self) -> List[Violation]:
@@ -1450,12 +1938,19 @@ class ConservationValidator:
         return violations
 
     def _collect_law_violations(self, include_pyright: bool = False) -> Dict[str, List[Violation]]:
-        """Gather violations grouped by conservation law."""
-        return {
-            "structural": self.run_structural_checks(),
-            "reference": self.run_reference_checks(),
-            "typing": self.run_typing_checks(include_pyright=include_pyright)
-        }
+        """
+        Gather violations grouped by conservation law.
+
+        The law families are independent read-only checks, so they run in
+        parallel threads; each query opens its own session on the shared driver.
+        """
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = {
+                "structural": executor.submit(self.run_structural_checks),
+                "reference": executor.submit(self.run_reference_checks),
+                "typing": executor.submit(self.run_typing_checks, include_pyright=include_pyright)
+            }
+            return {law: future.result() for law, future in futures.items()}
 
     def _law_report(self, law_name: str, violations: List[Violation]) -> Dict[str, Any]:
         """Build a report dictionary for a specific law."""
@@ -1484,29 +1979,41 @@ class ConservationValidator:
         """
         if incremental:
             violations = self.validate_incremental(include_pyright=include_pyright)
-            report = self._build_report(violations)
-            report["laws"] = {}
-            serialized = self._serialize_report(report)
-            serialized["laws"] = {}
-            self._last_report = serialized
-            return serialized
+            self._finalize_report(violations, {})
         else:
             law_map = self._collect_law_violations(include_pyright=include_pyright)
             violations: List[Violation] = []
             for law_violations in law_map.values():
                 violations.extend(law_violations)
+            self._finalize_report(violations, law_map)
+        return self._last_report
 
-            report = self._build_report(violations)
-            law_reports = {name: self._law_report(name, law_violations) for name, law_violations in law_map.items()}
-            report["laws"] = law_reports
+    def _finalize_report(self, violations: List[Violation],
+                         law_map: Dict[str, List[Violation]]) -> Dict[str, Any]:
+        """
+        Build the report for a validation run and store its serialized form.
 
-            serialized = self._serialize_report(report)
-            serialized["laws"] = {
-                name: self._serialize_report(law_report)
-                for name, law_report in law_reports.items()
-            }
-            self._last_report = serialized
-            return serialized
+        Args:
+            violations: All violations found
+            law_map: Violations grouped by conservation law (empty for
+                incremental runs)
+
+        Returns:
+            Report with Violation objects, including per-law reports
+        """
+        report = self._build_report(violations)
+        law_reports = {name: self._law_report(name, law_violations) for name, law_violations in law_map.items()}
+        report["laws"] = law_reports
+
+        serialized_violations: Dict[int, Dict[str, Any]] = {}
+        serialized = self._serialize_report(report, serialized_violations)
+        serialized["laws"] = {
+            name: self._serialize_report(law_report, serialized_violations)
+            for name, law_report in law_reports.items()
+        }
+        self._last_report = serialized
+
+        return report
 
     def get_last_report(self) -> Dict[str, Any]:
         """Return last serialized report or an empty default."""
@@ -1534,16 +2041,7 @@ class ConservationValidator:
         for law_violations in law_map.values():
             violations.extend(law_violations)
 
-        report = self._build_report(violations)
-        law_reports = {name: self._law_report(name, law_violations) for name, law_violations in law_map.items()}
-        report["laws"] = law_reports
-        serialized = self._serialize_report(report)
-        serialized["laws"] = {
-            name: self._serialize_report(law_report)
-            for name, law_report in law_reports.items()
-        }
-        self._last_report = serialized
-        return report
+        return self._finalize_report(violations, law_map)
 
     # ========== Incremental Validation Methods ==========
 
@@ -1560,28 +2058,161 @@ class ConservationValidator:
         Returns:
             List of violations found in changed nodes
         """
-        violations = []
-
-        logger.info("Running incremental conservation law validation on changed nodes...")
+        return self._collect_incremental_violations(include_pyright=include_pyright).to_violations()
 
-        # S Law - Structural Validity
-        violations.extend(self.validate_structural_integrity_incremental())
+    def _collect_incremental_violations(self, include_pyright: bool = False) -> ViolationBuffer:
+        """Run the incremental checks into a ViolationBuffer."""
+        violations = ViolationBuffer()
 
-        # R Law - Referential Coherence
-        violations.extend(self.validate_reference_integrity_incremental())
+        logger.info("Running incremental conservation law validation on changed nodes...")
 
-        # T Law - Semantic Typing Correctness
-        violations.extend(self.validate_signature_conservation_incremental())
-        violations.extend(self.validate_data_flow_consistency_incremental())
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # pyright runs out of process on the changed files; overlap it
+            # with the graph checks rather than running it afterwards
+            pyright_future = executor.submit(self.validate_typing_with_pyright) if include_pyright else None
 
-        # Optional deep type checking with pyright on changed files
-        if include_pyright:
-            violations.extend(self.validate_typing_with_pyright())  # Uses changed files by default
+            # Fetch the changed subgraph once and share it between all checks
+            self._changed_frontier = self._materialize_changed_frontier()
+            self._source_line_cache = {}
+            self._location_cache = {}
+            try:
+                if self._changed_frontier.is_empty():
+                    logger.info("No changed nodes to validate")
+                else:
+                    # S Law - Structural Validity
+                    violations.extend(self.validate_structural_integrity_incremental())
+
+                    # R Law - Referential Coherence
+                    violations.extend(self.validate_reference_integrity_incremental())
+
+                    # T Law - Semantic Typing Correctness
+                    violations.extend(self.validate_signature_conservation_incremental())
+                    violations.extend(self.validate_data_flow_consistency_incremental())
+            finally:
+                self._changed_frontier = None
+                self._source_line_cache = None
+                self._location_cache = None
+
+            # Optional deep type checking with pyright on changed files
+            if pyright_future is not None:
+                violations.extend(pyright_future.result())
 
         logger.info(f"Incremental validation complete: {len(violations)} violations found")
 
         return violations
 
+    def _materialize_changed_frontier(self) -> ChangedFrontier:
+        """
+        Fetch changed nodes and their immediate neighbours into memory.
+
+        A single UNION query returns every table in place of the separate
+        changed-node scans each incremental check used to run. Inheritance
+        and subtype cycles through changed nodes are found in Python from
+        the edges reachable from those nodes.
+
+        Returns:
+            ChangedFrontier for the current change set
+        """
+        frontier = ChangedFrontier()
+        inheritance_edges: List[Dict[str, Any]] = []
+        subtype_edges: List[Dict[str, Any]] = []
+
+        for record in self.db.execute_query_stream(self._CHANGED_FRONTIER_QUERY):
+            kind = record["kind"]
+            row = record["row"]
+
+            if kind == "function":
+                func = row["f"]
+                func_id = func["id"]
+                # Type names recur across call sites and parameters and key
+                # the compatibility memo; interned, they compare by identity
+                for param_info in row["params"]:
+                    param = param_info["param"]
+                    param["type_annotation"] = _intern(param.get("type_annotation"))
+                    if param_info["type"]:
+                        param_info["type"]["name"] = _intern(param_info["type"].get("name"))
+                for cs in row["typed_callsites"]:
+                    cs["arg_types"] = [_intern(arg_type) for arg_type in cs["arg_types"]]
+                for caller_info in row["arity_mismatches"]:
+                    caller_info["caller_qualified_name"] = _intern(caller_info["caller_qualified_name"])
+                frontier.functions[func_id] = func
+                frontier.params_by_func[func_id] = row["params"]
+                frontier.arity_by_func[func_id] = (row["required_params"], row["total_params"])
+                frontier.arity_mismatches_by_func[func_id] = row["arity_mismatches"]
+                frontier.typed_callsites_by_func[func_id] = row["typed_callsites"]
+            elif kind == "callsite":
+                frontier.callsites.append((row["cs"], row["target_count"]))
+            elif kind == "parameter":
+                frontier.parameters.append((row["p"], row["func_count"]))
+            elif kind == "assignment":
+                var, var_type = row["v"], row["vt"]
+                var["type_annotation"] = _intern(var.get("type_annotation"))
+                if var_type:
+                    var_type["name"] = _intern(var_type.get("name"))
+                frontier.assignments.append((row["f"], var, var_type))
+            elif kind == "inheritance_edge":
+                inheritance_edges.append(row)
+            elif kind == "subtype_edge":
+                subtype_edges.append(row)
+
+        frontier.inheritance_cycles = [
+            cycle for _, cycle in self._find_named_cycles(
+                inheritance_edges, "source", "target", "qualified_name", changed_only=True)
+        ]
+        frontier.subtype_cycles = self._find_named_cycles(
+            subtype_edges, "source", "target", "name", changed_only=True)
+
+        return frontier
+
+    @staticmethod
+    def _find_named_cycles(
+        edges: List[Dict[str, Any]],
+        source_key: str,
+        target_key: str,
+        name_key: str,
+        changed_only: bool = False
+    ) -> List[Tuple[str, List[str]]]:
+        """
+        Find cycles in a list of edge rows, one per strongly connected component.
+
+        Args:
+            edges: Rows holding projected source and target nodes
+            source_key: Row key of the source node
+            target_key: Row key of the target node
+            name_key: Node property used to render the cycle
+            changed_only: Only report cycles through a changed node, starting there
+
+        Returns:
+            List of (id of the first node, node names along the cycle)
+        """
+        nodes: Dict[str, Dict[str, Any]] = {}
+        pairs = []
+        for edge in edges:
+            source = edge[source_key]
+            target = edge[target_key]
+            nodes[source["id"]] = source
+            nodes[target["id"]] = target
+            pairs.append((source["id"], target["id"]))
+
+        def is_changed(node_id: str) -> bool:
+            return nodes[node_id].get("changed") is True
+
+        return [
+            (cycle[0], [nodes[node_id].get(name_key) or node_id for node_id in cycle])
+            for cycle in find_cycles(pairs, is_changed if changed_only else None)
+        ]
+
+    def _get_changed_frontier(self) -> ChangedFrontier:
+        """Return the frontier of the running incremental pass, or fetch one."""
+        if self._changed_frontier is not None:
+            return self._changed_frontier
+        return self._materialize_changed_frontier()
+
+    @staticmethod
+    def _is_changed(node: Dict[str, Any]) -> bool:
+        """Whether a node carries the changed flag."""
+        return node.get("changed") is True
+
     def validate_signature_conservation_incremental(self) -> List[Violation]:
         """
         Validate signature conservation only for changed functions and their callers.
@@ -1593,77 +2224,55 @@ class ConservationValidator:
 
         logger.info("Validating signature conservation (incremental)...")
 
-        # Get only changed functions
-        query = "MATCH (f:Function) WHERE f.changed = true RETURN f"
-        functions = self.db.execute_query(query)
+        frontier = self._get_changed_frontier()
+        if not frontier.functions:
+            return violations
 
-        for func_record in functions:
-            func = dict(func_record["f"])
-            func_id = func["id"]
+        for func_id, func in frontier.functions.items():
+            if not self._is_changed(func):
+                continue
 
             # Skip functions with signature-transforming decorators
             if self._has_transforming_decorator(func):
                 continue
 
-            # Get function parameters
-            sig_info = self.query.get_function_signature(func_id)
-            if not sig_info:
-                continue
-
-            params = sig_info["parameters"]
-
-            # Adjust for self/cls parameters
-            params_to_check = params
-            if func.get("is_classmethod") or func.get("is_staticmethod") or func.get("is_property"):
-                if params and params[0].get("param", {}).get("name") in ["self", "cls"]:
-                    params_to_check = params[1:]
-            elif params and params[0].get("param", {}).get("name") == "self":
-                params_to_check = params[1:]
-
-            total_params = len(params_to_check)
-            required_params = sum(1 for p in params_to_check if not p.get("param", {}).get("default_value"))
+            # Argument ranges and out-of-range calls are computed in Cypher
+            required_params, total_params = frontier.arity_by_func[func_id]
 
-            # Check all callers (including those marked as changed)
-            callers = self.query.find_callers(func_id)
-
-            for caller_info in callers:
-                caller = caller_info["caller"]
-                arg_count = caller_info.get("arg_count")
-                location = caller_info.get("location", "unknown")
+            for caller_info in frontier.arity_mismatches_by_func[func_id]:
+                caller_qualified_name = caller_info["caller_qualified_name"]
+                cs = caller_info["callsite"]
+                arg_count = cs["arg_count"]
+                location = cs.get("location") or "unknown"
 
-                if arg_count is not None:
-                    if arg_count < required_params or arg_count > total_params:
-                        loc_info = self._parse_location_string(location)
-                        code_snippet = None
-                        if loc_info["file_path"] and loc_info["line_number"]:
-                            code_snippet = self._get_code_snippet(loc_info["file_path"], loc_info["line_number"])
+                loc_info = self._parse_location_string(location)
+                code_snippet = None
+                if loc_info["file_path"] and loc_info["line_number"]:
+                    code_snippet = self._get_code_snippet(loc_info["file_path"], loc_info["line_number"])
 
-                        if required_params == total_params:
-                            expected_msg = f"{required_params} argument{'s' if required_params != 1 else ''}"
-                        else:
-                            expected_msg = f"{required_params}-{total_params} arguments"
+                expected_msg = self._expected_args_message(required_params, total_params)
 
-                        violations.append(Violation(
-                            violation_type=ViolationType.SIGNATURE_MISMATCH,
-                            severity="error",
-                            entity_id=func_id,
-                            message=f"Function {func['name']} expects {expected_msg} but is called with {arg_count}",
-                            details={
-                                "function": func["qualified_name"],
-                                "required_params": required_params,
-                                "total_params": total_params,
-                                "actual_args": arg_count,
-                                "caller": caller["qualified_name"],
-                                "location": location
-                            },
-                            suggested_fix=f"Update call at {location} to provide {expected_msg}",
-                            file_path=loc_info["file_path"],
-                            line_number=loc_info["line_number"],
-                            column_number=loc_info["column_number"],
-                            old_value=arg_count,
-                            new_value=required_params if arg_count < required_params else total_params,
-                            code_snippet=code_snippet
-                        ))
+                violations.append(Violation(
+                    violation_type=ViolationType.SIGNATURE_MISMATCH,
+                    severity="error",
+                    entity_id=func_id,
+                    message=f"Function {func['name']} expects {expected_msg} but is called with {arg_count}",
+                    details={
+                        "function": func["qualified_name"],
+                        "required_params": required_params,
+                        "total_params": total_params,
+                        "actual_args": arg_count,
+                        "caller": caller_qualified_name,
+                        "location": location
+                    },
+                    suggested_fix=f"Update call at {location} to provide {expected_msg}",
+                    file_path=loc_info["file_path"],
+                    line_number=loc_info["line_number"],
+                    column_number=loc_info["column_number"],
+                    old_value=arg_count,
+                    new_value=required_params if arg_count < required_params else total_params,
+                    code_snippet=code_snippet
+                ))
 
         logger.info(f"Signature conservation (incremental): {len(violations)} violations")
         return violations
@@ -1679,16 +2288,15 @@ class ConservationValidator:
 
         logger.info("Validating reference integrity (incremental)...")
 
+        frontier = self._get_changed_frontier()
+        if not frontier.callsites:
+            return violations
+
         # Check unresolved call sites in changed nodes
-        query = """
-        MATCH (cs:CallSite)
-        WHERE cs.changed = true AND cs.resolution_status = 'unresolved'
-        RETURN cs
-        """
-        unresolved = self.db.execute_query(query)
+        for cs, _ in frontier.callsites:
+            if cs.get("resolution_status") != "unresolved":
+                continue
 
-        for record in unresolved:
-            cs = dict(record["cs"])
             loc_info = self._parse_location_string(cs.get("location", ""))
 
             code_snippet = None
@@ -1699,7 +2307,7 @@ class ConservationValidator:
                 violation_type=ViolationType.REFERENCE_BROKEN,
                 severity="error",
                 entity_id=cs["id"],
-                message=f"Unresolved call to: {cs.get('unresolved_callee', 'unknown')}",
+                message=f"Unresolved call to: {cs.get('unresolved_callee') or 'unknown'}",
                 details={
                     "callsite": cs.get("name"),
                     "callee_name": cs.get("unresolved_callee"),
@@ -1713,19 +2321,10 @@ class ConservationValidator:
             ))
 
         # Check RESOLVES_TO relationships for changed CallSites
-        query = """
-        MATCH (cs:CallSite)
-        WHERE cs.changed = true
-        OPTIONAL MATCH (cs)-[:RESOLVES_TO]->(f:Function)
-        WITH cs, count(f) as target_count
-        WHERE target_count <> 1 AND cs.resolution_status <> 'unresolved'
-        RETURN cs, target_count
-        """
-        bad_resolutions = self.db.execute_query(query)
-
-        for record in bad_resolutions:
-            cs = dict(record["cs"])
-            target_count = record["target_count"]
+        for cs, target_count in frontier.callsites:
+            status = cs.get("resolution_status")
+            if target_count == 1 or status is None or status == "unresolved":
+                continue
 
             loc_info = self._parse_location_string(cs.get("location", ""))
 
@@ -1760,51 +2359,50 @@ class ConservationValidator:
 
         logger.info("Validating data flow consistency (incremental)...")
 
-        # 1. Check changed parameters missing type annotations
-        query = """
-        MATCH (f:Function)-[:HAS_PARAMETER]->(p:Parameter)
-        WHERE (f.changed = true OR p.changed = true)
-          AND p.type_annotation IS NULL
-          AND NOT p.name IN ['self', 'cls']
-        RETURN f, p
-        """
-        untyped_params = self.db.execute_query(query)
+        frontier = self._get_changed_frontier()
+        if not (frontier.functions or frontier.subtype_cycles or frontier.assignments):
+            return violations
 
-        for record in untyped_params:
-            func = dict(record["f"])
-            param = dict(record["p"])
+        self._reset_type_caches()
 
-            loc_info = self._parse_location_string(func.get("location", ""))
+        # 1. Check changed parameters missing type annotations
+        for func_id, func in frontier.functions.items():
+            func_changed = self._is_changed(func)
+            for param_info in frontier.params_by_func[func_id]:
+                param = param_info["param"]
+                if not (func_changed or self._is_changed(param)):
+                    continue
+                if param.get("type_annotation") is not None:
+                    continue
+                if param.get("name") is None or param["name"] in ['self', 'cls']:
+                    continue
 
-            violations.append(Violation(
-                violation_type=ViolationType.DATA_FLOW_INVALID,
-                severity="warning",
-                entity_id=param["id"],
-                message=f"Parameter {param['name']} in {func['name']} missing type annotation",
-                details={
-                    "function": func["qualified_name"],
-                    "parameter": param["name"],
-                    "position": param.get("position")
-                },
-                suggested_fix=f"Add type annotation to parameter {param['name']}",
-                file_path=loc_info["file_path"],
-                line_number=loc_info["line_number"],
-                column_number=loc_info["column_number"]
-            ))
+                loc_info = self._parse_location_string(func.get("location", ""))
+
+                violations.append(Violation(
+                    violation_type=ViolationType.DATA_FLOW_INVALID,
+                    severity="warning",
+                    entity_id=param["id"],
+                    message=f"Parameter {param['name']} in {func['name']} missing type annotation",
+                    details={
+                        "function": func["qualified_name"],
+                        "parameter": param["name"],
+                        "position": param.get("position")
+                    },
+                    suggested_fix=f"Add type annotation to parameter {param['name']}",
+                    file_path=loc_info["file_path"],
+                    line_number=loc_info["line_number"],
+                    column_number=loc_info["column_number"]
+                ))
 
         # 2. Check changed functions missing return type annotations
-        query = """
-        MATCH (f:Function)
-        WHERE f.changed = true
-          AND f.return_type IS NULL
-          AND NOT f.name STARTS WITH '_'
-          AND NOT f.name = '__init__'
-        RETURN f
-        """
-        untyped_functions = self.db.execute_query(query)
+        for func in frontier.functions.values():
+            if not self._is_changed(func) or func.get("return_type") is not None:
+                continue
+            name = func.get("name")
+            if name is None or name.startswith('_') or name == '__init__':
+                continue
 
-        for record in untyped_functions:
-            func = dict(record["f"])
             loc_info = self._parse_location_string(func.get("location", ""))
 
             violations.append(Violation(
@@ -1819,121 +2417,107 @@ class ConservationValidator:
                 column_number=loc_info["column_number"]
             ))
 
-        # 3. Check type compatibility at changed call sites
-        query = """
-        MATCH (cs:CallSite)-[:RESOLVES_TO]->(f:Function)-[:HAS_PARAMETER]->(p:Parameter)
-        WHERE (cs.changed = true OR f.changed = true)
-          AND p.type_annotation IS NOT NULL
-        OPTIONAL MATCH (p)-[:HAS_TYPE]->(pt:Type)
-        WITH cs, f, p, pt
-        ORDER BY p.position
-        RETURN cs, f, collect({param: p, type: pt}) as params
-        """
-        results = self.db.execute_query(query)
+        # Gather the (actual, expected) type pairs checked in steps 3 and 5
+        # so they are answered together with one targeted hierarchy lookup
+        call_checks = []
+        for func_id, func in frontier.functions.items():
+            callsites = frontier.typed_callsites_by_func[func_id]
+            if not callsites:
+                continue
+            params = [
+                param_info for param_info in frontier.params_by_func[func_id]
+                if param_info["param"].get("type_annotation") is not None
+            ]
 
-        for record in results:
-            cs = dict(record["cs"])
-            func = dict(record["f"])
-            params = record["params"]
+            for cs in callsites:
+                arg_types = cs["arg_types"]
 
-            arg_types = cs.get("arg_types", [])
-            if not arg_types:
-                continue
+                for i, param_info in enumerate(params):
+                    if i >= len(arg_types):
+                        break
 
-            for i, param_info in enumerate(params):
-                if i >= len(arg_types):
-                    break
+                    param = param_info["param"]
+                    param_type = param_info.get("type")
 
-                param = param_info.get("param", {})
-                param_type = param_info.get("type", {})
+                    if not param_type:
+                        continue
 
-                if not param_type:
-                    continue
+                    arg_type = arg_types[i]
+                    if not arg_type:
+                        continue
+                    expected_type = param_type.get("name") or param.get("type_annotation", "")
 
-                arg_type = arg_types[i]
-                if not arg_type:
-                    continue
-                expected_type = param_type.get("name", param.get("type_annotation", ""))
+                    # Identical and known-compatible primitive pairs need no check
+                    if arg_type == expected_type or (arg_type, expected_type) in self.COMPATIBLE_TYPE_PAIRS:
+                        continue
 
-                if arg_type and expected_type:
-                    if not self._types_compatible(arg_type, expected_type):
-                        loc_info = self._parse_location_string(cs.get("location", ""))
+                    if expected_type:
+                        call_checks.append((cs, func, param, i, arg_type, expected_type))
 
-                        violations.append(Violation(
-                            violation_type=ViolationType.DATA_FLOW_INVALID,
-                            severity="error",
-                            entity_id=cs["id"],
-                            message=f"Type mismatch: argument {i+1} is '{arg_type}' but parameter '{param.get('name')}' expects '{expected_type}'",
-                            details={
-                                "callsite": cs.get("name"),
-                                "function": func.get("qualified_name"),
-                                "parameter": param.get("name"),
-                                "position": i,
-                                "arg_type": arg_type,
-                                "expected_type": expected_type
-                            },
-                            suggested_fix=f"Convert argument to {expected_type} or update parameter type",
-                            file_path=loc_info["file_path"],
-                            line_number=loc_info["line_number"],
-                            column_number=loc_info["column_number"]
-                        ))
+        assignment_checks = []
+        for func, var, var_type in frontier.assignments:
+            declared = var.get("type_annotation")
+            resolved = var_type.get("name") if var_type else None
 
-        # 4. Check subtype cycles involving changed types
-        query = """
-        MATCH (t:Type)
-        WHERE t.changed = true
-        MATCH path = (t)-[:IS_SUBTYPE_OF*1..]->(t)
-        RETURN t, [n IN nodes(path) | n.name] as cycle
-        LIMIT 10
-        """
-        cycles = self.db.execute_query(query)
+            if declared and resolved and declared != resolved:
+                assignment_checks.append((func, var, declared, resolved))
 
-        for record in cycles:
-            type_node = dict(record["t"])
-            cycle = record["cycle"]
+        self._prime_type_compatibility(
+            {(arg_type, expected_type) for *_, arg_type, expected_type in call_checks}
+            | {(resolved, declared) for _, _, declared, resolved in assignment_checks}
+        )
+
+        # 3. Check type compatibility at changed call sites
+        for cs, func, param, i, arg_type, expected_type in call_checks:
+            if not self._types_compatible(arg_type, expected_type):
+                loc_info = self._parse_location_string(cs.get("location", ""))
+
+                violations.append(Violation(
+                    violation_type=ViolationType.DATA_FLOW_INVALID,
+                    severity="error",
+                    entity_id=cs["id"],
+                    message=f"Type mismatch: argument {i+1} is '{arg_type}' but parameter '{param.get('name')}' expects '{expected_type}'",
+                    details={
+                        "callsite": cs.get("name"),
+                        "function": func.get("qualified_name"),
+                        "parameter": param.get("name"),
+                        "position": i,
+                        "arg_type": arg_type,
+                        "expected_type": expected_type
+                    },
+                    suggested_fix=f"Convert argument to {expected_type} or update parameter type",
+                    file_path=loc_info["file_path"],
+                    line_number=loc_info["line_number"],
+                    column_number=loc_info["column_number"]
+                ))
 
+        # 4. Check subtype cycles involving changed types
+        for type_id, cycle in frontier.subtype_cycles:
             violations.append(Violation(
                 violation_type=ViolationType.DATA_FLOW_INVALID,
                 severity="error",
-                entity_id=type_node.get("id", "unknown"),
+                entity_id=type_id,
                 message=f"Circular subtype relationship: {' -> '.join(cycle)}",
                 details={"cycle": cycle},
                 suggested_fix="Remove circular subtype relationship"
             ))
 
         # 5. Check variable type compatibility for changed assignments
-        query = """
-        MATCH (f:Function)-[:ASSIGNS_TO]->(v:Variable)
-        WHERE (f.changed = true OR v.changed = true)
-          AND v.type_annotation IS NOT NULL
-        OPTIONAL MATCH (v)-[:HAS_TYPE]->(vt:Type)
-        RETURN f, v, vt
-        """
-        results = self.db.execute_query(query)
-
-        for record in results:
-            func = dict(record["f"])
-            var = dict(record["v"])
-            var_type = dict(record["vt"]) if record["vt"] else None
-
-            declared = var.get("type_annotation")
-            resolved = var_type.get("name") if var_type else None
-
-            if declared and resolved and declared != resolved:
-                if not self._types_compatible(resolved, declared):
-                    violations.append(Violation(
-                        violation_type=ViolationType.DATA_FLOW_INVALID,
-                        severity="error",
-                        entity_id=var["id"],
-                        message=f"Variable {var['name']} declared as '{declared}' but assigned '{resolved}'",
-                        details={
-                            "variable": var["name"],
-                            "declared_type": declared,
-                            "assigned_type": resolved,
-                            "function": func.get("qualified_name")
-                        },
-                        suggested_fix=f"Ensure assigned value matches type {declared}"
-                    ))
+        for func, var, declared, resolved in assignment_checks:
+            if not self._types_compatible(resolved, declared):
+                violations.append(Violation(
+                    violation_type=ViolationType.DATA_FLOW_INVALID,
+                    severity="error",
+                    entity_id=var["id"],
+                    message=f"Variable {var['name']} declared as '{declared}' but assigned '{resolved}'",
+                    details={
+                        "variable": var["name"],
+                        "declared_type": declared,
+                        "assigned_type": resolved,
+                        "function": func.get("qualified_name")
+                    },
+                    suggested_fix=f"Ensure assigned value matches type {declared}"
+                ))
 
         logger.info(f"Data flow consistency (incremental): {len(violations)} violations")
         return violations
@@ -1949,47 +2533,37 @@ class ConservationValidator:
 
         logger.info("Validating structural integrity (incremental)...")
 
-        # Check parameter positions for changed functions
-        query = """
-        MATCH (f:Function)-[r:HAS_PARAMETER]->(p:Parameter)
-        WHERE f.changed = true
-        WITH f, collect(r.position) as positions
-        WHERE size(positions) > 0
-        RETURN f, positions
-        """
-        functions = self.db.execute_query(query)
+        frontier = self._get_changed_frontier()
+        if not (frontier.functions or frontier.inheritance_cycles or frontier.parameters):
+            return violations
 
-        for record in functions:
-            func = dict(record["f"])
-            positions = sorted(record["positions"])
+        # Check parameter positions for changed functions
+        for func_id, func in frontier.functions.items():
+            if not self._is_changed(func):
+                continue
+            # Parameters arrive ordered by position with unpositioned ones
+            # last, so a sequential list has position i at index i
+            params = frontier.params_by_func[func_id]
+            if all(param_info["position"] in (i, None) for i, param_info in enumerate(params)):
+                continue
 
+            positions = [param_info["position"] for param_info in params if param_info["position"] is not None]
             expected = list(range(len(positions)))
-            if positions != expected:
-                violations.append(Violation(
-                    violation_type=ViolationType.STRUCTURAL_INVALID,
-                    severity="error",
-                    entity_id=func["id"],
-                    message=f"Function {func['name']} has non-sequential parameter positions",
-                    details={
-                        "function": func["qualified_name"],
-                        "positions": positions,
-                        "expected": expected
-                    },
-                    suggested_fix="Renumber parameters to be sequential starting from 0"
-                ))
+            violations.append(Violation(
+                violation_type=ViolationType.STRUCTURAL_INVALID,
+                severity="error",
+                entity_id=func["id"],
+                message=f"Function {func['name']} has non-sequential parameter positions",
+                details={
+                    "function": func["qualified_name"],
+                    "positions": positions,
+                    "expected": expected
+                },
+                suggested_fix="Renumber parameters to be sequential starting from 0"
+            ))
 
         # Check for inheritance cycles involving changed classes
-        query = """
-        MATCH (c:Class)
-        WHERE c.changed = true
-        MATCH path = (c)-[:INHERITS*1..]->(c)
-        RETURN [node in nodes(path) | node.qualified_name] as cycle
-        LIMIT 10
-        """
-        cycles = self.db.execute_query(query)
-
-        for record in cycles:
-            cycle = record["cycle"]
+        for cycle in frontier.inheritance_cycles:
             violations.append(Violation(
                 violation_type=ViolationType.STRUCTURAL_INVALID,
                 severity="error",
@@ -2000,19 +2574,9 @@ class ConservationValidator:
             ))
 
         # Check parameter ownership for changed parameters
-        query = """
-        MATCH (p:Parameter)
-        WHERE p.changed = true
-        OPTIONAL MATCH (f:Function)-[:HAS_PARAMETER]->(p)
-        WITH p, count(f) as func_count
-        WHERE func_count <> 1
-        RETURN p, func_count
-        """
-        bad_params = self.db.execute_query(query)
-
-        for record in bad_params:
-            param = dict(record["p"])
-            func_count = record["func_count"]
+        for param, func_count in frontier.parameters:
+            if func_count == 1:
+                continue
 
             violations.append(Violation(
                 violation_type=ViolationType.STRUCTURAL_INVALID,
@@ -2036,34 +2600,23 @@ class ConservationValidator:
         Returns:
             Dictionary with validation results and statistics
         """
-        violations = self.validate_incremental()
+        violations = self._collect_incremental_violations()
 
-        # Group by severity
-        errors = [v for v in violations if v.severity == "error"]
-        warnings = [v for v in violations if v.severity == "warning"]
-
-        # Group by type
-        by_type = {}
-        for v in violations:
-            type_name = v.violation_type.value
-            if type_name not in by_type:
-                by_type[type_name] = []
-            by_type[type_name].append(v)
+        # Counts come from one pass over the buffer's severity and type columns
+        errors, warnings, by_type = self._tally(zip(violations.severities, violations.types))
 
         # Get changed node count
         changed_nodes = self.db.get_changed_node_ids()
 
         return {
             "total_violations": len(violations),
-            "errors": len(errors),
-            "warnings": len(warnings),
+            "errors": errors,
+            "warnings": warnings,
             "changed_nodes": len(changed_nodes),
-            "by_type": {k: len(v) for k, v in by_type.items()},
-            "violations": violations,
+            "by_type": dict(by_type),
+            "violations": violations.to_violations(),
             "summary": {
-                "signature_conservation": len(by_type.get(ViolationType.SIGNATURE_MISMATCH.value, [])),
-                "reference_integrity": len(by_type.get(ViolationType.REFERENCE_BROKEN.value, [])),
-                "data_flow_consistency": len(by_type.get(ViolationType.DATA_FLOW_INVALID.value, [])),
-                "structural_integrity": len(by_type.get(ViolationType.STRUCTURAL_INVALID.value, []))
+                summary_key: by_type[type_value]
+                for summary_key, type_value in _SUMMARY_KEYS
             }
         }
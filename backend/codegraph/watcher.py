@@ -1,20 +1,52 @@
 """File watcher for real-time code change detection."""
 
 from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler, FileModifiedEvent, FileCreatedEvent, FileDeletedEvent
+from watchdog.events import (
+    FileSystemEventHandler, FileModifiedEvent, FileCreatedEvent, FileDeletedEvent, DirCreatedEvent
+)
 from typing import Optional, Set, Callable, Awaitable, Dict
 from datetime import datetime
 from pathlib import Path
 import asyncio
 import logging
-import time
+import re
+import threading
 
 logger = logging.getLogger(__name__)
 
+# Python 3.12+ can start a task eagerly, running its coroutine inline up to
+# the first await that actually suspends. Flushes with nothing pending and
+# enqueues into a queue with room then finish without a loop round trip
+_eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+
 
 class CodeFileHandler(FileSystemEventHandler):
     """Handles file system events for Python source files."""
 
+    # Event types the handler acts on. Passed to the observer as its event
+    # filter, which on Linux also narrows the inotify mask so open, close and
+    # access events are never read from the kernel
+    HANDLED_EVENTS = [FileModifiedEvent, FileCreatedEvent, FileDeletedEvent, DirCreatedEvent]
+
+    # Directory names whose contents are never processed
+    IGNORED_DIRECTORIES = (
+        '__pycache__',
+        '.venv',
+        'venv',
+        '.git',
+        '.mypy_cache',
+        '.pytest_cache',
+        'node_modules',
+    )
+
+    # Matches an ignored name as a whole path component, with either separator
+    IGNORE_PATTERN = re.compile(
+        r'(?:^|[\\/])(?:' + '|'.join(map(re.escape, IGNORED_DIRECTORIES)) + r')(?:[\\/]|$)'
+    )
+
+    # Most files waiting for the worker before flushes wait for room
+    MAX_QUEUED_FILES = 1000
+
     def __init__(self,
                  on_change_callback: Callable[[str], Awaitable[None]],
                  debounce_seconds: float = 0.5):
@@ -29,98 +61,148 @@ class CodeFileHandler(FileSystemEventHandler):
         self.on_change_callback = on_change_callback
         self.debounce_seconds = debounce_seconds
 
-        # Track pending changes for debouncing
-        self._pending_changes: Dict[str, float] = {}
-        self._debounce_task: Optional[asyncio.Task] = None
+        # Files with pending changes, as an insertion-ordered set. No change
+        # times are kept: a flush only runs once the last event is a full
+        # debounce period old, so everything pending is ready by then
+        self._pending_changes: Dict[str, None] = {}
+        # Guards _pending_changes, written on the watchdog thread and swapped
+        # out on the event loop thread
+        self._pending_lock = threading.Lock()
+        self._debounce_handle: Optional[asyncio.TimerHandle] = None
+        # Files handed to the worker, which runs the callback one file at a
+        # time so slow callbacks never hold up debouncing of new events
+        self._work_queue: asyncio.Queue = asyncio.Queue(maxsize=self.MAX_QUEUED_FILES)
+        # Files in the queue that the worker has not started on yet
+        self._queued: Set[str] = set()
         self._event_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Running tasks, referenced so they are not garbage collected early
+        self._tasks: Set[asyncio.Task] = set()
 
         logger.info(f"CodeFileHandler initialized with {debounce_seconds}s debounce")
 
     def set_event_loop(self, loop: asyncio.AbstractEventLoop):
-        """Set the event loop for async operations."""
+        """Set the event loop for async operations and start the worker on it."""
         self._event_loop = loop
+        loop.call_soon_threadsafe(self._create_task, self._process_queue)
+
+    def close(self):
+        """Cancel the debounce timer, the worker and any running tasks."""
+        if self._event_loop and not self._event_loop.is_closed():
+            self._event_loop.call_soon_threadsafe(self._cancel_tasks)
+
+    def _cancel_tasks(self):
+        """Cancel pending work. Must be called on the event loop's thread."""
+        if self._debounce_handle is not None:
+            self._debounce_handle.cancel()
+            self._debounce_handle = None
+        for task in list(self._tasks):
+            task.cancel()
 
     def _should_process_file(self, file_path: str) -> bool:
         """Check if file should be processed."""
-        # Only process Python files
+        # Only process Python files; checked first as it rejects most events
         if not file_path.endswith('.py'):
             return False
 
-        # Ignore common patterns
-        ignore_patterns = [
-            '__pycache__',
-            '.venv',
-            'venv',
-            '.git',
-            '.mypy_cache',
-            '.pytest_cache',
-            'node_modules',
-        ]
-
-        for pattern in ignore_patterns:
-            if pattern in file_path:
-                return False
-
-        return True
+        return self.IGNORE_PATTERN.search(file_path) is None
 
     def _schedule_change(self, file_path: str):
         """Schedule a file change for processing with debouncing."""
         if not self._should_process_file(file_path):
             return
 
-        # Record the change time
-        self._pending_changes[file_path] = time.time()
-
-        # Schedule debounced processing
-        if self._event_loop and not (self._debounce_task and not self._debounce_task.done()):
-            self._debounce_task = asyncio.run_coroutine_threadsafe(
-                self._process_pending_changes(),
-                self._event_loop
-            )
-
-    async def _process_pending_changes(self):
-        """Process pending changes after debounce period."""
-        await asyncio.sleep(self.debounce_seconds)
+        # Record the change; the debounce timer decides when it is processed
+        with self._pending_lock:
+            self._pending_changes[file_path] = None
+
+        # Restart the debounce timer. This runs on the watchdog thread, so
+        # hand the timer to the loop; nothing waits on the result
+        loop = self._event_loop
+        if loop:
+            loop.call_soon_threadsafe(self._reset_debounce_timer)
+
+    def _reset_debounce_timer(self):
+        """Restart the debounce timer. Must be called on the event loop's thread."""
+        if self._debounce_handle is not None:
+            self._debounce_handle.cancel()
+        self._debounce_handle = self._event_loop.call_later(
+            self.debounce_seconds, self._create_task, self._flush_pending_changes
+        )
 
-        current_time = time.time()
-        files_to_process = []
+    def _create_task(self, coro_func: Callable[..., Awaitable[None]], *args):
+        """Start a coroutine as a task. Must be called on the event loop's thread."""
+        # Applied per task rather than with set_task_factory, so the rest of
+        # the application's tasks on this loop keep the default behaviour
+        if _eager_task_factory is not None:
+            task = _eager_task_factory(self._event_loop, coro_func(*args))
+        else:
+            task = self._event_loop.create_task(coro_func(*args))
+        if task.done():
+            return
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
 
-        # Find files that haven't changed in debounce_seconds
-        for file_path, change_time in list(self._pending_changes.items()):
-            if current_time - change_time >= self.debounce_seconds:
-                files_to_process.append(file_path)
-                del self._pending_changes[file_path]
+    async def _flush_pending_changes(self):
+        """Queue all pending changes once no event has arrived for the debounce period."""
+        # Take the whole batch in one swap; changes recorded after this land
+        # in the new dict, and their events have already restarted the timer
+        # for the next flush
+        with self._pending_lock:
+            files_to_process, self._pending_changes = self._pending_changes, {}
 
-        # Process each file
         for file_path in files_to_process:
+            await self._enqueue(file_path)
+
+    async def _enqueue(self, file_path: str):
+        """Hand a file to the worker, waiting for room if the queue is full."""
+        # A file still waiting in the queue will be read when the worker gets
+        # to it, so it already covers this change
+        if file_path in self._queued:
+            return
+        self._queued.add(file_path)
+        await self._work_queue.put(file_path)
+
+    async def _process_queue(self):
+        """Run the change callback for queued files, one at a time, until cancelled."""
+        while True:
+            file_path = await self._work_queue.get()
+            # Changes from here on need another run, so allow requeueing
+            self._queued.discard(file_path)
             try:
-                logger.info(f"Processing file change: {file_path}")
+                logger.info("Processing file change: %s", file_path)
                 await self.on_change_callback(file_path)
             except Exception as e:
                 logger.error(f"Error processing file change {file_path}: {e}", exc_info=True)
+            finally:
+                self._work_queue.task_done()
+
+    def dispatch(self, event):
+        """Drop events for non-Python files before they reach the handlers."""
+        if not event.is_directory and not event.src_path.endswith('.py'):
+            return
+        super().dispatch(event)
 
     def on_modified(self, event):
         """Handle file modification events."""
         if not event.is_directory:
-            logger.debug(f"File modified: {event.src_path}")
+            logger.debug("File modified: %s", event.src_path)
             self._schedule_change(event.src_path)
 
     def on_created(self, event):
         """Handle file creation events."""
         if not event.is_directory:
-            logger.debug(f"File created: {event.src_path}")
+            logger.debug("File created: %s", event.src_path)
             self._schedule_change(event.src_path)
 
     def on_deleted(self, event):
         """Handle file deletion events."""
-        if not event.is_directory and self._should_process_file(event.src_path):
-            logger.info(f"File deleted: {event.src_path}")
-            # For deletions, process immediately without debouncing
-            if self._event_loop:
-                asyncio.run_coroutine_threadsafe(
-                    self.on_change_callback(event.src_path),
-                    self._event_loop
-                )
+        file_path = event.src_path
+        if not event.is_directory and self._should_process_file(file_path):
+            logger.info("File deleted: %s", file_path)
+            # For deletions, queue immediately without debouncing
+            loop = self._event_loop
+            if loop:
+                loop.call_soon_threadsafe(self._create_task, self._enqueue, file_path)
 
 
 class FileWatcher:
@@ -178,12 +260,14 @@ class FileWatcher:
         )
         self.event_handler.set_event_loop(event_loop)
 
-        # Create observer
+        # Create observer. One recursive watch on the root; events from
+        # ignored directories are dropped by the handler
         self.observer = Observer()
         self.observer.schedule(
             self.event_handler,
             self.watch_directory,
-            recursive=True
+            recursive=True,
+            event_filter=CodeFileHandler.HANDLED_EVENTS
         )
 
         # Start observing
@@ -202,6 +286,8 @@ class FileWatcher:
             self.observer.join(timeout=5)
             self.observer = None
 
+        if self.event_handler:
+            self.event_handler.close()
         self.event_handler = None
         self._running = False
 
@@ -5,21 +5,53 @@ This module provides high-level workflow operations that combine multiple
 low-level tools into cohesive processes for LLM code editing.
 """
 
+import hashlib
 import logging
+import uuid
 from typing import Dict, Any, List, Optional
 from datetime import datetime
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from enum import Enum
 
 from .db import CodeGraphDB
 from .parser import PythonParser
 from .builder import GraphBuilder
-from .validators import ConservationValidator
+from .validators import ConservationValidator, Violation
 from .snapshot import SnapshotManager
 
 logger = logging.getLogger(__name__)
 
 
+def _format_violation(v: Violation) -> Dict[str, Any]:
+    """Convert a violation to the dict form used in workflow results."""
+    return {
+        "type": v.violation_type.value,
+        "severity": v.severity,
+        "entity_id": v.entity_id,
+        "message": v.message,
+        "file_path": v.file_path,
+        "line_number": v.line_number,
+        "column_number": v.column_number,
+        "code_snippet": v.code_snippet,
+        "suggested_fix": v.suggested_fix,
+        "details": v.details
+    }
+
+
+def _hash_file(file_path: str) -> Optional[str]:
+    """SHA-1 of a file's contents, or None if it cannot be read."""
+    try:
+        with open(file_path, 'rb') as f:
+            return hashlib.sha1(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def _workflow_id(prefix: str, now: datetime) -> str:
+    """Workflow id from its start time, with a short suffix so ids started in the same second differ."""
+    return f"{prefix}_{now.strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+
+
 class WorkflowStatus(Enum):
     """Status of a workflow execution."""
     PENDING = "pending"
@@ -58,8 +90,13 @@ class WorkflowResult:
     message: str = ""
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary."""
-        result = asdict(self)
+        """
+        Convert to dictionary.
+
+        Field values are already plain lists and dicts, so they are shared
+        rather than deep-copied as asdict() would.
+        """
+        result = dict(self.__dict__)
         result['status'] = self.status.value
         return result
 
@@ -82,6 +119,10 @@ class WorkflowOrchestrator:
 
         logger.info("WorkflowOrchestrator initialized")
 
+    def close(self):
+        """Release external resources held by the orchestrator's validator."""
+        self.validator.close()
+
     def validate_after_edit(
         self,
         file_paths: List[str],
@@ -108,7 +149,8 @@ class WorkflowOrchestrator:
         Returns:
             WorkflowResult with complete analysis
         """
-        workflow_id = f"workflow_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        now = datetime.now()
+        workflow_id = _workflow_id("workflow", now)
         steps_completed = []
 
         logger.info(f"Starting workflow {workflow_id}: validate_after_edit")
@@ -118,10 +160,9 @@ class WorkflowOrchestrator:
             # Get previous snapshot if comparing
             previous_snapshot_id = None
             if compare_with_previous:
-                snapshots = self.snapshot_manager.list_snapshots()
-                if snapshots:
-                    # Get the most recent snapshot
-                    previous_snapshot_id = snapshots[-1].snapshot_id
+                # Get the most recent snapshot
+                previous_snapshot_id = self.snapshot_manager.get_latest_snapshot_id()
+                if previous_snapshot_id:
                     logger.info(f"Will compare with previous snapshot: {previous_snapshot_id}")
 
             # Step 1: Re-index all modified files
@@ -129,19 +170,22 @@ class WorkflowOrchestrator:
             total_entities = 0
             total_relationships = 0
 
+            all_entities: Dict[str, Any] = {}
+            all_relationships: List[Any] = []
             for file_path in file_paths:
-                # Delete old nodes from this file
-                self.db.delete_nodes_from_file(file_path)
-
-                # Parse and build graph
                 entities, relationships = self.parser.parse_file(file_path)
-                self.builder.build_graph(entities, relationships)
+                all_entities.update(entities)
+                all_relationships.extend(relationships)
 
                 total_entities += len(entities)
                 total_relationships += len(relationships)
 
-                logger.info(f"Re-indexed {file_path}: {len(entities)} entities, {len(relationships)} relationships")
+                logger.info(f"Parsed {file_path}: {len(entities)} entities, {len(relationships)} relationships")
 
+            # Delete the old nodes of every file in one query, then build the
+            # new ones together so relationships between edited files resolve
+            self.db.delete_nodes_from_files(file_paths)
+            self.builder.build_graph(all_entities, all_relationships)
             steps_completed.append("re-indexing")
 
             # Step 2: Create new snapshot
@@ -180,20 +224,7 @@ class WorkflowOrchestrator:
             validation_report = self.validator.get_validation_report()
 
             # Format violations
-            formatted_violations = []
-            for v in validation_report['violations']:
-                formatted_violations.append({
-                    "type": v.violation_type.value,
-                    "severity": v.severity,
-                    "entity_id": v.entity_id,
-                    "message": v.message,
-                    "file_path": v.file_path,
-                    "line_number": v.line_number,
-                    "column_number": v.column_number,
-                    "code_snippet": v.code_snippet,
-                    "suggested_fix": v.suggested_fix,
-                    "details": v.details
-                })
+            formatted_violations = [_format_violation(v) for v in validation_report['violations']]
 
             steps_completed.append("validation")
 
@@ -212,7 +243,7 @@ class WorkflowOrchestrator:
             result = WorkflowResult(
                 workflow_id=workflow_id,
                 status=WorkflowStatus.COMPLETED,
-                timestamp=datetime.now().isoformat(),
+                timestamp=now.isoformat(),
                 steps_completed=steps_completed,
                 entities_indexed=total_entities,
                 relationships_indexed=total_relationships,
@@ -236,7 +267,7 @@ class WorkflowOrchestrator:
             return WorkflowResult(
                 workflow_id=workflow_id,
                 status=WorkflowStatus.FAILED,
-                timestamp=datetime.now().isoformat(),
+                timestamp=now.isoformat(),
                 steps_completed=steps_completed,
                 entities_indexed=0,
                 relationships_indexed=0,
@@ -266,7 +297,8 @@ class WorkflowOrchestrator:
         Returns:
             WorkflowResult with baseline snapshot info
         """
-        workflow_id = f"prepare_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        now = datetime.now()
+        workflow_id = _workflow_id("prepare", now)
 
         logger.info(f"Starting workflow {workflow_id}: prepare_for_editing")
         logger.info(f"Files to be edited: {file_paths}")
@@ -279,17 +311,12 @@ class WorkflowOrchestrator:
             logger.info(f"Created baseline snapshot: {snapshot_id}")
 
             # Get current stats
-            stats = self.db.get_statistics()
-            relationship_total = stats.get("Relationships", 0)
-            node_total = sum(
-                count for key, count in stats.items()
-                if key != "Relationships"
-            )
+            node_total, relationship_total = self.db.get_counts()
 
             result = WorkflowResult(
                 workflow_id=workflow_id,
                 status=WorkflowStatus.COMPLETED,
-                timestamp=datetime.now().isoformat(),
+                timestamp=now.isoformat(),
                 steps_completed=["baseline_snapshot"],
                 entities_indexed=node_total,
                 relationships_indexed=relationship_total,
@@ -311,7 +338,7 @@ class WorkflowOrchestrator:
             return WorkflowResult(
                 workflow_id=workflow_id,
                 status=WorkflowStatus.FAILED,
-                timestamp=datetime.now().isoformat(),
+                timestamp=now.isoformat(),
                 steps_completed=[],
                 entities_indexed=0,
                 relationships_indexed=0,
@@ -345,13 +372,35 @@ class WorkflowOrchestrator:
         logger.info(f"Starting iterative fix loop for {file_paths}")
 
         iterations = []
+        # Content hash per file as of its last re-index in this loop
+        file_hashes: Dict[str, Optional[str]] = {}
+        # (entity_id, type) of each violation in the previous iteration
+        previous_signature = None
+        stalled = False
 
         for i in range(max_iterations):
             logger.info(f"Iteration {i + 1}/{max_iterations}")
 
+            # Re-index every file on the first pass, afterwards only files
+            # whose contents changed since they were last indexed
+            changed_files = []
+            for file_path in file_paths:
+                file_hash = _hash_file(file_path)
+                if i == 0 or file_hashes.get(file_path) != file_hash:
+                    changed_files.append(file_path)
+                file_hashes[file_path] = file_hash
+
+            if i > 0:
+                logger.info(f"{len(changed_files)} of {len(file_paths)} file(s) changed since last iteration")
+                # Nothing to re-index means validation would repeat the last result
+                if not changed_files:
+                    logger.info("No files changed since last iteration, stopping")
+                    stalled = True
+                    break
+
             # Validate current state
             result = self.validate_after_edit(
-                file_paths=file_paths,
+                file_paths=changed_files,
                 description=f"Iteration {i + 1}",
                 create_snapshot=True,
                 compare_with_previous=i > 0
@@ -370,6 +419,14 @@ class WorkflowOrchestrator:
                 logger.info(f"✅ Code is valid after {i + 1} iteration(s)")
                 break
 
+            # Stop once an iteration leaves exactly the same violations
+            signature = frozenset((v["entity_id"], v["type"]) for v in result.violations)
+            if signature == previous_signature:
+                logger.info(f"⚠️ Violations unchanged after {i + 1} iteration(s), stopping")
+                stalled = True
+                break
+            previous_signature = signature
+
             logger.info(f"⚠️ Found {result.errors} error(s), continuing...")
 
         final_iteration = iterations[-1]
@@ -380,5 +437,6 @@ class WorkflowOrchestrator:
             "final_errors": final_iteration["errors"],
             "final_warnings": final_iteration["warnings"],
             "iterations": iterations,
-            "converged": final_iteration["is_valid"]
+            "converged": final_iteration["is_valid"],
+            "stalled": stalled
         }
@@ -17,9 +17,12 @@ This file tests CodeGraph's ability to handle:
 """
 
 from abc import ABC, abstractmethod
-from typing import TypeVar, Generic, List, Callable, Optional
-from functools import wraps
+from typing import TypeVar, Generic, Iterable, List, Callable, Optional
+from functools import lru_cache, reduce, wraps
 import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
 
 
 # ============================================================================
@@ -29,6 +32,8 @@ import asyncio
 class Animal(ABC):
     """Abstract base class."""
 
+    __slots__ = ('name',)
+
     def __init__(self, name: str):
         self.name = name
 
@@ -49,6 +54,8 @@ class Animal(ABC):
 class Flyer:
     """Mixin for flying animals."""
 
+    __slots__ = ()
+
     def fly(self) -> str:
         return f"{self.name} is flying"
 
@@ -56,6 +63,8 @@ class Flyer:
 class Swimmer:
     """Mixin for swimming animals."""
 
+    __slots__ = ()
+
     def swim(self) -> str:
         return f"{self.name} is swimming"
 
@@ -63,6 +72,8 @@ class Swimmer:
 class Duck(Flyer, Swimmer, Animal):
     """Duck has multiple inheritance - can fly and swim."""
 
+    __slots__ = ()
+
     def make_sound(self) -> str:
         return "Quack!"
 
@@ -77,6 +88,8 @@ class Duck(Flyer, Swimmer, Animal):
 class Dog(Animal):
     """Simple single inheritance."""
 
+    __slots__ = ()
+
     def make_sound(self) -> str:
         return "Woof!"
 
@@ -90,7 +103,7 @@ def log_calls(func: Callable) -> Callable:
     @wraps(func)
     def wrapper(*args, **kwargs):
         result = func(*args, **kwargs)
-        print(f"Called {func.__name__} with result: {result}")
+        logger.debug("Called %s with result: %s", func.__name__, result)
         return result
     return wrapper
 
@@ -98,6 +111,8 @@ def log_calls(func: Callable) -> Callable:
 class Calculator:
     """Demonstrates property, staticmethod, classmethod."""
 
+    __slots__ = ('_name', '_value')
+
     _instance_count = 0
 
     def __init__(self, name: str):
@@ -143,8 +158,10 @@ T = TypeVar('T')
 class Stack(Generic[T]):
     """Generic stack implementation."""
 
-    def __init__(self):
-        self._items: List[T] = []
+    __slots__ = ('_items',)
+
+    def __init__(self, items: Iterable[T] = ()):
+        self._items: List[T] = list(items)
 
     def push(self, item: T) -> None:
         self._items.append(item)
@@ -156,9 +173,7 @@ class Stack(Generic[T]):
 
     def transform(self, func: Callable[[T], T]) -> 'Stack[T]':
         """Higher-order method with generics."""
-        new_stack = Stack[T]()
-        new_stack._items = [func(item) for item in self._items]
-        return new_stack
+        return Stack(map(func, self._items))
 
 
 # ============================================================================
@@ -191,33 +206,59 @@ def deeply_nested(a: int) -> int:
 # 6. RECURSIVE FUNCTIONS
 # ============================================================================
 
+# 0! through 20!, the factorials that fit in 64 bits, built once at import
+_FACTORIALS = [1]
+for _i in range(1, 21):
+    _FACTORIALS.append(_FACTORIALS[-1] * _i)
+_FACTORIALS = tuple(_FACTORIALS)
+del _i
+
+
 def factorial(n: int) -> int:
-    """Classic recursion."""
-    if n <= 1:
+    """Factorial from the precomputed table, or a loop past its end."""
+    if n < 0:
         return 1
-    return n * factorial(n - 1)
+    if n < len(_FACTORIALS):
+        return _FACTORIALS[n]
+    result = _FACTORIALS[-1]
+    for i in range(len(_FACTORIALS), n + 1):
+        result *= i
+    return result
 
 
+@lru_cache(maxsize=None)
 def fibonacci(n: int) -> int:
-    """Fibonacci recursion."""
+    """Fibonacci recursion, memoized so each n is computed once."""
     if n <= 1:
         return n
     return fibonacci(n - 1) + fibonacci(n - 2)
 
 
-# Mutual recursion
-def is_even(n: int) -> bool:
-    """Mutual recursion - calls is_odd."""
+# Mutual recursion. Depth grows with n, so keep n small
+@lru_cache(maxsize=None)
+def is_even_recursive(n: int) -> bool:
+    """Mutual recursion - calls is_odd_recursive."""
     if n == 0:
         return True
-    return is_odd(n - 1)
+    return is_odd_recursive(n - 1)
 
 
-def is_odd(n: int) -> bool:
-    """Mutual recursion - calls is_even."""
+@lru_cache(maxsize=None)
+def is_odd_recursive(n: int) -> bool:
+    """Mutual recursion - calls is_even_recursive."""
     if n == 0:
         return False
-    return is_even(n - 1)
+    return is_even_recursive(n - 1)
+
+
+def is_even(n: int) -> bool:
+    """Parity check in constant time and stack depth."""
+    return n % 2 == 0
+
+
+def is_odd(n: int) -> bool:
+    """Parity check in constant time and stack depth."""
+    return n % 2 == 1
 
 
 # ============================================================================
@@ -225,9 +266,8 @@ def is_odd(n: int) -> bool:
 # ============================================================================
 
 def count_up_to(n: int):
-    """Simple generator."""
-    for i in range(n):
-        yield i
+    """Simple generator, delegating iteration to range."""
+    yield from range(n)
 
 
 def fibonacci_gen():
@@ -240,8 +280,8 @@ def fibonacci_gen():
 
 def generator_pipeline(data: List[int]):
     """Generator that calls another generator."""
-    for item in count_up_to(len(data)):
-        yield data[item] * 2
+    for _, item in zip(count_up_to(len(data)), data):
+        yield item * 2
 
 
 # ============================================================================
@@ -255,12 +295,8 @@ async def fetch_data(url: str) -> str:
 
 
 async def fetch_multiple(urls: List[str]) -> List[str]:
-    """Async function calling async function."""
-    results = []
-    for url in urls:
-        data = await fetch_data(url)
-        results.append(data)
-    return results
+    """Async function calling async function, fetching all urls concurrently."""
+    return list(await asyncio.gather(*(fetch_data(url) for url in urls)))
 
 
 async def process_async(urls: List[str]) -> str:
@@ -288,12 +324,7 @@ def filter_map_reduce(items: List[int],
                       transformer: Callable[[int], int],
                       reducer: Callable[[int, int], int]) -> int:
     """Combines filter, map, and reduce."""
-    filtered = filter(predicate, items)
-    mapped = map(transformer, filtered)
-    result = 0
-    for item in mapped:
-        result = reducer(result, item)
-    return result
+    return reduce(reducer, (transformer(item) for item in items if predicate(item)), 0)
 
 
 # ============================================================================
@@ -301,14 +332,14 @@ def filter_map_reduce(items: List[int],
 # ============================================================================
 
 # Lambdas in variables
-square = lambda x: x ** 2
+square = lambda x: x * x
 add_ten = lambda x: x + 10
 
 # Lambda in dict
 operations = {
     'double': lambda x: x * 2,
     'triple': lambda x: x * 3,
-    'square': lambda x: x ** 2,
+    'square': lambda x: x * x,
 }
 
 
@@ -324,6 +355,8 @@ def use_lambda(op_name: str, value: int) -> int:
 class FileHandler:
     """Context manager class."""
 
+    __slots__ = ('filename', 'file')
+
     def __init__(self, filename: str):
         self.filename = filename
         self.file = None
@@ -439,17 +472,23 @@ def helper_b() -> str:
 # 15. ORCHESTRATOR - Complex call graph
 # ============================================================================
 
+@lru_cache(maxsize=1)
+def build_fixtures() -> tuple:
+    """Build the stateless objects orchestrator uses once and reuse them."""
+    return Duck("Donald"), Dog("Rex"), Child()
+
+
 def orchestrator() -> dict:
     """Main function that calls many others - creates complex graph."""
+    duck, dog, child = build_fixtures()
 
     # Abstract classes and multiple inheritance
-    duck = Duck("Donald")
     duck_actions = duck.do_everything()  # Calls Animal.describe, Flyer.fly, Swimmer.swim
 
-    dog = Dog("Rex")
     dog_sound = dog.make_sound()
 
-    # Decorators
+    # Decorators. Calculators are built on every call so the class-level
+    # instance count keeps growing
     calc = Calculator("main")
     calc_default = Calculator.create_default()  # Static method
     count = Calculator.get_count()  # Class method
@@ -473,8 +512,8 @@ def orchestrator() -> dict:
     fib = fibonacci(8)
 
     # Mutual recursion
-    even = is_even(10)
-    odd = is_odd(9)
+    even = is_even_recursive(10)
+    odd = is_odd_recursive(9)
 
     # Generators
     gen_list = list(count_up_to(5))
@@ -492,7 +531,6 @@ def orchestrator() -> dict:
     chain = chain_start("test")
 
     # Method overriding
-    child = Child()
     override_test = child.method_d()
 
     # Branching
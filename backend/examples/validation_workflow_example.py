@@ -14,21 +14,57 @@ Run this with the backend running on localhost:8000
 
 import requests
 import json
+import os
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
 from typing import Dict, Any
+from urllib3.util.retry import Retry
 
 # API base URL
 BASE_URL = "http://localhost:8000"
 
+# Set VERBOSE=1 to indent printed responses
+VERBOSE = bool(os.environ.get("VERBOSE"))
+
+# Shared HTTP session so every request reuses one pooled keep-alive
+# connection instead of opening a new one. Retries cover only idempotent
+# methods, which is urllib3's default, so edits are never posted twice
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=4,
+    max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+))
+
 
 def pretty_print(title: str, data: Dict[str, Any]):
-    """Print formatted JSON data."""
+    """Print JSON data, indented only in verbose mode."""
     print(f"\n{'='*80}")
     print(f"{title}")
     print(f"{'='*80}")
-    print(json.dumps(data, indent=2))
+    print(json.dumps(data, indent=2 if VERBOSE else None))
     print()
 
 
+def call_api(method: str, url: str, **kwargs) -> Any:
+    """
+    Send a request and return its decoded JSON body.
+
+    The body is streamed, so an error status raises before any of it is
+    read; the response is closed either way, returning the connection to
+    the session's pool.
+    """
+    with SESSION.request(method, url, stream=True, **kwargs) as response:
+        response.raise_for_status()
+        return response.json()
+
+
+@lru_cache(maxsize=1)
+def get_mcp_tools() -> Dict[str, Any]:
+    """Fetch the MCP tool listing once; it does not change while the server runs."""
+    return call_api("GET", f"{BASE_URL}/mcp/tools")
+
+
 def test_validation_workflow():
     """Test the complete validation workflow."""
 
@@ -38,12 +74,11 @@ def test_validation_workflow():
 
     # Step 1: Prepare editing session
     print("\nStep 1: Preparing editing session...")
-    response = requests.post(
+    session_data = call_api(
+        "POST",
         f"{BASE_URL}/session/prepare",
         json={"description": "Add new data processing function"}
     )
-    response.raise_for_status()
-    session_data = response.json()
     session_id = session_data["session_id"]
     pretty_print("Session Prepared", session_data)
 
@@ -77,30 +112,26 @@ def format_results(stats: dict) -> str:
 
     edit_path = "/app/examples/broken_code.py"
 
-    response = requests.post(
+    pretty_print("Edit Added", call_api(
+        "POST",
         f"{BASE_URL}/session/{session_id}/edit",
         json={
             "file_path": edit_path,
             "new_content": broken_code
         }
-    )
-    response.raise_for_status()
-    pretty_print("Edit Added", response.json())
+    ))
 
     # Step 3: Apply edits
     print("\nStep 3: Applying edits to filesystem...")
-    response = requests.post(f"{BASE_URL}/session/{session_id}/apply")
-    response.raise_for_status()
-    pretty_print("Edits Applied", response.json())
+    pretty_print("Edits Applied", call_api("POST", f"{BASE_URL}/session/{session_id}/apply"))
 
     # Step 4: Validate the session
     print("\nStep 4: Validating changes...")
-    response = requests.post(
+    validation_result = call_api(
+        "POST",
         f"{BASE_URL}/session/{session_id}/validate",
         json={"reindex_path": "/app/examples"}
     )
-    response.raise_for_status()
-    validation_result = response.json()
     pretty_print("Validation Result", {
         "session_id": validation_result["session_id"],
         "status": validation_result["status"],
@@ -120,9 +151,7 @@ def format_results(stats: dict) -> str:
     # Step 5: Get detailed fix suggestions
     if not validation_result["safe_to_commit"]:
         print("\nStep 5: Getting fix suggestions...")
-        response = requests.get(f"{BASE_URL}/session/{session_id}/violations")
-        response.raise_for_status()
-        violations = response.json()
+        violations = call_api("GET", f"{BASE_URL}/session/{session_id}/violations")
 
         print("\nDetailed Violations and Fixes:")
         for i, v in enumerate(violations, 1):
@@ -169,35 +198,32 @@ def format_results(stats: dict) -> str:
 '''
 
         # Create new session for the fix
-        response = requests.post(
+        fix_session_id = call_api(
+            "POST",
             f"{BASE_URL}/session/prepare",
             json={"description": "Fix validation errors"}
-        )
-        response.raise_for_status()
-        fix_session_id = response.json()["session_id"]
+        )["session_id"]
 
         # Add the fix
-        response = requests.post(
+        call_api(
+            "POST",
             f"{BASE_URL}/session/{fix_session_id}/edit",
             json={
                 "file_path": edit_path,
                 "new_content": fixed_code
             }
         )
-        response.raise_for_status()
 
         # Apply the fix
-        response = requests.post(f"{BASE_URL}/session/{fix_session_id}/apply")
-        response.raise_for_status()
+        call_api("POST", f"{BASE_URL}/session/{fix_session_id}/apply")
 
         # Validate the fix
         print("\nStep 7: Validating fixes...")
-        response = requests.post(
+        fix_validation = call_api(
+            "POST",
             f"{BASE_URL}/session/{fix_session_id}/validate",
             json={"reindex_path": "/app/examples"}
         )
-        response.raise_for_status()
-        fix_validation = response.json()
         pretty_print("Fix Validation Result", {
             "session_id": fix_validation["session_id"],
             "status": fix_validation["status"],
@@ -208,18 +234,13 @@ def format_results(stats: dict) -> str:
         # Step 8: Commit if validation passes
         if fix_validation["safe_to_commit"]:
             print("\nStep 8: Committing changes...")
-            response = requests.post(f"{BASE_URL}/session/{fix_session_id}/commit")
-            response.raise_for_status()
-            pretty_print("Commit Result", response.json())
+            pretty_print("Commit Result", call_api("POST", f"{BASE_URL}/session/{fix_session_id}/commit"))
         else:
             print("\nStep 8: Still have violations, rolling back...")
-            response = requests.post(f"{BASE_URL}/session/{fix_session_id}/rollback")
-            response.raise_for_status()
-            pretty_print("Rollback Result", response.json())
+            pretty_print("Rollback Result", call_api("POST", f"{BASE_URL}/session/{fix_session_id}/rollback"))
 
         # Rollback original broken session
-        response = requests.post(f"{BASE_URL}/session/{session_id}/rollback")
-        response.raise_for_status()
+        call_api("POST", f"{BASE_URL}/session/{session_id}/rollback")
 
     print("\n" + "="*80)
     print("WORKFLOW DEMONSTRATION COMPLETE")
@@ -235,9 +256,7 @@ def test_mcp_workflow():
 
     # Step 1: Get available MCP tools
     print("\nStep 1: Getting available MCP tools...")
-    response = requests.get(f"{BASE_URL}/mcp/tools")
-    response.raise_for_status()
-    tools_data = response.json()
+    tools_data = get_mcp_tools()
     pretty_print("Available MCP Tools", {
         "server_info": tools_data["server_info"],
         "tools": [
@@ -251,7 +270,8 @@ def test_mcp_workflow():
 
     # Step 2: Prepare session via MCP
     print("\nStep 2: Preparing edit session via MCP...")
-    response = requests.post(
+    result = call_api(
+        "POST",
         f"{BASE_URL}/mcp/execute",
         json={
             "name": "prepare_edit_session",
@@ -260,8 +280,6 @@ def test_mcp_workflow():
             }
         }
     )
-    response.raise_for_status()
-    result = response.json()
     session_info = json.loads(result["content"][0]["text"])
     session_id = session_info["session_id"]
     pretty_print("MCP: Session Prepared", session_info)
@@ -289,7 +307,8 @@ def calculate(x: int, y: int) -> dict:
     }
 '''
 
-    response = requests.post(
+    result = call_api(
+        "POST",
         f"{BASE_URL}/mcp/execute",
         json={
             "name": "apply_and_validate_edit",
@@ -305,15 +324,14 @@ def calculate(x: int, y: int) -> dict:
             }
         }
     )
-    response.raise_for_status()
-    result = response.json()
     validation_info = json.loads(result["content"][0]["text"])
     pretty_print("MCP: Validation Result", validation_info)
 
     # Step 4: Commit via MCP if valid
     if validation_info["safe_to_commit"]:
         print("\nStep 4: Committing via MCP...")
-        response = requests.post(
+        result = call_api(
+            "POST",
             f"{BASE_URL}/mcp/execute",
             json={
                 "name": "commit_session",
@@ -322,13 +340,12 @@ def calculate(x: int, y: int) -> dict:
                 }
             }
         )
-        response.raise_for_status()
-        result = response.json()
         commit_info = json.loads(result["content"][0]["text"])
         pretty_print("MCP: Commit Result", commit_info)
     else:
         print("\nStep 4: Getting fix suggestions via MCP...")
-        response = requests.post(
+        result = call_api(
+            "POST",
             f"{BASE_URL}/mcp/execute",
             json={
                 "name": "get_fix_suggestions",
@@ -337,8 +354,6 @@ def calculate(x: int, y: int) -> dict:
                 }
             }
         )
-        response.raise_for_status()
-        result = response.json()
         fix_info = json.loads(result["content"][0]["text"])
         pretty_print("MCP: Fix Suggestions", fix_info)
 
@@ -363,11 +378,12 @@ if __name__ == "__main__":
     print("\n" + "="*80)
 
     try:
-        # Test regular workflow
-        test_validation_workflow()
+        with SESSION:
+            # Test regular workflow
+            test_validation_workflow()
 
-        # Test MCP workflow
-        test_mcp_workflow()
+            # Test MCP workflow
+            test_mcp_workflow()
 
         print("\n✅ All tests completed successfully!")
 
@@ -11,31 +11,43 @@ from codegraph import CodeGraphDB, PythonParser, GraphBuilder
 
 @pytest.fixture(scope="session")
 def neo4j_test_db() -> Generator[CodeGraphDB, None, None]:
-    """Provides a Neo4j test database instance for the entire test session."""
+    """
+    Provides a Neo4j test database instance for the entire test session.
+
+    The driver's connection pool stays open for the whole session, so tests
+    reuse its connections. Under pytest-xdist each worker process gets its
+    own instance and pool.
+    """
     db = CodeGraphDB(
         uri=os.getenv("NEO4J_URI", "bolt://localhost:7687"),
         user=os.getenv("NEO4J_USER", "neo4j"),
-        password=os.getenv("NEO4J_PASSWORD", "password")
+        password=os.getenv("NEO4J_PASSWORD", "password"),
+        max_connection_pool_size=int(os.getenv("NEO4J_POOL_SIZE", "10"))
     )
     yield db
     db.close()
 
 
+@pytest.fixture(scope="session")
+def neo4j_schema(neo4j_test_db: CodeGraphDB) -> CodeGraphDB:
+    """Creates indexes and constraints once; clearing data leaves them in place."""
+    neo4j_test_db.initialize_schema()
+    return neo4j_test_db
+
+
 @pytest.fixture(scope="function")
-def clean_db(neo4j_test_db: CodeGraphDB) -> Generator[CodeGraphDB, None, None]:
+def clean_db(neo4j_schema: CodeGraphDB) -> Generator[CodeGraphDB, None, None]:
     """Provides a clean database for each test function."""
     # Clear all data
-    neo4j_test_db.clear_database()
-    # Initialize schema
-    neo4j_test_db.initialize_schema()
-    yield neo4j_test_db
+    neo4j_schema.clear_database()
+    yield neo4j_schema
     # Cleanup after test
-    neo4j_test_db.clear_database()
+    neo4j_schema.clear_database()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def parser() -> PythonParser:
-    """Provides a Python parser instance."""
+    """Provides a Python parser shared across the session (parse_source resets its state)."""
     return PythonParser()
 
 
@@ -55,76 +55,61 @@ if __name__ == "__main__":
     main()
 '''
 
-    # Write test file
-    test_file = "/tmp/test_schema_v2.py"
-    with open(test_file, "w") as f:
-        f.write(test_code)
-
-    # Parse and build graph
+    # Parse from memory under a virtual path and build graph
     parser = PythonParser()
-    entities, relationships = parser.parse_file(test_file)
+    entities, relationships = parser.parse_source(test_code, "test_schema_v2.py")
 
     builder = GraphBuilder(db)
     builder.build_graph(entities, relationships)
 
-    # Clean up
-    os.remove(test_file)
-
     return db
 
 
-class TestSchemaV2Relationships:
-    """Test that v2 schema uses correct relationship types."""
-
-    def test_no_old_relationships(self, sample_graph):
-        """Verify old relationship types don't exist."""
-        # CALLS should not exist
-        result = sample_graph.execute_query(
-            "MATCH ()-[r:CALLS]->() RETURN count(r) as count"
-        )
-        assert result[0]["count"] == 0, "CALLS relationship should not exist in v2"
-
-        # DEFINES should not exist
-        result = sample_graph.execute_query(
-            "MATCH ()-[r:DEFINES]->() RETURN count(r) as count"
-        )
-        assert result[0]["count"] == 0, "DEFINES relationship should not exist in v2"
+@pytest.fixture(scope="module")
+def relationship_counts(sample_graph):
+    """Count relationships of every type in one query; absent types are missing."""
+    result = sample_graph.execute_query(
+        "MATCH ()-[r]->() RETURN type(r) as rel_type, count(r) as count"
+    )
+    return {r["rel_type"]: r["count"] for r in result}
 
-        # CONTAINS should not exist
-        result = sample_graph.execute_query(
-            "MATCH ()-[r:CONTAINS]->() RETURN count(r) as count"
-        )
-        assert result[0]["count"] == 0, "CONTAINS relationship should not exist in v2"
 
-    def test_new_relationships_exist(self, sample_graph):
-        """Verify new relationship types exist."""
-        # RESOLVES_TO should exist (replaces CALLS)
-        result = sample_graph.execute_query(
-            "MATCH ()-[r:RESOLVES_TO]->() RETURN count(r) as count"
-        )
-        assert result[0]["count"] > 0, "RESOLVES_TO relationship should exist in v2"
+@pytest.fixture(scope="module")
+def integrity_counts(sample_graph):
+    """Count nodes breaking each schema integrity rule in a single scan."""
+    result = sample_graph.execute_query("""
+        MATCH (n)
+        RETURN sum(CASE WHEN size(labels(n)) = 0 THEN 1 ELSE 0 END) as unlabeled_count,
+               sum(CASE WHEN n.id IS NULL THEN 1 ELSE 0 END) as no_id_count,
+               sum(CASE WHEN n:Function AND n.signature IS NULL THEN 1 ELSE 0 END) as no_signature_count
+    """)
+    return result[0]
 
-        # DECLARES should exist (replaces DEFINES)
-        result = sample_graph.execute_query(
-            "MATCH ()-[r:DECLARES]->() RETURN count(r) as count"
-        )
-        assert result[0]["count"] > 0, "DECLARES relationship should exist in v2"
 
-        # HAS_CALLSITE should exist
-        result = sample_graph.execute_query(
-            "MATCH ()-[r:HAS_CALLSITE]->() RETURN count(r) as count"
-        )
-        assert result[0]["count"] > 0, "HAS_CALLSITE relationship should exist in v2"
+class TestSchemaV2Relationships:
+    """Test that v2 schema uses correct relationship types."""
 
-    def test_relationship_count(self, sample_graph):
+    @pytest.mark.parametrize("rel_type,should_exist", [
+        # Old types replaced in v2
+        ("CALLS", False),
+        ("DEFINES", False),
+        ("CONTAINS", False),
+        # RESOLVES_TO replaces CALLS, DECLARES replaces DEFINES
+        ("RESOLVES_TO", True),
+        ("DECLARES", True),
+        ("HAS_CALLSITE", True),
+    ])
+    def test_relationship_type_presence(self, relationship_counts, rel_type, should_exist):
+        """Verify old relationship types are gone and new ones exist."""
+        count = relationship_counts.get(rel_type, 0)
+        if should_exist:
+            assert count > 0, f"{rel_type} relationship should exist in v2"
+        else:
+            assert count == 0, f"{rel_type} relationship should not exist in v2"
+
+    def test_relationship_count(self, relationship_counts):
         """Verify we have exactly 14 relationship types."""
-        result = sample_graph.execute_query("""
-            MATCH ()-[r]->()
-            RETURN DISTINCT type(r) as rel_type
-            ORDER BY rel_type
-        """)
-
-        rel_types = [r["rel_type"] for r in result]
+        rel_types = sorted(relationship_counts)
 
         # v2 schema should have at most 14 types
         assert len(rel_types) <= 14, f"Expected max 14 relationship types, got {len(rel_types)}: {rel_types}"
@@ -274,32 +259,17 @@ class TestQueryInterface:
 class TestSchemaIntegrity:
     """Test overall schema integrity."""
 
-    def test_all_nodes_have_labels(self, sample_graph):
+    def test_all_nodes_have_labels(self, integrity_counts):
         """Verify all nodes have at least one label."""
-        result = sample_graph.execute_query("""
-            MATCH (n)
-            WHERE size(labels(n)) = 0
-            RETURN count(n) as unlabeled_count
-        """)
-        assert result[0]["unlabeled_count"] == 0, "All nodes should have labels"
+        assert integrity_counts["unlabeled_count"] == 0, "All nodes should have labels"
 
-    def test_all_nodes_have_ids(self, sample_graph):
+    def test_all_nodes_have_ids(self, integrity_counts):
         """Verify all nodes have id property."""
-        result = sample_graph.execute_query("""
-            MATCH (n)
-            WHERE n.id IS NULL
-            RETURN count(n) as no_id_count
-        """)
-        assert result[0]["no_id_count"] == 0, "All nodes should have id property"
+        assert integrity_counts["no_id_count"] == 0, "All nodes should have id property"
 
-    def test_function_signature_conservation(self, sample_graph):
+    def test_function_signature_conservation(self, integrity_counts):
         """Verify functions have signatures."""
-        result = sample_graph.execute_query("""
-            MATCH (f:Function)
-            WHERE f.signature IS NULL
-            RETURN count(f) as no_signature_count
-        """)
-        assert result[0]["no_signature_count"] == 0, "All functions should have signatures"
+        assert integrity_counts["no_signature_count"] == 0, "All functions should have signatures"
 
 
 if __name__ == "__main__":
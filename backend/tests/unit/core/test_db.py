@@ -105,6 +105,20 @@ class TestNodeOperations:
 
         assert len(result) == 0
 
+    def test_delete_nodes_from_files(self, clean_db):
+        """Test deleting the nodes of several files in one call."""
+        clean_db.execute_query("""
+            CREATE (:Function {id: 'a', location: '/src/a.py:1:0'}),
+                   (:Function {id: 'b', location: '/src/b.py:1:0'}),
+                   (:Function {id: 'c', location: '/src/c.py:1:0'})
+        """)
+
+        deleted = clean_db.delete_nodes_from_files(['/src/a.py', '/src/b.py'])
+
+        result = clean_db.execute_query("MATCH (n:Function) RETURN n.id as id")
+        assert deleted == 2
+        assert [r['id'] for r in result] == ['c']
+
     def test_find_nodes_by_type(self, clean_db):
         """Test finding nodes by type."""
         # Create multiple nodes
@@ -212,6 +226,35 @@ class TestQueryExecution:
         with pytest.raises(Exception):
             clean_db.execute_query("INVALID CYPHER QUERY")
 
+    def test_execute_query_stream(self, clean_db):
+        """Test streaming query results lazily."""
+        records = clean_db.execute_query_stream("UNWIND range(1, 3) as value RETURN value")
+        assert next(records) == {"value": 1}
+        assert [record["value"] for record in records] == [2, 3]
+
+    def test_get_counts(self, clean_db):
+        """Test entity and relationship totals match the per-label statistics."""
+        clean_db.execute_query("""
+            CREATE (f:Function {id: 'f1'})-[:HAS_PARAMETER]->(p:Parameter {id: 'p1'}),
+                   (:Class {id: 'c1'}),
+                   (:CallSite {id: 'cs1'})
+        """)
+
+        stats = clean_db.get_statistics()
+        node_count, relationship_count = clean_db.get_counts()
+
+        assert node_count == sum(v for k, v in stats.items() if k != "Relationships") == 3
+        assert relationship_count == stats["Relationships"] == 1
+
+    def test_execute_queries_preserves_order(self, clean_db):
+        """Test running independent queries concurrently."""
+        results = clean_db.execute_queries([
+            ("RETURN 1 as value", None),
+            ("RETURN $value as value", {"value": 2}),
+        ])
+
+        assert [r[0]["value"] for r in results] == [1, 2]
+
 
 @pytest.mark.unit
 @pytest.mark.requires_neo4j
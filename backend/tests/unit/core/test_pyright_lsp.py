@@ -0,0 +1,193 @@
+"""
+Unit tests for the pyright language server client.
+
+Uses a minimal stand-in server speaking LSP over stdio, so pyright itself
+does not need to be installed.
+"""
+
+import sys
+import pytest
+from codegraph.pyright_lsp import PyrightLanguageServer
+
+
+FAKE_SERVER = r'''
+import json
+import os
+import sys
+from urllib.parse import urlparse
+from urllib.request import url2pathname
+
+stdin, stdout = sys.stdin.buffer, sys.stdout.buffer
+
+def read():
+    length = None
+    while True:
+        line = stdin.readline()
+        if not line:
+            return None
+        if not line.strip():
+            break
+        name, _, value = line.decode().partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    return json.loads(stdin.read(length))
+
+def send(message):
+    body = json.dumps(message).encode()
+    stdout.write(b"Content-Length: %d\r\n\r\n" % len(body) + body)
+    stdout.flush()
+
+documents = {}  # uri -> open document text
+disk = {}  # uri -> file text as last read from disk
+
+def current_text(uri):
+    if uri in documents:
+        return documents[uri]
+    if uri not in disk:
+        path = url2pathname(urlparse(uri).path)
+        disk[uri] = open(path).read() if os.path.exists(path) else ""
+    return disk[uri]
+
+def diagnose(uri):
+    # One error per line containing "bad", or "use <file>" naming a bad file
+    items = []
+    for i, line in enumerate(current_text(uri).splitlines()):
+        if line.startswith("use "):
+            target = uri.rsplit("/", 1)[0] + "/" + line[4:].strip()
+            bad = "bad" in current_text(target)
+        else:
+            bad = "bad" in line
+        if bad:
+            items.append({"range": {"start": {"line": i, "character": 0}, "end": {"line": i, "character": 3}},
+                          "severity": 1, "code": "reportFake", "message": "bad line"})
+    return items
+
+while True:
+    message = read()
+    if message is None:
+        break
+    method = message.get("method")
+    params = message.get("params") or {}
+    if method == "initialize":
+        send({"jsonrpc": "2.0", "id": message["id"], "result": {"capabilities": {}}})
+    elif method == "shutdown":
+        send({"jsonrpc": "2.0", "id": message["id"], "result": None})
+    elif method == "exit":
+        break
+    elif method == "textDocument/didOpen":
+        doc = params["textDocument"]
+        documents[doc["uri"]] = doc["text"]
+    elif method == "textDocument/didChange":
+        documents[params["textDocument"]["uri"]] = params["contentChanges"][-1]["text"]
+    elif method == "textDocument/didClose":
+        documents.pop(params["textDocument"]["uri"], None)
+    elif method == "workspace/didChangeWatchedFiles":
+        for change in params["changes"]:
+            disk.pop(change["uri"], None)
+    elif method == "textDocument/diagnostic":
+        items = diagnose(params["textDocument"]["uri"])
+        send({"jsonrpc": "2.0", "id": message["id"], "result": {"kind": "full", "items": items}})
+'''
+
+
+@pytest.fixture
+def server(tmp_path):
+    """Language server client backed by the stand-in server script."""
+    script = tmp_path / "fake_server.py"
+    script.write_text(FAKE_SERVER)
+    client = PyrightLanguageServer(command=[sys.executable, str(script)], root_path=str(tmp_path))
+    yield client
+    client.close()
+
+
+@pytest.mark.unit
+class TestPyrightLanguageServer:
+    """Tests for the persistent pyright language server client."""
+
+    def test_reports_diagnostics_in_cli_format(self, server, tmp_path):
+        """Published diagnostics are converted to pyright --outputjson entries."""
+        path = tmp_path / "mod.py"
+        path.write_text("ok = 1\nbad = 2\n")
+
+        diagnostics = server.check_files([str(path)], timeout=10)
+
+        assert server.running
+        assert diagnostics == [{
+            "file": str(path),
+            "severity": "error",
+            "message": "bad line",
+            "range": {"start": {"line": 1, "character": 0}, "end": {"line": 1, "character": 3}},
+            "rule": "reportFake",
+        }]
+
+    def test_changed_file_is_rechecked(self, server, tmp_path):
+        """Edits are sent as new document versions before diagnostics are pulled."""
+        path = tmp_path / "mod.py"
+        path.write_text("bad = 1\n")
+        assert len(server.check_files([str(path)], timeout=10)) == 1
+
+        path.write_text("ok = 1\n")
+        assert server.check_files([str(path)], timeout=10) == []
+        assert server._documents[str(path)]["version"] == 2
+
+    def test_unchanged_file_reuses_diagnostics(self, server, tmp_path):
+        """Unchanged files are not re-sent to the server."""
+        path = tmp_path / "mod.py"
+        path.write_text("bad = 1\n")
+        first = server.check_files([str(path)], timeout=10)
+
+        assert server.check_files([str(path)], timeout=10) == first
+        assert server._documents[str(path)]["version"] == 1
+
+    def test_dependency_change_refreshes_unchanged_file(self, server, tmp_path):
+        """An unchanged file is re-diagnosed when a file it uses changes."""
+        user, dep = tmp_path / "a.py", tmp_path / "b.py"
+        user.write_text("use b.py\n")
+        dep.write_text("ok = 1\n")
+        assert server.check_files([str(user), str(dep)], timeout=10) == []
+
+        dep.write_text("bad = 1\n")
+        diagnostics = server.check_files([str(user), str(dep)], timeout=10)
+
+        assert sorted(d["file"] for d in diagnostics) == [str(user), str(dep)]
+
+    def test_disk_change_to_unrequested_file_is_reported(self, server, tmp_path):
+        """Open files changed on disk are closed and reported as watched-file changes."""
+        user, dep = tmp_path / "a.py", tmp_path / "b.py"
+        user.write_text("use b.py\n")
+        dep.write_text("ok = 1\n")
+        server.check_files([str(user), str(dep)], timeout=10)
+
+        dep.write_text("bad = 1\n")
+        diagnostics = server.check_files([str(user)], timeout=10)
+
+        assert [d["file"] for d in diagnostics] == [str(user)]
+        assert str(dep) not in server._documents
+
+    def test_restart_after_crash_reopens_files(self, server, tmp_path):
+        """A server that died without close() gets every file opened again."""
+        path = tmp_path / "mod.py"
+        path.write_text("bad = 1\n")
+        server.check_files([str(path)], timeout=10)
+
+        server._proc.kill()
+        server._proc.wait()
+        sent = []
+        notify = server._notify
+        server._notify = lambda method, params: (sent.append(method), notify(method, params))
+
+        diagnostics = server.check_files([str(path)], timeout=10)
+
+        assert "textDocument/didOpen" in sent
+        assert [d["file"] for d in diagnostics] == [str(path)]
+
+    def test_close_stops_server(self, server, tmp_path):
+        """close() shuts the process down and forgets opened documents."""
+        path = tmp_path / "mod.py"
+        path.write_text("ok = 1\n")
+        server.check_files([str(path)], timeout=10)
+
+        server.close()
+
+        assert not server.running
+        assert server._documents == {}
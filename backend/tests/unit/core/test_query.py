@@ -2,6 +2,7 @@
 
 import pytest
 from codegraph import CodeGraphDB, QueryInterface, PythonParser, GraphBuilder
+from codegraph.query import find_cycles
 
 
 @pytest.fixture
@@ -11,7 +12,7 @@ def query_interface(clean_db):
 
 
 @pytest.fixture
-def populated_db(clean_db, temp_file):
+def populated_db(clean_db):
     """Provide a database populated with test data."""
     code = '''
 class Calculator:
@@ -32,10 +33,8 @@ def main():
     product = calc.multiply(result, 2)
     return product
 '''
-    temp_file.write_text(code)
-
     parser = PythonParser()
-    entities, relationships = parser.parse_file(str(temp_file))
+    entities, relationships = parser.parse_source(code, "test_file.py")
     builder = GraphBuilder(clean_db)
     builder.build_graph(entities, relationships)
 
@@ -179,3 +178,35 @@ class TestStatistics:
         """)
 
         assert result[0]['count'] >= 0
+
+
+@pytest.mark.unit
+class TestFindCycles:
+    """Tests for cycle detection over edge lists."""
+
+    def test_one_cycle_per_component(self):
+        """Each strongly connected component yields its shortest cycle once."""
+        edges = [("A", "B"), ("B", "C"), ("C", "A"), ("B", "A"), ("C", "D"), ("E", "E")]
+
+        assert find_cycles(edges) == [["A", "B", "A"], ["E", "E"]]
+
+    def test_acyclic_graph(self):
+        """A DAG, including diamonds, has no cycles."""
+        edges = [("A", "B"), ("A", "C"), ("B", "D"), ("C", "D")]
+
+        assert find_cycles(edges) == []
+
+    def test_include_selects_start(self):
+        """Only components with an accepted node are reported, starting from it."""
+        edges = [("A", "B"), ("B", "A"), ("X", "Y"), ("Y", "X")]
+
+        assert find_cycles(edges, include=lambda node: node in ("B", "Q")) == [["B", "A", "B"]]
+
+    def test_long_chain_does_not_recurse(self):
+        """Deep graphs are handled without hitting the recursion limit."""
+        edges = [(str(i), str(i + 1)) for i in range(5000)] + [("5000", "0")]
+
+        cycles = find_cycles(edges)
+
+        assert len(cycles) == 1
+        assert len(cycles[0]) == 5002
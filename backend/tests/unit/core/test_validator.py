@@ -1,7 +1,10 @@
 """Unit tests for conservation law validators."""
 
+import sys
+import threading
 import pytest
 from codegraph.validators import (
+    ChangedFrontier,
     ConservationValidator,
     Violation,
     ViolationType
@@ -420,6 +423,42 @@ def func2():
         # Should validate successfully
         assert isinstance(violations, list)
 
+    def test_incremental_reports_changed_file_violations(self, validator, clean_db, temp_file):
+        """validate_incremental finds arity, reference and inheritance errors in changed nodes."""
+        code = '''
+def add(a, b):
+    """Add two numbers."""
+    return a + b
+
+def main():
+    """Call add with too few arguments and an undefined helper."""
+    add(1)
+    missing_helper()
+
+class Left(Right):
+    """Half of an inheritance cycle."""
+
+class Right(Left):
+    """Other half of the cycle."""
+'''
+        temp_file.write_text(code)
+
+        parser = PythonParser()
+        entities, relationships = parser.parse_file(str(temp_file))
+        builder = GraphBuilder(clean_db)
+        builder.build_graph(entities, relationships)
+
+        clean_db.mark_file_nodes_changed(str(temp_file))
+        clean_db.propagate_changed_flag()
+
+        violations = validator.validate_incremental()
+        messages = [v.message for v in violations]
+
+        arity = [v for v in violations if v.violation_type == ViolationType.SIGNATURE_MISMATCH]
+        assert any(v.details["function"].endswith(".add") and v.details["actual_args"] == 1 for v in arity)
+        assert "Unresolved call to: missing_helper" in messages
+        assert any(m.startswith("Circular inheritance detected:") for m in messages)
+
 
 @pytest.mark.unit
 class TestComplexValidation:
@@ -509,3 +548,732 @@ class Child(Parent):
 
         # Matching signatures should not produce violations
         assert isinstance(violations, list)
+
+
+@pytest.fixture
+def stub_db():
+    """Provide a mocked CodeGraphDB that returns no rows unless configured."""
+    from unittest.mock import MagicMock
+
+    db = MagicMock(spec=CodeGraphDB)
+    db.execute_query.return_value = []
+    db.execute_queries.side_effect = lambda queries: [
+        db.execute_query(query, parameters) for query, parameters in queries
+    ]
+    db.execute_query_stream.side_effect = lambda query, parameters=None: iter(
+        db.execute_query(query, parameters)
+    )
+    return db
+
+
+@pytest.fixture
+def stub_validator(stub_db):
+    """Provide a validator backed by the mocked database."""
+    return ConservationValidator(stub_db)
+
+
+@pytest.mark.unit
+class TestReturnTypeConsistency:
+    """Tests for the return-type checks backed by the function return view."""
+
+    def test_view_shared_between_checks(self, stub_validator, stub_db):
+        """Return annotation and consistency checks reuse one function scan."""
+        stub_db.execute_query.side_effect = [[{"count": 5}], []]
+
+        stub_validator._reset_type_caches()
+        stub_validator._check_return_type_consistency()
+        stub_validator._get_function_return_view()
+
+        assert stub_db.execute_query.call_count == 2
+
+    def test_pages_through_functions(self, stub_validator, stub_db, monkeypatch):
+        """Large graphs are fetched in SKIP/LIMIT pages."""
+        monkeypatch.setattr(stub_validator, "QUERY_PAGE_SIZE", 2)
+        stub_db.execute_query.side_effect = [[{"count": 5}], [], [], []]
+
+        stub_validator._check_return_type_consistency()
+
+        pages = [c[0][1] for c in stub_db.execute_query.call_args_list[1:]]
+        assert pages == [
+            {"skip": 0, "limit": 2},
+            {"skip": 2, "limit": 2},
+            {"skip": 4, "limit": 2},
+        ]
+
+    def test_flags_multiple_and_missing_return_types(self, stub_validator, stub_db):
+        """Multiple RETURNS_TYPE targets and missing edges produce their own violations."""
+        rows = [
+            {
+                "f": {"id": "f1", "name": "a", "qualified_name": "m.a"},
+                "return_types": ["int", "str"],
+            },
+            {
+                "f": {"id": "f2", "name": "b", "qualified_name": "m.b", "return_type": "int"},
+                "return_types": [],
+            },
+            {
+                "f": {"id": "f3", "name": "c", "qualified_name": "m.c", "return_type": "int"},
+                "return_types": ["int"],
+            },
+        ]
+        stub_db.execute_query.side_effect = [[{"count": 3}], rows]
+
+        violations = stub_validator._check_return_type_consistency()
+
+        assert [v.entity_id for v in violations] == ["f1", "f2"]
+        assert violations[0].details["types"] == ["int", "str"]
+        assert violations[1].details["declared_type"] == "int"
+
+
+@pytest.mark.unit
+class TestEdgeTypeValidation:
+    """Tests for the batched edge-schema check."""
+
+    def test_single_parameterized_query(self, stub_validator, stub_db):
+        """All edge types are checked in one query with the schema as a parameter."""
+        stub_validator.validate_edge_types()
+
+        assert stub_db.execute_query.call_count == 1
+        params = stub_db.execute_query.call_args[0][1]
+        assert params["schema"]["HAS_PARAMETER"] == {
+            "allowed_from": ["Function"],
+            "allowed_to": ["Parameter"],
+        }
+
+    def test_each_edge_type_is_matched_and_capped_separately(self, stub_validator, stub_db):
+        """Every edge type gets a typed pattern with its own per-kind LIMIT."""
+        stub_validator.validate_edge_types()
+
+        query = stub_db.execute_query.call_args[0][0]
+        for edge_type in ConservationValidator.EDGE_SCHEMA:
+            assert f"MATCH (a)-[:{edge_type}]->(b)" in query
+        assert query.count("LIMIT $limit") == len(ConservationValidator.EDGE_SCHEMA)
+
+    def test_reports_mislabelled_edge(self, validator, clean_db):
+        """The batched query finds an edge whose endpoints break the schema."""
+        clean_db.execute_query("""
+        CREATE (:Class {id: 'c1', name: 'A'})-[:HAS_PARAMETER]->(:Class {id: 'c2', name: 'B'})
+        """)
+
+        violations = validator.validate_edge_types()
+
+        assert len(violations) == 1
+        assert violations[0].entity_id == "c1"
+        assert violations[0].details["edge_type"] == "HAS_PARAMETER"
+        assert violations[0].details["to_node"] == "c2"
+
+    def test_query_failure_is_logged_as_error(self, stub_validator, stub_db, caplog):
+        """A failing batched query is reported at error level."""
+        stub_db.execute_query.side_effect = RuntimeError("syntax error")
+
+        with caplog.at_level("ERROR", logger="codegraph.validators"):
+            assert stub_validator.validate_edge_types() == []
+
+        assert "no edge types were checked" in caplog.text
+
+    def test_violation_carries_expected_labels(self, stub_validator, stub_db):
+        """Violations report the schema for the offending edge type."""
+        stub_db.execute_query.return_value = [{
+            "edge_type": "INHERITS",
+            "a": {"id": "c1"},
+            "b": {"id": "f1"},
+            "from_labels": ["Class"],
+            "to_labels": ["Function"],
+        }]
+
+        violations = stub_validator.validate_edge_types()
+
+        assert len(violations) == 1
+        assert violations[0].details["expected_to"] == ["Class"]
+        assert violations[0].entity_id == "c1"
+
+    def test_caps_are_passed_to_query(self, stub_db):
+        """Per-kind and total caps bound the rows the query may return."""
+        validator = ConservationValidator(stub_db, max_violations_per_kind=5, max_total_violations=12)
+
+        validator.validate_edge_types()
+
+        params = stub_db.execute_query.call_args[0][1]
+        assert params["limit"] == 5
+        assert params["total_limit"] == 12
+
+
+@pytest.mark.unit
+class TestTypeCompatibility:
+    """Tests for type compatibility checks."""
+
+    def test_builtin_rules(self, stub_validator):
+        """Cheap structural rules answer without the graph."""
+        assert stub_validator._types_compatible("int", "float")
+        assert stub_validator._types_compatible("None", "Optional[int]")
+        assert stub_validator._types_compatible("List[int]", "Sequence[int]")
+        assert not stub_validator._types_compatible("str", "int")
+
+    def test_subtype_hierarchy_loaded_once(self, stub_validator, stub_db):
+        """The IS_SUBTYPE_OF closure is fetched once and reused across lookups."""
+        stub_db.execute_query.return_value = [
+            {"name": "Dog", "ancestors": ["Dog", "Animal"]},
+        ]
+
+        assert stub_validator._types_compatible("Dog", "Animal")
+        assert not stub_validator._types_compatible("Dog", "Plant")
+        assert stub_validator._types_compatible("Dog", "Animal")
+        assert stub_db.execute_query.call_count == 1
+
+    def test_reset_reloads_hierarchy(self, stub_validator, stub_db):
+        """Resetting the caches makes the next lookup consult the graph again."""
+        stub_validator._types_compatible("Dog", "Animal")
+        stub_validator._reset_type_caches()
+        stub_validator._types_compatible("Dog", "Animal")
+
+        assert stub_db.execute_query.call_count == 2
+
+    def test_compatibility_tables(self, stub_validator):
+        """Pair and prefix tables cover numeric, string and container rules."""
+        assert stub_validator._types_compatible("bool", "int")
+        assert stub_validator._types_compatible("bytes", "Sequence")
+        assert stub_validator._types_compatible("Dict[str, int]", "Mapping[str, int]")
+        assert stub_validator._types_compatible("list[int]", "list[str]")
+        assert not stub_validator._types_compatible("float", "int")
+        assert not stub_validator._types_compatible("complex", "float")
+
+    def test_priming_loads_only_needed_types(self, stub_validator, stub_db):
+        """Primed pairs query the hierarchy for their subtypes only."""
+        stub_db.execute_query.return_value = [
+            {"name": "Dog", "ancestors": ["Dog", "Animal"]},
+        ]
+
+        stub_validator._prime_type_compatibility({("Dog", "Animal"), ("Cat", "Animal"), ("int", "float")})
+
+        query, parameters = stub_db.execute_query.call_args[0]
+        assert parameters == {"names": ["Cat", "Dog", "int"]}
+        assert stub_validator._types_compatible("Dog", "Animal")
+        assert not stub_validator._types_compatible("Cat", "Animal")
+        assert stub_db.execute_query.call_count == 1
+        # Unprimed lookups still see the full hierarchy
+        assert stub_validator._subtype_closure is None
+
+
+@pytest.mark.unit
+class TestCodeSnippets:
+    """Tests for code snippet extraction."""
+
+    def test_snippet_marks_target_line(self, stub_validator, write_temp_file):
+        """The requested line is marked and surrounded by context."""
+        path = write_temp_file("a = 1\nb = 2\nc = 3\nd = 4\ne = 5\n")
+
+        snippet = stub_validator._get_code_snippet(str(path), 3)
+
+        assert snippet.splitlines() == [
+            "       1 | a = 1",
+            "       2 | b = 2",
+            ">>>    3 | c = 3",
+            "       4 | d = 4",
+            "       5 | e = 5",
+        ]
+
+    def test_missing_file_returns_none(self, stub_validator, temp_dir):
+        """Unreadable files yield no snippet."""
+        assert stub_validator._get_code_snippet(str(temp_dir / "missing.py"), 1) is None
+
+
+@pytest.mark.unit
+class TestBuildReport:
+    """Tests for report aggregation."""
+
+    def test_counts_by_severity_and_type(self, stub_validator):
+        """Severity totals, per-type counts and law summary are consistent."""
+        violations = [
+            Violation(ViolationType.SIGNATURE_MISMATCH, "error", "a", "m", {}),
+            Violation(ViolationType.SIGNATURE_MISMATCH, "warning", "b", "m", {}),
+            Violation(ViolationType.STRUCTURAL_INVALID, "error", "c", "m", {}),
+        ]
+
+        report = stub_validator._build_report(violations)
+
+        assert report["total_violations"] == 3
+        assert report["errors"] == 2
+        assert report["warnings"] == 1
+        assert report["by_type"] == {"signature_mismatch": 2, "structural_invalid": 1}
+        assert report["summary"] == {
+            "signature_conservation": 2,
+            "reference_integrity": 0,
+            "data_flow_consistency": 0,
+            "structural_integrity": 1,
+        }
+
+
+@pytest.mark.unit
+class TestPyrightValidation:
+    """Tests for converting pyright diagnostics into violations."""
+
+    @pytest.fixture(autouse=True)
+    def cli_only(self, monkeypatch):
+        """Exercise the one-shot CLI path regardless of local installs."""
+        from codegraph.pyright_lsp import PyrightLanguageServer
+        monkeypatch.setattr(PyrightLanguageServer, "is_available", staticmethod(lambda: False))
+
+    def test_parses_byte_output(self, stub_validator, write_temp_file, monkeypatch):
+        """pyright's JSON is parsed from raw bytes with snippets attached."""
+        import json
+        import subprocess
+        from types import SimpleNamespace
+
+        path = write_temp_file("x: int = 'a'\n")
+        payload = {
+            "generalDiagnostics": [
+                {
+                    "file": str(path),
+                    "severity": "error",
+                    "message": "bad assignment",
+                    "rule": "reportAssignmentType",
+                    "range": {"start": {"line": 0, "character": 9}},
+                },
+                {"file": str(path), "severity": "information", "message": "ignored"},
+            ]
+        }
+        monkeypatch.setattr(
+            subprocess, "run",
+            lambda *args, **kwargs: SimpleNamespace(stdout=json.dumps(payload).encode("utf-8")),
+        )
+
+        violations = stub_validator.validate_typing_with_pyright(files=[str(path)])
+
+        assert len(violations) == 1
+        assert violations[0].line_number == 1
+        assert violations[0].message == "[reportAssignmentType] bad assignment"
+        assert ">>>    1 | x: int = 'a'" in violations[0].code_snippet
+
+    def test_invalid_output_yields_no_violations(self, stub_validator, monkeypatch):
+        """Non-JSON output is logged and ignored."""
+        import subprocess
+        from types import SimpleNamespace
+
+        monkeypatch.setattr(
+            subprocess, "run",
+            lambda *args, **kwargs: SimpleNamespace(stdout=b"\xff not json"),
+        )
+
+        assert stub_validator.validate_typing_with_pyright(files=["a.py"]) == []
+
+    def test_language_server_failure_falls_back_to_cli(self, stub_validator, monkeypatch):
+        """A failing language server is shut down and the CLI is used instead."""
+        import subprocess
+        from types import SimpleNamespace
+        from codegraph.pyright_lsp import PyrightLanguageServer
+
+        def fail(self, files, timeout=120.0):
+            raise TimeoutError("no diagnostics")
+
+        monkeypatch.setattr(PyrightLanguageServer, "is_available", staticmethod(lambda: True))
+        monkeypatch.setattr(PyrightLanguageServer, "check_files", fail)
+        monkeypatch.setattr(
+            subprocess, "run",
+            lambda *args, **kwargs: SimpleNamespace(stdout=b'{"generalDiagnostics": []}'),
+        )
+
+        assert stub_validator.validate_typing_with_pyright(files=["a.py"]) == []
+        assert stub_validator._pyright_server is None
+
+
+@pytest.mark.unit
+class TestCollectLawViolations:
+    """Tests for gathering violations per conservation law."""
+
+    def test_groups_results_by_law(self, stub_validator, monkeypatch):
+        """Each law family's violations are returned under its own key, in order."""
+        structural = [Violation(ViolationType.STRUCTURAL_INVALID, "error", "s", "m", {})]
+        reference = [Violation(ViolationType.REFERENCE_BROKEN, "error", "r", "m", {})]
+        monkeypatch.setattr(stub_validator, "run_structural_checks", lambda: structural)
+        monkeypatch.setattr(stub_validator, "run_reference_checks", lambda: reference)
+        monkeypatch.setattr(stub_validator, "run_typing_checks", lambda include_pyright=False: [])
+
+        law_map = stub_validator._collect_law_violations()
+
+        assert list(law_map) == ["structural", "reference", "typing"]
+        assert law_map["structural"] == structural
+        assert law_map["reference"] == reference
+        assert law_map["typing"] == []
+
+
+@pytest.mark.unit
+class TestVariableTypeCompatibility:
+    """Tests for variable declared/assigned type checks."""
+
+    def test_only_incompatible_candidates_reported(self, stub_validator, stub_db):
+        """Candidates compatible with the declared type are not violations."""
+        rows = [
+            {"v": {"id": "v1", "name": "x"}, "declared_type": "float", "candidate_types": ["int", "str"]},
+            {"v": {"id": "v2", "name": "y"}, "declared_type": "", "candidate_types": ["str", "int"]},
+        ]
+        stub_db.execute_query.side_effect = [[{"count": 2}], rows, []]
+
+        violations = stub_validator._check_variable_type_compatibility()
+
+        assert [(v.entity_id, v.severity) for v in violations] == [("v1", "error"), ("v2", "warning")]
+        assert violations[0].details["assigned_type"] == "str"
+        assert violations[1].details["assigned_types"] == ["int", "str"]
+
+
+@pytest.mark.unit
+class TestSubtypeRelationships:
+    """Tests for IS_SUBTYPE_OF hierarchy checks."""
+
+    def test_checks_issued_together(self, stub_validator, stub_db):
+        """Cycle and kind checks are dispatched as one concurrent batch."""
+        stub_db.execute_query.side_effect = [
+            [{"child": {"id": "t1", "name": "A"}, "parent": {"id": "t3", "name": "B"}},
+             {"child": {"id": "t3", "name": "B"}, "parent": {"id": "t1", "name": "A"}}],
+            [{"child": {"id": "t2", "name": "C", "kind": "protocol"},
+              "parent": {"name": "D", "kind": "builtin"}}],
+        ]
+
+        violations = stub_validator._check_subtype_relationships()
+
+        assert stub_db.execute_queries.call_count == 1
+        assert [(v.entity_id, v.severity) for v in violations] == [("t1", "error"), ("t2", "warning")]
+
+
+@pytest.mark.unit
+class TestSerializeReport:
+    """Tests for JSON-friendly report serialization."""
+
+    def test_law_reports_share_serialized_violations(self, stub_validator, monkeypatch):
+        """Each violation is serialized once for the overall and per-law reports."""
+        violation = Violation(ViolationType.STRUCTURAL_INVALID, "error", "s", "m", {})
+        monkeypatch.setattr(
+            stub_validator, "_collect_law_violations",
+            lambda include_pyright=False: {"structural": [violation], "reference": [], "typing": []},
+        )
+        calls = []
+        original = stub_validator._serialize_violation
+        monkeypatch.setattr(
+            stub_validator, "_serialize_violation",
+            lambda v: calls.append(v) or original(v),
+        )
+
+        report = stub_validator.validate()
+
+        assert len(calls) == 1
+        assert report["violations"][0] is report["laws"]["structural"]["violations"][0]
+        assert report["violations"][0]["violation_type"] == "structural_invalid"
+
+    def test_rerun_reflects_updated_violation_fields(self, stub_validator, monkeypatch):
+        """Each run re-serializes, so changed snippets and fixes are reported."""
+        fields = {"code_snippet": "old line", "suggested_fix": "rename foo"}
+        monkeypatch.setattr(
+            stub_validator, "_collect_law_violations",
+            lambda include_pyright=False: {
+                "structural": [Violation(ViolationType.STRUCTURAL_INVALID, "error", "s", "m", {}, **fields)]
+            },
+        )
+
+        first = stub_validator.validate()["violations"][0]
+        assert first["code_snippet"] == "old line"
+
+        fields.update(code_snippet="new line", suggested_fix="rename bar")
+        report = stub_validator.validate()
+        assert report["violations"][0]["code_snippet"] == "new line"
+        assert report["violations"][0]["suggested_fix"] == "rename bar"
+        assert stub_validator.get_last_report() is report
+
+
+def frontier_record(kind, **row):
+    """Build one tagged row of the changed-frontier query."""
+    return {"kind": kind, "row": row}
+
+
+@pytest.mark.unit
+class TestChangedFrontier:
+    """Tests for incremental checks over the materialized changed subgraph."""
+
+    @staticmethod
+    def frontier_records():
+        """Tagged rows covering every table of the frontier."""
+        add = {"id": "f1", "name": "add", "qualified_name": "m.add", "changed": True}
+        a = {"id": "p1", "name": "a", "type_annotation": "int"}
+        b = {"id": "p2", "name": "b", "default_value": "1"}
+        call = {"id": "cs1", "name": "add", "arg_count": 3, "location": "m.py:5:4",
+                "arg_types": ["str"], "changed": True, "resolution_status": "resolved"}
+        return [
+            frontier_record(
+                "function",
+                f=add,
+                params=[
+                    {"param": a, "position": 0, "type": {"name": "int"}},
+                    {"param": b, "position": 1, "type": None},
+                ],
+                required_params=1,
+                total_params=2,
+                arity_mismatches=[{"callsite": call, "caller_qualified_name": "m.main"}],
+                typed_callsites=[call],
+            ),
+            frontier_record(
+                "callsite",
+                cs={"id": "cs2", "name": "gone", "resolution_status": "unresolved",
+                    "unresolved_callee": "gone"},
+                target_count=0,
+            ),
+            frontier_record("parameter", p={"id": "p3", "name": "orphan"}, func_count=0),
+            frontier_record("inheritance_edge",
+                            source={"id": "c1", "qualified_name": "m.A", "changed": True},
+                            target={"id": "c2", "qualified_name": "m.B"}),
+            frontier_record("inheritance_edge",
+                            source={"id": "c2", "qualified_name": "m.B"},
+                            target={"id": "c1", "qualified_name": "m.A", "changed": True}),
+            frontier_record("subtype_edge",
+                            source={"id": "t2", "name": "U"},
+                            target={"id": "t1", "name": "T", "changed": True}),
+            frontier_record("subtype_edge",
+                            source={"id": "t1", "name": "T", "changed": True},
+                            target={"id": "t2", "name": "U"}),
+        ]
+
+    def test_checks_share_one_frontier(self, stub_validator, stub_db):
+        """An incremental pass fetches the whole frontier in one query."""
+        stub_db.execute_query.side_effect = [self.frontier_records(), []]
+
+        violations = stub_validator.validate_incremental()
+
+        # The frontier query plus the subtype closure used for type compatibility
+        assert stub_db.execute_query.call_count == 2
+        assert stub_validator._changed_frontier is None
+        assert sorted((v.violation_type.value, v.entity_id) for v in violations) == [
+            ("data_flow_invalid", "cs1"),
+            ("data_flow_invalid", "f1"),
+            ("data_flow_invalid", "p2"),
+            ("data_flow_invalid", "t1"),
+            ("reference_broken", "cs2"),
+            ("signature_mismatch", "f1"),
+            ("structural_invalid", "m.A"),
+            ("structural_invalid", "p3"),
+        ]
+
+    def test_source_files_read_once_per_pass(self, stub_validator, stub_db, write_temp_file, monkeypatch):
+        """Snippets for violations in the same file share one read of it."""
+        path = write_temp_file("a()\nb()\n")
+        stub_db.execute_query.return_value = [
+            frontier_record(
+                "callsite",
+                cs={"id": f"cs{line}", "name": "gone", "resolution_status": "unresolved",
+                    "location": f"{path}:{line}:0", "changed": True},
+                target_count=0,
+            )
+            for line in (1, 2)
+        ]
+        reads = []
+        original = stub_validator._read_source_lines
+        monkeypatch.setattr(
+            stub_validator, "_read_source_lines",
+            lambda file_path: reads.append(file_path) or original(file_path),
+        )
+
+        violations = stub_validator.validate_incremental()
+
+        assert reads == [str(path)]
+        assert [v.line_number for v in violations] == [1, 2]
+        assert ">>>    2 | b()" in violations[1].code_snippet
+        assert stub_validator._source_line_cache is None
+
+    def test_parameter_position_gaps(self, stub_validator, stub_db):
+        """Only functions whose ordered positions skip or repeat a slot are reported."""
+        def function(func_id, positions):
+            return frontier_record(
+                "function",
+                f={"id": func_id, "name": func_id, "qualified_name": f"m.{func_id}", "changed": True,
+                   "return_type": "int"},
+                params=[{"param": {"id": f"{func_id}p{i}", "type_annotation": "int"}, "position": pos, "type": None}
+                        for i, pos in enumerate(positions)],
+                required_params=0, total_params=0, arity_mismatches=[], typed_callsites=[],
+            )
+
+        stub_db.execute_query.return_value = [
+            function("ok", [0, 1, None]),
+            function("gap", [0, 2]),
+            function("dup", [0, 0]),
+        ]
+
+        violations = stub_validator.validate_structural_integrity_incremental()
+
+        assert [(v.entity_id, v.details["positions"]) for v in violations] == [
+            ("gap", [0, 2]),
+            ("dup", [0, 0]),
+        ]
+
+    def test_pyright_overlaps_graph_checks(self, stub_validator, stub_db, monkeypatch):
+        """pyright is started before the graph checks run, and its results come last."""
+        started = threading.Event()
+
+        def pyright():
+            started.set()
+            return [Violation(ViolationType.DATA_FLOW_INVALID, "error", "py", "m", {})]
+
+        def structural():
+            assert started.wait(5), "pyright should run alongside the graph checks"
+            return [Violation(ViolationType.STRUCTURAL_INVALID, "error", "s", "m", {})]
+
+        monkeypatch.setattr(stub_validator, "validate_typing_with_pyright", pyright)
+        monkeypatch.setattr(stub_validator, "validate_structural_integrity_incremental", structural)
+        monkeypatch.setattr(stub_validator, "validate_reference_integrity_incremental", lambda: [])
+        monkeypatch.setattr(stub_validator, "validate_signature_conservation_incremental", lambda: [])
+        monkeypatch.setattr(stub_validator, "validate_data_flow_consistency_incremental", lambda: [])
+        stub_db.execute_query.return_value = self.frontier_records()
+
+        violations = stub_validator.validate_incremental(include_pyright=True)
+
+        assert [v.entity_id for v in violations] == ["s", "py"]
+
+    def test_matching_argument_types_skip_hierarchy(self, stub_validator, stub_db):
+        """Identical or primitive-compatible argument types never load the subtype hierarchy."""
+        call = {"id": "cs1", "name": "add", "arg_types": ["int", "bool"], "changed": True}
+        stub_db.execute_query.return_value = [
+            frontier_record(
+                "function",
+                f={"id": "f1", "name": "add", "qualified_name": "m.add", "return_type": "int"},
+                params=[
+                    {"param": {"id": "p1", "name": "a", "type_annotation": "int"}, "position": 0,
+                     "type": {"name": "int"}},
+                    {"param": {"id": "p2", "name": "b", "type_annotation": "float"}, "position": 1,
+                     "type": {"name": "float"}},
+                ],
+                required_params=2, total_params=2, arity_mismatches=[], typed_callsites=[call],
+            ),
+        ]
+
+        assert stub_validator.validate_data_flow_consistency_incremental() == []
+        assert stub_db.execute_query.call_count == 1
+
+    def test_type_names_are_interned(self, stub_validator, stub_db):
+        """Type names from different rows share one string object."""
+        def name():
+            # Built at runtime so each call returns a distinct object
+            return "".join(["My", "Type"])
+
+        param = {"id": "p1", "name": "a", "type_annotation": name()}
+        stub_db.execute_query.return_value = [
+            frontier_record(
+                "function",
+                f={"id": "f1", "name": "f", "qualified_name": "m.f"},
+                params=[{"param": param, "position": 0, "type": {"name": name()}}],
+                required_params=1, total_params=1, arity_mismatches=[],
+                typed_callsites=[{"id": "cs1", "arg_types": [name()]}],
+            ),
+        ]
+
+        frontier = stub_validator._materialize_changed_frontier()
+
+        interned = sys.intern(name())
+        assert frontier.typed_callsites_by_func["f1"][0]["arg_types"][0] is interned
+        assert frontier.params_by_func["f1"][0]["type"]["name"] is interned
+        assert param["type_annotation"] is interned
+
+    def test_empty_frontier_skips_checks(self, stub_validator, stub_db, monkeypatch):
+        """With nothing changed, only the frontier query runs."""
+        def fail():
+            raise AssertionError("check should be skipped")
+
+        for name in ("validate_structural_integrity_incremental",
+                     "validate_reference_integrity_incremental",
+                     "validate_signature_conservation_incremental",
+                     "validate_data_flow_consistency_incremental"):
+            monkeypatch.setattr(stub_validator, name, fail)
+
+        assert stub_validator.validate_incremental() == []
+        assert stub_db.execute_query.call_count == 1
+
+    def test_data_flow_skipped_without_functions_or_types(self, stub_validator, stub_db):
+        """A change set of call sites only does not touch the type caches."""
+        stub_db.execute_query.return_value = [
+            frontier_record("callsite", cs={"id": "cs1", "resolution_status": "resolved"}, target_count=1),
+        ]
+        stub_validator._compat_cache[("a", "b")] = True
+
+        assert stub_validator.validate_data_flow_consistency_incremental() == []
+        assert stub_validator._compat_cache == {("a", "b"): True}
+
+    def test_incremental_report_counts(self, stub_validator, stub_db, monkeypatch):
+        """The incremental report counts severities and types from the buffer."""
+        monkeypatch.setattr(stub_validator, "_materialize_changed_frontier",
+                            lambda: ChangedFrontier(functions={"s": {"id": "s"}}))
+        monkeypatch.setattr(stub_validator, "validate_structural_integrity_incremental", lambda: [
+            Violation(ViolationType.STRUCTURAL_INVALID, "error", "s", "m", {}),
+        ])
+        monkeypatch.setattr(stub_validator, "validate_reference_integrity_incremental", lambda: [])
+        monkeypatch.setattr(stub_validator, "validate_signature_conservation_incremental", lambda: [])
+        monkeypatch.setattr(stub_validator, "validate_data_flow_consistency_incremental", lambda: [
+            Violation(ViolationType.DATA_FLOW_INVALID, "warning", "d1", "m", {}),
+            Violation(ViolationType.DATA_FLOW_INVALID, "error", "d2", "m", {}),
+        ])
+        stub_db.get_changed_node_ids.return_value = ["s", "d1"]
+
+        report = stub_validator.get_incremental_validation_report()
+
+        assert report["total_violations"] == 3
+        assert (report["errors"], report["warnings"]) == (2, 1)
+        assert report["changed_nodes"] == 2
+        assert report["by_type"] == {"structural_invalid": 1, "data_flow_invalid": 2}
+        assert report["summary"]["data_flow_consistency"] == 2
+        assert report["summary"]["reference_integrity"] == 0
+        assert [v.entity_id for v in report["violations"]] == ["s", "d1", "d2"]
+
+
+@pytest.mark.unit
+class TestSignatureConservationIncremental:
+    """Tests for incremental signature checks on changed functions."""
+
+    def test_reports_calls_filtered_by_cypher(self, stub_validator, stub_db):
+        """Out-of-range calls returned by the frontier query become violations."""
+        call = {"id": "cs1", "arg_count": 3, "location": "m.py:5:4"}
+        stub_db.execute_query.return_value = [
+            frontier_record(
+                "function",
+                f={"id": "f1", "name": "add", "qualified_name": "m.add", "changed": True},
+                params=[],
+                required_params=1,
+                total_params=2,
+                arity_mismatches=[{"callsite": call, "caller_qualified_name": "m.main"}],
+                typed_callsites=[],
+            ),
+            frontier_record(
+                "function",
+                f={"id": "f2", "name": "noop", "qualified_name": "m.noop"},
+                params=[],
+                required_params=0,
+                total_params=0,
+                arity_mismatches=[],
+                typed_callsites=[],
+            ),
+        ]
+
+        violations = stub_validator.validate_signature_conservation_incremental()
+
+        assert len(violations) == 1
+        assert violations[0].message == "Function add expects 1-2 arguments but is called with 3"
+        assert violations[0].details["caller"] == "m.main"
+        assert violations[0].new_value == 2
+
+
+@pytest.mark.unit
+class TestSignatureConservationRows:
+    """Tests for the full signature check over paged function rows."""
+
+    def test_private_and_arity_checks_from_one_row(self, stub_validator, stub_db):
+        """Parameters and callers come with each function row, without extra lookups."""
+        main = {"id": "f2", "name": "main", "qualified_name": "other.main"}
+        stub_db.execute_query.side_effect = [
+            [{"count": 1}],
+            [{
+                "f": {"id": "f1", "name": "_add", "qualified_name": "m._add", "visibility": "private"},
+                "required_params": 1,
+                "total_params": 1,
+                "callers": [{"caller": main, "arg_count": 2, "location": None}],
+            }],
+        ]
+
+        violations = stub_validator.validate_signature_conservation()
+
+        assert stub_db.execute_query.call_count == 2
+        assert [(v.severity, v.details["caller"]) for v in violations] == [
+            ("error", "other.main"),
+            ("warning", "other.main"),
+        ]